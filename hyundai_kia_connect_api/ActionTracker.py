@@ -0,0 +1,169 @@
+"""ActionTracker.py"""
+
+# pylint:disable=logging-fstring-interpolation,invalid-name,broad-exception-caught
+
+import logging
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from .const import DOMAIN, ORDER_STATUS
+
+if TYPE_CHECKING:
+    from .VehicleManager import VehicleManager
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass
+class _PendingAction:
+    future: Future
+    deadline: float
+    callbacks: list[Callable[[ORDER_STATUS], None]] = field(default_factory=list)
+
+
+class ActionTracker:
+    """Waits for many sent actions across the vehicles of one VehicleManager.
+
+    Each tick polls every vehicle with pending actions once, through
+    ``ApiImpl.check_action_statuses``, and resolves all of that vehicle's
+    actions from the one response. ``track`` returns a Future resolving to
+    the final ORDER_STATUS; actions still pending after ``timeout`` seconds
+    resolve to ORDER_STATUS.TIMEOUT. A failed poll is logged and retried on
+    the next tick.
+
+    Ticks run on a background thread started by the first ``track`` call;
+    ``poll`` runs one tick directly.
+    """
+
+    def __init__(
+        self,
+        manager: "VehicleManager",
+        poll_interval: float | None = None,
+        timeout: float = 120,
+    ) -> None:
+        self.manager = manager
+        self.poll_interval = (
+            poll_interval or manager.api.action_status_poll_interval or 5
+        )
+        self.timeout = timeout
+        self._pending: dict[str, dict[str, _PendingAction]] = {}
+        self._condition = threading.Condition()
+        self._thread: threading.Thread | None = None
+        self._closed = False
+
+    @property
+    def pending(self) -> int:
+        with self._condition:
+            return sum(len(actions) for actions in self._pending.values())
+
+    def track(
+        self,
+        vehicle_id: str,
+        action_id: str,
+        callback: Callable[[ORDER_STATUS], None] | None = None,
+    ) -> Future:
+        """Track ``action_id``; ``callback`` is called with its final status.
+
+        Tracking an action that is already pending returns its existing
+        Future and adds ``callback`` to the ones it calls.
+        """
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("ActionTracker is shut down")
+            actions = self._pending.setdefault(vehicle_id, {})
+            if action_id in actions:
+                pending = actions[action_id]
+                if callback is not None:
+                    pending.callbacks.append(callback)
+                return pending.future
+            pending = _PendingAction(Future(), time.monotonic() + self.timeout)
+            if callback is not None:
+                pending.callbacks.append(callback)
+            actions[action_id] = pending
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name=f"{DOMAIN}-action-tracker", daemon=True
+                )
+                self._thread.start()
+            self._condition.notify()
+        return pending.future
+
+    def poll(self) -> None:
+        """Poll each vehicle with pending actions once and resolve what is final."""
+        with self._condition:
+            snapshot = {
+                vehicle_id: list(actions)
+                for vehicle_id, actions in self._pending.items()
+                if actions
+            }
+        for vehicle_id, action_ids in snapshot.items():
+            try:
+                statuses = self.manager.api.check_action_statuses(
+                    self.manager.token,
+                    self.manager.get_vehicle(vehicle_id),
+                    action_ids,
+                )
+            except Exception as err:
+                _LOGGER.warning(
+                    f"{DOMAIN} - Action status poll for vehicle {vehicle_id} "
+                    f"failed: {err!r}"
+                )
+                statuses = {}
+            self._resolve(vehicle_id, statuses)
+
+    def shutdown(self, cancel_pending: bool = True) -> None:
+        """Stop polling; pending actions are cancelled unless told otherwise."""
+        with self._condition:
+            self._closed = True
+            pending, self._pending = self._pending, {}
+            self._condition.notify_all()
+            thread = self._thread
+        if cancel_pending:
+            for actions in pending.values():
+                for action in actions.values():
+                    action.future.cancel()
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+
+    def _resolve(self, vehicle_id: str, statuses: dict[str, ORDER_STATUS]) -> None:
+        now = time.monotonic()
+        finished = []
+        with self._condition:
+            actions = self._pending.get(vehicle_id, {})
+            for action_id, action in list(actions.items()):
+                status = statuses.get(action_id, ORDER_STATUS.PENDING)
+                if status == ORDER_STATUS.PENDING:
+                    if action.deadline > now and not action.future.cancelled():
+                        continue
+                    status = ORDER_STATUS.TIMEOUT
+                del actions[action_id]
+                finished.append((action, status))
+            if not actions:
+                self._pending.pop(vehicle_id, None)
+        for action, status in finished:
+            if not action.future.set_running_or_notify_cancel():
+                continue
+            action.future.set_result(status)
+            for callback in action.callbacks:
+                try:
+                    callback(status)
+                except Exception as err:
+                    _LOGGER.warning(f"{DOMAIN} - Action callback failed: {err!r}")
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while not self._closed and not self._pending:
+                    self._condition.wait()
+                # Actions tracked meanwhile join this tick rather than
+                # triggering polls of their own.
+                due = time.monotonic() + self.poll_interval
+                while not self._closed and (remaining := due - time.monotonic()) > 0:
+                    self._condition.wait(remaining)
+                if self._closed:
+                    return
+            self.poll()
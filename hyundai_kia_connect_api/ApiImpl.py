@@ -1,9 +1,17 @@
 """ApiImpl.py"""
 
 # pylint:disable=unnecessary-pass,missing-class-docstring,invalid-name,missing-function-docstring,wildcard-import,unused-wildcard-import,unused-argument,logging-fstring-interpolation
+import contextlib
 import datetime as dt
+import hashlib
+import json
 import logging
+import threading
+import time
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
+from typing import Any
 
 import requests
 from requests.exceptions import JSONDecodeError
@@ -13,6 +21,7 @@ try:
 except ImportError:
     GoogleV3 = None
 
+from .cache import GeocodeCache, ResponseCache
 from .const import (
     CHARGE_PORT_ACTION,
     DOMAIN,
@@ -27,7 +36,7 @@ from .const import (
 )
 from .Token import Token
 from .utils import get_child_value, to_int_enum
-from .Vehicle import Vehicle
+from .Vehicle import DayTripInfo, MonthTripInfo, Vehicle
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -130,6 +139,22 @@ class POIInfo:
         }
 
 
+@dataclass
+class ForceRefreshPolling:
+    """Polling schedule for a force refresh that waits for fresh data.
+
+    After waking the car, the cached snapshot is re-read after
+    ``initial_delay`` seconds, then at intervals growing by ``backoff`` up to
+    ``max_delay``, until its timestamp moves past the pre-wake baseline or
+    ``timeout`` seconds have passed since the wake.
+    """
+
+    initial_delay: float = 5
+    backoff: float = 1.5
+    max_delay: float = 15
+    timeout: float = 90
+
+
 class ApiImplSession(requests.Session):
     """Shared HTTP session with default timeout and connection pooling.
 
@@ -157,17 +182,170 @@ class ApiImplSession(requests.Session):
             raise RequestTimeoutError(str(exc)) from exc
 
 
+class _DeferredCall:
+    """Future-like wrapper that runs ``fn`` on the first ``result()`` call.
+
+    Used by ApiImpl._run_parallel when parallel requests are disabled so the
+    requests keep their historical order (and are skipped entirely when an
+    earlier result raises before a later one is read).
+    """
+
+    def __init__(self, fn: Callable[[], Any]) -> None:
+        self._fn = fn
+        self._future: Future | None = None
+
+    def result(self) -> Any:
+        if self._future is None:
+            self._future = Future()
+            try:
+                self._future.set_result(self._fn())
+            except Exception as exc:
+                self._future.set_exception(exc)
+        return self._future.result()
+
+    def cancel(self) -> bool:
+        """Never run ``fn``; False if it already ran."""
+        if self._future is None:
+            self._future = Future()
+            self._future.cancel()
+        return self._future.cancelled()
+
+
 class ApiImpl:
     data_timezone = dt.UTC
     temperature_range = None
-    previous_latitude: float = None
-    previous_longitude: float = None
+    # Shared by every vehicle and account unless VehicleManager is given its
+    # own (e.g. persisted) cache.
+    geocode_cache: GeocodeCache = GeocodeCache()
     supports_window_control: bool = False
     supports_valet_mode: bool = False
+    # Vehicle keys are only valid within the session that listed the vehicles
+    # (see refresh_vehicles), so a stored vehicle roster must be re-listed
+    # after a login before it is used.
+    vehicle_keys_per_session: bool = False
+    # Upper bound on HTTP requests a single update may have in flight at once.
+    # 1 keeps every request sequential, in the historical order.
+    max_parallel_requests: int = 1
+    # Seconds between polls when waiting for an action to settle. None means
+    # check_action_status has no reusable single-shot poll and callers must use
+    # its own synchronous mode.
+    action_status_poll_interval: float | None = None
+    # Seconds after which the drive history of a car that has not moved is
+    # read again, see _driving_info_due.
+    driving_info_max_age: float = 6 * 3600
+    # Optional TTL cache for slow-changing reads, see _cached_response.
+    response_cache: ResponseCache | None = None
+    # Called with the token after the API changed it in place (a re-registered
+    # device id); VehicleManager uses it to store and announce the change.
+    token_updated: Callable[[Token], None] | None = None
+    _executor: ThreadPoolExecutor | None = None
+    _executor_lock = threading.Lock()
 
     def __init__(self) -> None:
         """Initialize."""
 
+    def _cached_response(
+        self,
+        endpoint: str,
+        vehicle: Vehicle,
+        fetch: Callable[[], Any],
+        max_age: float | None = None,
+    ) -> Any:
+        """Return ``fetch()``, reused from response_cache while it is fresh."""
+        if self.response_cache is None:
+            return fetch()
+        return self.response_cache.get_or_fetch(endpoint, vehicle.id, fetch, max_age)
+
+    def _apply_state(
+        self,
+        vehicle: Vehicle,
+        state: dict,
+        update: Callable[[Vehicle, dict], None],
+    ) -> bool:
+        """Run ``update(vehicle, state)`` unless ``state`` was the last one applied.
+
+        Polls of the server cache mostly return the snapshot of the previous
+        poll; comparing a hash of the raw state skips mapping it again.
+        Returns whether the state was applied.
+        """
+        fingerprint = hashlib.blake2b(
+            json.dumps(state, sort_keys=True, default=str).encode(), digest_size=16
+        ).digest()
+        if fingerprint == vehicle._state_fingerprint:
+            _LOGGER.debug(f"{DOMAIN} - Vehicle state unchanged, skipping update")
+            return False
+        update(vehicle, state)
+        vehicle._state_fingerprint = fingerprint
+        return True
+
+    def _driving_info_due(self, vehicle: Vehicle) -> bool:
+        """Whether the drive history may have changed since it was last read.
+
+        It only changes once the car has driven (the odometer advanced) or a
+        new day has begun where the car is, so cached updates of a parked car
+        keep the previous drive history until ``driving_info_max_age`` passed.
+        """
+        if vehicle._driving_info_stamp is None:
+            return True
+        odometer, day, read_at = vehicle._driving_info_stamp
+        return (
+            vehicle.odometer != odometer
+            or dt.datetime.now(vehicle.timezone).date() != day
+            or time.monotonic() - read_at > self.driving_info_max_age
+        )
+
+    def _driving_info_read(self, vehicle: Vehicle) -> None:
+        """Record that the drive history was read for the current odometer."""
+        vehicle._driving_info_stamp = (
+            vehicle.odometer,
+            dt.datetime.now(vehicle.timezone).date(),
+            time.monotonic(),
+        )
+
+    def _run_parallel(self, *calls: Callable[[], Any]) -> list[Future | _DeferredCall]:
+        """Start independent request callables, returning one future per call.
+
+        With ``max_parallel_requests`` > 1 the calls are submitted to a thread
+        pool owned by this instance. Otherwise each call runs lazily when its
+        ``result()`` is first read, which preserves the sequential behaviour
+        as long as callers read results in request order.
+        """
+        if self.max_parallel_requests <= 1:
+            return [_DeferredCall(call) for call in calls]
+        if self._executor is None:
+            with self._executor_lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.max_parallel_requests,
+                        thread_name_prefix=f"{DOMAIN}-request",
+                    )
+        return [self._executor.submit(call) for call in calls]
+
+    @contextlib.contextmanager
+    def _parallel_requests(
+        self, *calls: Callable[[], Any]
+    ) -> Iterator[list[Future | _DeferredCall]]:
+        """_run_parallel for a block that reads the results.
+
+        Should the block fail (say the status request raised), requests that
+        have not started yet are cancelled instead of being sent anyway. Any
+        futures the block appends to the list are covered too.
+        """
+        futures = self._run_parallel(*calls)
+        try:
+            yield futures
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
+
+    def close(self) -> None:
+        """Stop the request thread pool, if one was started."""
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
     def login(
         self,
         username: str,
@@ -214,6 +392,12 @@ class ApiImpl:
         Use any dummy request to test if token is still valid"""
         return True
 
+    def refresh_control_token(self, token: Token) -> bool:
+        """Renew the cached PIN control token ahead of its expiry.
+        Returns True if a new control token was stored on ``token``;
+        regions without a cached control token do nothing"""
+        return False
+
     def check_action_status(
         self,
         token: Token,
@@ -224,12 +408,66 @@ class ApiImpl:
     ) -> ORDER_STATUS:
         pass
 
+    def check_action_statuses(
+        self, token: Token, vehicle: Vehicle, action_ids: list[str]
+    ) -> dict[str, ORDER_STATUS]:
+        """Current status of several actions sent to one vehicle.
+        Regions whose status endpoint lists all recent actions override this
+        to resolve every id from a single request"""
+        return {
+            action_id: self.check_action_status(token, vehicle, action_id)
+            for action_id in action_ids
+        }
+
     def force_refresh_vehicle_state(self, token: Token, vehicle: Vehicle) -> None:
         """Triggers the system to contact the car and get fresh data"""
         raise NotImplementedError(
             "force_refresh_vehicle_state is not implemented for this region"
         )
 
+    def force_refresh_vehicle_state_steps(
+        self,
+        token: Token,
+        vehicle: Vehicle,
+        polling: ForceRefreshPolling | None = None,
+    ) -> Iterator[float]:
+        """Force refresh as blocking steps separated by waits.
+
+        Each yielded value is the number of seconds to wait before resuming the
+        generator: the blocking API sleeps, AsyncVehicleManager awaits and
+        ForceRefreshScheduler re-queues it. Regions that wake the car and then
+        wait honour ``polling`` instead of their fixed delay. Regions whose force
+        refresh does not wait run it as one step.
+        """
+        self.force_refresh_vehicle_state(token, vehicle)
+        yield from ()
+
+    def _poll_for_fresh_state(
+        self,
+        polling: ForceRefreshPolling,
+        wake: Callable[[], Any],
+        read_latest: Callable[[], Any],
+        timestamp_of: Callable[[Any], Any],
+    ) -> Iterator[float]:
+        """Wake the car, then poll the cached snapshot until it moves on.
+
+        Returns ``(latest, fresh)`` from the generator: the last snapshot read
+        and whether its timestamp differs from the one read before the wake.
+        """
+        baseline = timestamp_of(read_latest())
+        wake()
+        deadline = time.monotonic() + polling.timeout
+        delay = polling.initial_delay
+        while True:
+            yield delay
+            latest = read_latest()
+            if timestamp_of(latest) != baseline:
+                return latest, True
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return latest, False
+            delay = min(delay * polling.backoff, polling.max_delay, remaining)
+
     def update_geocoded_location(
         self,
         token: Token,
@@ -239,12 +477,11 @@ class ApiImpl:
         API_KEY: str | None = None,
     ) -> None:
         if vehicle.location_latitude and vehicle.location_longitude:
-            if (
-                vehicle.geocode
-                and vehicle.location_latitude == self.previous_latitude
-                and vehicle.location_longitude == self.previous_longitude
-            ):  # previous coordinates are the same, so keep last valid vehicle.geocode
-                _LOGGER.debug(f"{DOMAIN} - Keeping last geocode location")
+            latlong = (vehicle.location_latitude, vehicle.location_longitude)
+            cached = self.geocode_cache.get(provider, *latlong)
+            if cached is not None:
+                vehicle.geocode = cached
+                _LOGGER.debug(f"{DOMAIN} - Using cached geocode location")
             elif GEO_LOCATION_PROVIDERS[provider] == OPENSTREETMAP:
                 email_parameter = ""
                 if use_email is True:
@@ -270,8 +507,8 @@ class ApiImpl:
                         get_child_value(response, "display_name"),
                         get_child_value(response, "address"),
                     )
-                    self.previous_latitude = vehicle.location_latitude
-                    self.previous_longitude = vehicle.location_longitude
+                    if vehicle.geocode[0] is not None:
+                        self.geocode_cache.put(provider, *latlong, vehicle.geocode)
                     _LOGGER.debug(f"{DOMAIN} - geocode openstreetmap")
             elif GEO_LOCATION_PROVIDERS[provider] == GOOGLE:
                 if not API_KEY:
@@ -281,14 +518,12 @@ class ApiImpl:
                     _LOGGER.warning(f"{DOMAIN} - geopy is required for geocode Google")
                     vehicle.geocode = None
                 else:
-                    latlong = (vehicle.location_latitude, vehicle.location_longitude)
                     try:
                         geolocator = GoogleV3(api_key=API_KEY)
                         locations = geolocator.reverse(latlong)
                         if locations:
                             vehicle.geocode = locations
-                            self.previous_latitude = vehicle.location_latitude
-                            self.previous_longitude = vehicle.location_longitude
+                            self.geocode_cache.put(provider, *latlong, vehicle.geocode)
                             _LOGGER.debug(f"{DOMAIN} - geocode google")
                     except Exception as ex:  # pylint: disable=broad-except
                         _LOGGER.warning(f"{DOMAIN} - failed geocode Google: {ex}")
@@ -362,8 +597,9 @@ class ApiImpl:
 
         month_trip_info: MonthTripInfo = None
         """
-        raise NotImplementedError(
-            "update_month_trip_info is not implemented for this region"
+        vehicle.month_trip_info = None
+        vehicle.month_trip_info = self.get_month_trip_info(
+            token, vehicle, yyyymm_string
         )
 
     def update_day_trip_info(
@@ -377,8 +613,31 @@ class ApiImpl:
 
         day_trip_info: DayTripInfo = None
         """
+        vehicle.day_trip_info = None
+        vehicle.day_trip_info = self.get_day_trip_info(token, vehicle, yyyymmdd_string)
+
+    def get_month_trip_info(
+        self, token: Token, vehicle: Vehicle, yyyymm_string: str
+    ) -> MonthTripInfo | None:
+        """
+        feature only available for some regions.
+        Returns the trip summary and per-day trip counts of the specified month,
+        or None if there were no trips. Does not modify the vehicle.
+        """
+        raise NotImplementedError(
+            "get_month_trip_info is not implemented for this region"
+        )
+
+    def get_day_trip_info(
+        self, token: Token, vehicle: Vehicle, yyyymmdd_string: str
+    ) -> DayTripInfo | None:
+        """
+        feature only available for some regions.
+        Returns the trips of the specified day, or None if there were none.
+        Does not modify the vehicle.
+        """
         raise NotImplementedError(
-            "update_day_trip_info is not implemented for this region"
+            "get_day_trip_info is not implemented for this region"
         )
 
     def schedule_charging_and_climate(
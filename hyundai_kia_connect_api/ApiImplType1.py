@@ -6,6 +6,7 @@ import logging
 import math
 import threading
 import time
+from collections.abc import Iterator
 from time import sleep
 
 from .ApiImpl import (
@@ -41,8 +42,12 @@ from .exceptions import (
 )
 from .Token import Token
 from .utils import (
+    UNCHANGED,
+    FieldMapping,
+    apply_fields,
     bool_or_none,
     ccs2_reservation_time_or_none,
+    compile_field_mappings,
     get_child_value,
     get_index_into_hex_temp,
     normalize_battery_soc,
@@ -57,6 +62,473 @@ USER_AGENT_OK_HTTP: str = "okhttp/3.12.0"
 _LOGGER = logging.getLogger(__name__)
 
 
+def _ccs2_switch_state(state):
+    # 0 = off, 1 = on, 2 = off again after a timed run; anything else is
+    # unknown and leaves the attribute as it was.
+    if state in (0, 2):
+        return False
+    if state == 1:
+        return True
+    return None
+
+
+def _ccs2_door_is_locked(unlocked):
+    # CCS2 reports the lock flag the other way round: 1 = unlocked.
+    return None if unlocked is None else not unlocked
+
+
+def _ccs2_pressure_unit(raw):
+    if raw is None:
+        return None
+    try:
+        return PressureUnit(raw)
+    except ValueError:
+        # PressureUnit outside {0:psi,1:kpa,2:bar}; e.g. 3 on indirect-TPMS
+        # vehicles (no direct sensor, kia_uvo #1786) -> the car reports no
+        # per-tire pressure, so unavailable is correct. Expected on some
+        # vehicles, so debug, not warning.
+        _LOGGER.debug(
+            "%s - Tire PressureUnit %r not in {0:psi,1:kpa,2:bar}; "
+            "tire pressure values ignored",
+            DOMAIN,
+            raw,
+        )
+        return None
+
+
+def _ccs2_tire_pressure(scale):
+    # Tire pressure values (model B: raw is in the car's display unit; the
+    # scale depends on PressureUnit). Live-confirmed EU Santa Fe 2026:
+    #   bar (PressureUnit.BAR) raw 27 -> 2.7  (x0.1, 0.1-bar steps)
+    #   psi (PressureUnit.PSI) raw 38 -> 38   (x1, integer psi)
+    #   kPa (PressureUnit.KPA) raw 51 -> 255  (x5, 5-kPa steps)
+    # See const.PRESSURE_UNITS / PRESSURE_SCALES. Per-tire *_unit labels are
+    # read-only properties on Vehicle deriving from tire_pressure_unit.
+    def convert(raw):
+        # 255 (0xFF) is the TPMS "no reading" sentinel (car off / before
+        # driving) -> pressure_or_none returns None so the entity shows
+        # unavailable instead of an impossible value. See kia_uvo #1783, #1232.
+        pressure = pressure_or_none(raw)
+        if pressure is None or scale is None:
+            return None
+        return round(pressure * scale, 1)
+
+    return convert
+
+
+def _ccs2_off_peak_window(off_peak):
+    # The 31:70 "unconfigured" sentinel (#1269) is handled silently by
+    # ccs2_reservation_time_or_none; a malformed block gives None.
+    try:
+        return (
+            ccs2_reservation_time_or_none(
+                off_peak.get("StartHour"), off_peak.get("StartMin")
+            ),
+            ccs2_reservation_time_or_none(
+                off_peak.get("EndHour"), off_peak.get("EndMin")
+            ),
+        )
+    except (TypeError, ValueError):
+        return None
+
+
+def _ccs2_off_peak_start(off_peak):
+    # When the block is absent (HEV / unconfigured EV) the times stay None —
+    # do NOT synthesise dt.time(0,0), which would create phantom time
+    # entities downstream and collide with a legitimate midnight window.
+    if not off_peak:
+        return UNCHANGED
+    window = _ccs2_off_peak_window(off_peak)
+    if window is None:
+        _LOGGER.warning("%s - CCS2 OffPeakTime malformed: %s", DOMAIN, off_peak)
+        return None
+    return window[0]
+
+
+def _ccs2_off_peak_end(off_peak):
+    if not off_peak:
+        return UNCHANGED
+    window = _ccs2_off_peak_window(off_peak)
+    return None if window is None else window[1]
+
+
+# Green.Reservation.OffPeakTime.Mode — off-peak charging priority mode.
+# Mode 0 = off, 2 = target-priority (off-peak tariffs prioritized),
+# 3 = time-priority (charge only during off-peak). 1 is reserved/unused.
+_CCS2_OFF_PEAK_CHARGE_ONLY = {0: None, 2: False, 3: True}
+
+
+def _ccs2_schedule_charge_enabled(mode):
+    if mode in _CCS2_OFF_PEAK_CHARGE_ONLY:
+        return mode != 0
+    if mode is not None:
+        _LOGGER.warning("%s - unknown CCS2 OffPeakTime.Mode: %s", DOMAIN, mode)
+    return UNCHANGED
+
+
+def _ccs2_off_peak_charge_only(mode):
+    return _CCS2_OFF_PEAK_CHARGE_ONLY.get(mode, UNCHANGED)
+
+
+# Departure schedules — same None-when-absent rule. A missing or stub
+# Schedule block (e.g. EV9 ships Schedule1 = {"Enable": False} with no
+# Hour/Min) must yield None time/days, not a synthesised dt.time(0,0).
+# Guard on Hour presence so a disabled-but-remembered schedule (EV6:
+# Enable=0 + Hour present) still parses, while an unconfigured stub (EV9: no
+# Hour) stays None. The 31:70 sentinel can also appear here (ccNC EVs,
+# #1269) and is handled silently by ccs2_reservation_time_or_none.
+def _ccs2_departure_time(schedule):
+    if not schedule or "Hour" not in schedule:
+        return UNCHANGED
+    try:
+        return ccs2_reservation_time_or_none(schedule.get("Hour"), schedule.get("Min"))
+    except (TypeError, ValueError):
+        _LOGGER.warning("%s - CCS2 departure schedule time malformed", DOMAIN)
+        return UNCHANGED
+
+
+def _ccs2_departure_days(schedule):
+    if not schedule or "Hour" not in schedule:
+        return UNCHANGED
+    return [
+        i
+        for i, k in enumerate(["Sun", "Mon", "Tue", "Wed", "Thu", "Fri", "Sat"])
+        if schedule.get(k) == 1
+    ] or None
+
+
+# Fields of the CCS2 status copied onto the Vehicle as they are (optionally
+# converted or paired with a unit). Fields that combine several values of the
+# status (temperatures with their unit, ranges, location) stay in
+# _update_vehicle_properties_ccs2.
+_CCS2_FIELDS = compile_field_mappings(
+    (
+        FieldMapping("Drivetrain.Odometer", "odometer", unit=DISTANCE_UNITS[1]),
+        FieldMapping("DrivingReady", "engine_is_running"),
+        FieldMapping(
+            "Body.Windshield.Front.Defog.State",
+            "defrost_is_on",
+            _ccs2_switch_state,
+            keep_previous=True,
+        ),
+        FieldMapping(
+            "Cabin.SteeringWheel.Heat.State",
+            "steering_wheel_heater_is_on",
+            _ccs2_switch_state,
+            keep_previous=True,
+        ),
+        FieldMapping(
+            "Body.Windshield.Rear.Defog.State",
+            "back_window_heater_is_on",
+            _ccs2_switch_state,
+            keep_previous=True,
+        ),
+        FieldMapping(
+            "Cabin.Seat.Row1.Driver.Climate.State",
+            "front_left_seat_status",
+            SEAT_STATUS.get,
+        ),
+        FieldMapping(
+            "Cabin.Seat.Row1.Passenger.Climate.State",
+            "front_right_seat_status",
+            SEAT_STATUS.get,
+        ),
+        FieldMapping(
+            "Cabin.Seat.Row2.Left.Climate.State",
+            "rear_left_seat_status",
+            SEAT_STATUS.get,
+        ),
+        FieldMapping(
+            "Cabin.Seat.Row2.Right.Climate.State",
+            "rear_right_seat_status",
+            SEAT_STATUS.get,
+        ),
+        FieldMapping("Body.Lights.Front.HeadLamp.SystemWarning", "headlamp_status"),
+        FieldMapping("Body.Lights.Front.Left.Low.Warning", "headlamp_left_low"),
+        FieldMapping("Body.Lights.Front.Right.Low.Warning", "headlamp_right_low"),
+        FieldMapping("Body.Lights.Front.Left.High.Warning", "headlamp_left_high"),
+        FieldMapping("Body.Lights.Front.Right.High.Warning", "headlamp_right_high"),
+        FieldMapping("Body.Lights.Rear.Left.StopLamp.Warning", "stop_lamp_left"),
+        FieldMapping("Body.Lights.Rear.Right.StopLamp.Warning", "stop_lamp_right"),
+        FieldMapping(
+            "Body.Lights.Front.Left.TurnSignal.Warning", "turn_signal_left_front"
+        ),
+        FieldMapping(
+            "Body.Lights.Front.Right.TurnSignal.Warning", "turn_signal_right_front"
+        ),
+        FieldMapping(
+            "Body.Lights.Rear.Left.TurnSignal.Warning", "turn_signal_left_rear"
+        ),
+        FieldMapping(
+            "Body.Lights.Rear.Right.TurnSignal.Warning", "turn_signal_right_rear"
+        ),
+        FieldMapping("Cabin.Door.Row1.Driver.Open", "front_left_door_is_open"),
+        FieldMapping("Cabin.Door.Row1.Passenger.Open", "front_right_door_is_open"),
+        FieldMapping("Cabin.Door.Row2.Left.Open", "back_left_door_is_open"),
+        FieldMapping("Cabin.Door.Row2.Right.Open", "back_right_door_is_open"),
+        FieldMapping(
+            "Cabin.Door.Row1.Driver.Lock",
+            "front_left_door_is_locked",
+            _ccs2_door_is_locked,
+        ),
+        FieldMapping(
+            "Cabin.Door.Row1.Passenger.Lock",
+            "front_right_door_is_locked",
+            _ccs2_door_is_locked,
+        ),
+        FieldMapping(
+            "Cabin.Door.Row2.Left.Lock",
+            "back_left_door_is_locked",
+            _ccs2_door_is_locked,
+        ),
+        FieldMapping(
+            "Cabin.Door.Row2.Right.Lock",
+            "back_right_door_is_locked",
+            _ccs2_door_is_locked,
+        ),
+        FieldMapping("Body.Hood.Open", "hood_is_open"),
+        FieldMapping("Body.Sunroof.Glass.Open", "sunroof_is_open", bool_or_none),
+        FieldMapping(
+            "Chassis.Axle.Row2.Left.Tire.PressureLow",
+            "tire_pressure_rear_left_warning_is_on",
+            bool,
+        ),
+        FieldMapping(
+            "Chassis.Axle.Row1.Left.Tire.PressureLow",
+            "tire_pressure_front_left_warning_is_on",
+            bool,
+        ),
+        FieldMapping(
+            "Chassis.Axle.Row1.Right.Tire.PressureLow",
+            "tire_pressure_front_right_warning_is_on",
+            bool,
+        ),
+        FieldMapping(
+            "Chassis.Axle.Row2.Right.Tire.PressureLow",
+            "tire_pressure_rear_right_warning_is_on",
+            bool,
+        ),
+        FieldMapping(
+            "Chassis.Axle.Tire.PressureLow", "tire_pressure_all_warning_is_on", bool
+        ),
+        # Read before the pressures, which are scaled by it (_CCS2_TIRE_PRESSURES).
+        FieldMapping(
+            "Chassis.Axle.Tire.PressureUnit", "tire_pressure_unit", _ccs2_pressure_unit
+        ),
+        # Drive mode (e.g. "Eco", "Sport", "Comfort", "Snow", "Smart").
+        FieldMapping("Chassis.DrivingMode.State", "drive_mode"),
+        # Low oil level (HEV/ICE) and 12V auxiliary battery fault warnings. None
+        # when unreported (no sensor -> no entity downstream).
+        FieldMapping(
+            "Drivetrain.InternalCombustionEngine.OilLevelWarning",
+            "oil_level_warning_is_on",
+            bool_or_none,
+        ),
+        FieldMapping(
+            "Electronics.Battery.Auxiliary.FailWarning",
+            "battery_auxiliary_fail_warning_is_on",
+            bool_or_none,
+        ),
+        # Power/ignition/sleep — gap vs CA/IN flat format.
+        FieldMapping("Electronics.PowerSupply.Accessory", "accessory_on", bool_or_none),
+        FieldMapping("Electronics.PowerSupply.Ignition3", "ign3", bool_or_none),
+        FieldMapping("RemoteControl.SleepMode", "sleep_mode_check", bool_or_none),
+        FieldMapping("Body.Trunk.Open", "trunk_is_open"),
+        FieldMapping(
+            "Green.BatteryManagement.BatteryRemain.Ratio", "ev_battery_percentage"
+        ),
+        FieldMapping(
+            "Green.BatteryManagement.BatteryPackVoltage", "ev_battery_pack_voltage"
+        ),
+        FieldMapping("Green.BatteryManagement.ChillerRPM", "ev_battery_chiller_rpm"),
+        FieldMapping(
+            "Green.BatteryManagement.HeatingState",
+            "ev_battery_heating_state",
+            bool_or_none,
+            keep_previous=True,
+        ),
+        FieldMapping(
+            "Green.BatteryManagement.Temperature.CoolingWaterInlet",
+            "ev_battery_water_temperature",
+            unit=TEMPERATURE_UNITS[0],
+        ),
+        FieldMapping(
+            "Green.BatteryManagement.Temperature.Min.Raw",
+            "ev_battery_temperature_min",
+            unit=TEMPERATURE_UNITS[0],
+        ),
+        FieldMapping(
+            "Green.BatteryManagement.Temperature.Max.Raw",
+            "ev_battery_temperature_max",
+            unit=TEMPERATURE_UNITS[0],
+        ),
+        FieldMapping(
+            "Green.BatteryManagement.WinterModeOperation",
+            "ev_battery_winter_mode",
+            bool_or_none,
+            keep_previous=True,
+        ),
+        FieldMapping(
+            "Green.Electric.SmartGrid.RealTimePower",
+            "ev_charging_power",
+            keep_previous=True,
+        ),
+        FieldMapping(
+            "Green.BatteryManagement.BatteryRemain.Value", "ev_battery_remain"
+        ),
+        FieldMapping(
+            "Green.BatteryManagement.BatteryCapacity.Value", "ev_battery_capacity"
+        ),
+        FieldMapping("Green.BatteryManagement.SoH.Ratio", "ev_battery_soh_percentage"),
+        FieldMapping(
+            "Green.ChargingInformation.ConnectorFastening.State",
+            "ev_battery_is_plugged_in",
+        ),
+        FieldMapping(
+            "Green.ChargingDoor.State",
+            "ev_charge_port_door_is_open",
+            _ccs2_switch_state,
+            keep_previous=True,
+        ),
+        FieldMapping(
+            "Body.Windshield.Front.WasherFluid.LevelLow", "washer_fluid_warning_is_on"
+        ),
+        FieldMapping(
+            "Green.ChargingInformation.Charging.RemainTime",
+            "ev_estimated_current_charge_duration",
+            unit="m",
+        ),
+        FieldMapping(
+            "Green.ChargingInformation.EstimatedTime.Quick",
+            "ev_estimated_fast_charge_duration",
+            unit="m",
+        ),
+        FieldMapping(
+            "Green.ChargingInformation.EstimatedTime.ICCB",
+            "ev_estimated_portable_charge_duration",
+            unit="m",
+        ),
+        FieldMapping(
+            "Green.ChargingInformation.EstimatedTime.Standard",
+            "ev_estimated_station_charge_duration",
+            unit="m",
+        ),
+        FieldMapping(
+            "Green.ChargingInformation.TargetSoC.Standard", "ev_charge_limits_ac"
+        ),
+        FieldMapping(
+            "Green.ChargingInformation.TargetSoC.Quick", "ev_charge_limits_dc"
+        ),
+        FieldMapping(
+            "Green.ChargingInformation.ElectricCurrentLevel.State",
+            "ev_charging_current",
+        ),
+        FieldMapping(
+            "Green.Electric.SmartGrid.VehicleToLoad.DischargeLimitation.SoC",
+            "ev_v2l_discharge_limit",
+        ),
+        FieldMapping(
+            "Green.Reservation.Departure.Schedule1.Enable",
+            "ev_first_departure_enabled",
+            bool,
+        ),
+        FieldMapping(
+            "Green.Reservation.Departure.Schedule2.Enable",
+            "ev_second_departure_enabled",
+            bool,
+        ),
+        FieldMapping(
+            "Green.Reservation.Departure.Schedule1",
+            "ev_first_departure_time",
+            _ccs2_departure_time,
+        ),
+        FieldMapping(
+            "Green.Reservation.Departure.Schedule1",
+            "ev_first_departure_days",
+            _ccs2_departure_days,
+        ),
+        FieldMapping(
+            "Green.Reservation.Departure.Schedule2",
+            "ev_second_departure_time",
+            _ccs2_departure_time,
+        ),
+        FieldMapping(
+            "Green.Reservation.Departure.Schedule2",
+            "ev_second_departure_days",
+            _ccs2_departure_days,
+        ),
+        FieldMapping(
+            "Green.Reservation.OffPeakTime",
+            "ev_off_peak_start_time",
+            _ccs2_off_peak_start,
+        ),
+        FieldMapping(
+            "Green.Reservation.OffPeakTime", "ev_off_peak_end_time", _ccs2_off_peak_end
+        ),
+        FieldMapping(
+            "Green.Reservation.OffPeakTime.Mode",
+            "ev_schedule_charge_enabled",
+            _ccs2_schedule_charge_enabled,
+        ),
+        FieldMapping(
+            "Green.Reservation.OffPeakTime.Mode",
+            "ev_off_peak_charge_only_enabled",
+            _ccs2_off_peak_charge_only,
+        ),
+        FieldMapping(
+            "Green.PowerConsumption.Moment.BatteryCooling",
+            "ev_power_consumption_battery_cooling",
+        ),
+        FieldMapping(
+            "Green.PowerConsumption.Moment.BatteryHeater",
+            "ev_power_consumption_battery_heater",
+        ),
+        FieldMapping(
+            "Green.PowerConsumption.Moment.ClimateAirConditioning",
+            "ev_power_consumption_air_conditioning",
+        ),
+        FieldMapping("Chassis.Brake.Fluid.Warning", "brake_fluid_warning_is_on"),
+        FieldMapping("Drivetrain.FuelSystem.FuelLevel", "fuel_level"),
+        FieldMapping("Drivetrain.FuelSystem.LowFuelWarning", "fuel_level_is_low"),
+        FieldMapping("Cabin.HVAC.Row1.Driver.Blower.SpeedLevel", "air_control_is_on"),
+        FieldMapping(
+            "Electronics.FOB.LowBattery", "smart_key_battery_warning_is_on", bool
+        ),
+    )
+)
+
+# Tire pressures, one table per tire_pressure_unit with its scale.
+_CCS2_TIRE_PRESSURES = {
+    unit: compile_field_mappings(
+        FieldMapping(
+            f"Chassis.Axle.{axle}.Tire.Pressure",
+            attribute,
+            _ccs2_tire_pressure(PRESSURE_SCALES.get(unit)),
+        )
+        for axle, attribute in (
+            ("Row1.Left", "tire_pressure_front_left"),
+            ("Row1.Right", "tire_pressure_front_right"),
+            ("Row2.Left", "tire_pressure_rear_left"),
+            ("Row2.Right", "tire_pressure_rear_right"),
+        )
+    )
+    for unit in (None, *PressureUnit)
+}
+
+
+_device_id_lock = threading.Lock()
+
+
+def _reregister_device_id(api: ApiImpl, token: Token) -> None:
+    """Register a new device_id on ``token`` and report the change."""
+    with _device_id_lock:
+        _LOGGER.debug(f"{DOMAIN} - DeviceIDError, re-registering device_id")
+        stamp = api._get_stamp()
+        token.device_id = api._get_device_id(stamp)
+    if api.token_updated is not None:
+        api.token_updated(token)
+
+
 def _retry_on_device_id_error(func):
     """On DeviceIDError, re-register device_id and retry once.
 
@@ -64,22 +536,32 @@ def _retry_on_device_id_error(func):
     proactively rotating device_id after every control command (which causes
     race conditions), we retry only when the error actually occurs.
     """
-    _device_id_lock = threading.Lock()
 
     @functools.wraps(func)
     def wrapper(self, token, *args, **kwargs):
         try:
             return func(self, token, *args, **kwargs)
         except DeviceIDError:
-            with _device_id_lock:
-                _LOGGER.debug(f"{DOMAIN} - DeviceIDError, re-registering device_id")
-                stamp = self._get_stamp()
-                token.device_id = self._get_device_id(stamp)
+            _reregister_device_id(self, token)
             return func(self, token, *args, **kwargs)
 
     return wrapper
 
 
+def _retry_steps_on_device_id_error(func):
+    """_retry_on_device_id_error for step generators (see force_refresh_vehicle_state_steps)."""
+
+    @functools.wraps(func)
+    def wrapper(self, token, *args, **kwargs) -> Iterator[float]:
+        try:
+            return (yield from func(self, token, *args, **kwargs))
+        except DeviceIDError:
+            _reregister_device_id(self, token)
+            return (yield from func(self, token, *args, **kwargs))
+
+    return wrapper
+
+
 def _check_response_for_errors(response: dict) -> None:
     """
     Checks for errors in the API response.
@@ -148,6 +630,7 @@ class ApiImplType1(ApiImpl):
 
     supports_window_control: bool = True
     supports_valet_mode: bool = True
+    action_status_poll_interval: float = 5
 
     def __init__(self) -> None:
         """Initialize."""
@@ -292,17 +775,16 @@ class ApiImplType1(ApiImpl):
         else:
             vehicle.last_updated_at = dt.datetime.now(self.data_timezone)
 
-        vehicle.odometer = (
-            get_child_value(state, "Drivetrain.Odometer"),
-            DISTANCE_UNITS[1],
-        )
+        apply_fields(vehicle, state, _CCS2_FIELDS)
+
+        # TODO: status.sideMirrorHeat (side_mirror_heater_is_on) — no CCS2
+        # path known yet.
+
         vehicle.car_battery_percentage = normalize_battery_soc(
             get_child_value(state, "Electronics.Battery.Level"),
             get_child_value(state, "Electronics.Battery.SensorReliability"),
         )
 
-        vehicle.engine_is_running = get_child_value(state, "DrivingReady")
-
         air_temp = get_child_value(
             state,
             "Cabin.HVAC.Row1.Driver.Temperature.Value",
@@ -323,110 +805,6 @@ class ApiImplType1(ApiImpl):
                 TEMPERATURE_UNITS[outside_temp_unit],
             )
 
-        defrost_is_on = get_child_value(state, "Body.Windshield.Front.Defog.State")
-        if defrost_is_on in [0, 2]:
-            vehicle.defrost_is_on = False
-        elif defrost_is_on == 1:
-            vehicle.defrost_is_on = True
-
-        steer_wheel_heat = get_child_value(state, "Cabin.SteeringWheel.Heat.State")
-        if steer_wheel_heat in [0, 2]:
-            vehicle.steering_wheel_heater_is_on = False
-        elif steer_wheel_heat == 1:
-            vehicle.steering_wheel_heater_is_on = True
-
-        defrost_rear_is_on = get_child_value(state, "Body.Windshield.Rear.Defog.State")
-        if defrost_rear_is_on in [0, 2]:
-            vehicle.back_window_heater_is_on = False
-        elif defrost_rear_is_on == 1:
-            vehicle.back_window_heater_is_on = True
-
-        # TODO: status.sideMirrorHeat
-
-        vehicle.front_left_seat_status = SEAT_STATUS.get(
-            get_child_value(state, "Cabin.Seat.Row1.Driver.Climate.State")
-        )
-
-        vehicle.front_right_seat_status = SEAT_STATUS.get(
-            get_child_value(state, "Cabin.Seat.Row1.Passenger.Climate.State")
-        )
-
-        vehicle.rear_left_seat_status = SEAT_STATUS.get(
-            get_child_value(state, "Cabin.Seat.Row2.Left.Climate.State")
-        )
-
-        vehicle.rear_right_seat_status = SEAT_STATUS.get(
-            get_child_value(state, "Cabin.Seat.Row2.Right.Climate.State")
-        )
-
-        vehicle.headlamp_status = get_child_value(
-            state, "Body.Lights.Front.HeadLamp.SystemWarning"
-        )
-        vehicle.headlamp_left_low = get_child_value(
-            state, "Body.Lights.Front.Left.Low.Warning"
-        )
-        vehicle.headlamp_right_low = get_child_value(
-            state, "Body.Lights.Front.Right.Low.Warning"
-        )
-        vehicle.headlamp_left_high = get_child_value(
-            state, "Body.Lights.Front.Left.High.Warning"
-        )
-        vehicle.headlamp_right_high = get_child_value(
-            state, "Body.Lights.Front.Right.High.Warning"
-        )
-        vehicle.stop_lamp_left = get_child_value(
-            state, "Body.Lights.Rear.Left.StopLamp.Warning"
-        )
-        vehicle.stop_lamp_right = get_child_value(
-            state, "Body.Lights.Rear.Right.StopLamp.Warning"
-        )
-        vehicle.turn_signal_left_front = get_child_value(
-            state, "Body.Lights.Front.Left.TurnSignal.Warning"
-        )
-        vehicle.turn_signal_right_front = get_child_value(
-            state, "Body.Lights.Front.Right.TurnSignal.Warning"
-        )
-        vehicle.turn_signal_left_rear = get_child_value(
-            state, "Body.Lights.Rear.Left.TurnSignal.Warning"
-        )
-        vehicle.turn_signal_right_rear = get_child_value(
-            state, "Body.Lights.Rear.Right.TurnSignal.Warning"
-        )
-
-        vehicle.front_left_door_is_open = get_child_value(
-            state, "Cabin.Door.Row1.Driver.Open"
-        )
-        vehicle.front_right_door_is_open = get_child_value(
-            state, "Cabin.Door.Row1.Passenger.Open"
-        )
-        vehicle.back_left_door_is_open = get_child_value(
-            state, "Cabin.Door.Row2.Left.Open"
-        )
-        vehicle.back_right_door_is_open = get_child_value(
-            state, "Cabin.Door.Row2.Right.Open"
-        )
-
-        vehicle.front_left_door_is_locked = (
-            not bool(get_child_value(state, "Cabin.Door.Row1.Driver.Lock"))
-            if get_child_value(state, "Cabin.Door.Row1.Driver.Lock") is not None
-            else None
-        )
-        vehicle.front_right_door_is_locked = (
-            not bool(get_child_value(state, "Cabin.Door.Row1.Passenger.Lock"))
-            if get_child_value(state, "Cabin.Door.Row1.Passenger.Lock") is not None
-            else None
-        )
-        vehicle.back_left_door_is_locked = (
-            not bool(get_child_value(state, "Cabin.Door.Row2.Left.Lock"))
-            if get_child_value(state, "Cabin.Door.Row2.Left.Lock") is not None
-            else None
-        )
-        vehicle.back_right_door_is_locked = (
-            not bool(get_child_value(state, "Cabin.Door.Row2.Right.Lock"))
-            if get_child_value(state, "Cabin.Door.Row2.Right.Lock") is not None
-            else None
-        )
-
         vehicle.is_locked = (
             vehicle.front_left_door_is_locked
             and vehicle.front_right_door_is_locked
@@ -434,7 +812,6 @@ class ApiImplType1(ApiImpl):
             and vehicle.back_right_door_is_locked
         )
 
-        vehicle.hood_is_open = get_child_value(state, "Body.Hood.Open")
         vehicle.front_left_window_is_open = window_is_open(
             state,
             "Cabin.Window.Row1.Driver.Open",
@@ -455,141 +832,11 @@ class ApiImplType1(ApiImpl):
             "Cabin.Window.Row2.Right.Open",
             "Cabin.Window.Row2.Right.OpenLevel",
         )
-        vehicle.sunroof_is_open = (
-            bool(get_child_value(state, "Body.Sunroof.Glass.Open"))
-            if get_child_value(state, "Body.Sunroof.Glass.Open") is not None
-            else None
-        )
-        vehicle.tire_pressure_rear_left_warning_is_on = bool(
-            get_child_value(state, "Chassis.Axle.Row2.Left.Tire.PressureLow")
-        )
-        vehicle.tire_pressure_front_left_warning_is_on = bool(
-            get_child_value(state, "Chassis.Axle.Row1.Left.Tire.PressureLow")
-        )
-        vehicle.tire_pressure_front_right_warning_is_on = bool(
-            get_child_value(state, "Chassis.Axle.Row1.Right.Tire.PressureLow")
-        )
-        vehicle.tire_pressure_rear_right_warning_is_on = bool(
-            get_child_value(state, "Chassis.Axle.Row2.Right.Tire.PressureLow")
-        )
-        vehicle.tire_pressure_all_warning_is_on = bool(
-            get_child_value(state, "Chassis.Axle.Tire.PressureLow")
-        )
-        # Tire pressure values (model B: raw is in the car's display unit; the
-        # scale depends on PressureUnit). Live-confirmed EU Santa Fe 2026:
-        #   bar (PressureUnit.BAR) raw 27 -> 2.7  (x0.1, 0.1-bar steps)
-        #   psi (PressureUnit.PSI) raw 38 -> 38   (x1, integer psi)
-        #   kPa (PressureUnit.KPA) raw 51 -> 255  (x5, 5-kPa steps)
-        # See const.PRESSURE_UNITS / PRESSURE_SCALES. Per-tire *_unit labels are
-        # read-only properties on Vehicle deriving from tire_pressure_unit.
-        _pu_raw = get_child_value(state, "Chassis.Axle.Tire.PressureUnit")
-        if _pu_raw is None:
-            vehicle.tire_pressure_unit = None
-        else:
-            try:
-                vehicle.tire_pressure_unit = PressureUnit(_pu_raw)
-            except ValueError:
-                # PressureUnit outside {0:psi,1:kpa,2:bar}; e.g. 3 on
-                # indirect-TPMS vehicles (no direct sensor, kia_uvo #1786) ->
-                # the car reports no per-tire pressure, so unavailable is
-                # correct. Expected on some vehicles, so debug, not warning.
-                _LOGGER.debug(
-                    "%s - Tire PressureUnit %r not in {0:psi,1:kpa,2:bar}; "
-                    "tire pressure values ignored",
-                    DOMAIN,
-                    _pu_raw,
-                )
-                vehicle.tire_pressure_unit = None
-        _scale = PRESSURE_SCALES.get(vehicle.tire_pressure_unit)
-        # 255 (0xFF) is the TPMS "no reading" sentinel (car off / before
-        # driving) -> pressure_or_none returns None so the entity shows
-        # unavailable instead of an impossible value. See kia_uvo #1783, #1232.
-        _pfl = pressure_or_none(
-            get_child_value(state, "Chassis.Axle.Row1.Left.Tire.Pressure")
-        )
-        _pfr = pressure_or_none(
-            get_child_value(state, "Chassis.Axle.Row1.Right.Tire.Pressure")
-        )
-        _prl = pressure_or_none(
-            get_child_value(state, "Chassis.Axle.Row2.Left.Tire.Pressure")
-        )
-        _prr = pressure_or_none(
-            get_child_value(state, "Chassis.Axle.Row2.Right.Tire.Pressure")
-        )
-        vehicle.tire_pressure_front_left = (
-            round(_pfl * _scale, 1) if _pfl is not None and _scale is not None else None
-        )
-        vehicle.tire_pressure_front_right = (
-            round(_pfr * _scale, 1) if _pfr is not None and _scale is not None else None
-        )
-        vehicle.tire_pressure_rear_left = (
-            round(_prl * _scale, 1) if _prl is not None and _scale is not None else None
-        )
-        vehicle.tire_pressure_rear_right = (
-            round(_prr * _scale, 1) if _prr is not None and _scale is not None else None
-        )
-        # Drive mode (e.g. "Eco", "Sport", "Comfort", "Snow", "Smart").
-        vehicle.drive_mode = get_child_value(state, "Chassis.DrivingMode.State")
-        # Low oil level warning (HEV/ICE). None when unreported (no sensor -> no
-        # entity downstream).
-        vehicle.oil_level_warning_is_on = bool_or_none(
-            get_child_value(
-                state, "Drivetrain.InternalCombustionEngine.OilLevelWarning"
-            )
-        )
-        # 12V auxiliary battery fault warning. None when unreported.
-        vehicle.battery_auxiliary_fail_warning_is_on = bool_or_none(
-            get_child_value(state, "Electronics.Battery.Auxiliary.FailWarning")
-        )
-        # Power/ignition/sleep — gap vs CA/IN flat format.
-        vehicle.accessory_on = bool_or_none(
-            get_child_value(state, "Electronics.PowerSupply.Accessory")
-        )
-        vehicle.ign3 = bool_or_none(
-            get_child_value(state, "Electronics.PowerSupply.Ignition3")
-        )
-        vehicle.sleep_mode_check = bool_or_none(
-            get_child_value(state, "RemoteControl.SleepMode")
-        )
-        vehicle.trunk_is_open = get_child_value(state, "Body.Trunk.Open")
-
-        vehicle.ev_battery_percentage = get_child_value(
-            state, "Green.BatteryManagement.BatteryRemain.Ratio"
-        )
-
-        vehicle.ev_battery_pack_voltage = get_child_value(
-            state, "Green.BatteryManagement.BatteryPackVoltage"
-        )
-        vehicle.ev_battery_chiller_rpm = get_child_value(
-            state, "Green.BatteryManagement.ChillerRPM"
-        )
-
-        battery_heating_state = get_child_value(
-            state, "Green.BatteryManagement.HeatingState"
-        )
-        if battery_heating_state is not None:
-            vehicle.ev_battery_heating_state = bool(battery_heating_state)
-
-        vehicle.ev_battery_water_temperature = (
-            get_child_value(
-                state, "Green.BatteryManagement.Temperature.CoolingWaterInlet"
-            ),
-            TEMPERATURE_UNITS[0],
-        )
-        vehicle.ev_battery_temperature_min = (
-            get_child_value(state, "Green.BatteryManagement.Temperature.Min.Raw"),
-            TEMPERATURE_UNITS[0],
-        )
-        vehicle.ev_battery_temperature_max = (
-            get_child_value(state, "Green.BatteryManagement.Temperature.Max.Raw"),
-            TEMPERATURE_UNITS[0],
-        )
+        apply_fields(vehicle, state, _CCS2_TIRE_PRESSURES[vehicle.tire_pressure_unit])
 
         winter_mode = get_child_value(
             state, "Green.BatteryManagement.WinterModeOperation"
         )
-        if winter_mode is not None:
-            vehicle.ev_battery_winter_mode = bool(winter_mode)
 
         # EV battery preconditioning toggle.
         # EV (e.g. IONIQ 5) reports Green.BatteryManagement.BatteryPreCondition.Status
@@ -610,31 +857,6 @@ class ApiImplType1(ApiImpl):
         elif winter_mode is not None:
             vehicle.ev_battery_precondition_enabled = bool(winter_mode)
 
-        if get_child_value(state, "Green.Electric.SmartGrid.RealTimePower") is not None:
-            vehicle.ev_charging_power = get_child_value(
-                state, "Green.Electric.SmartGrid.RealTimePower"
-            )
-        vehicle.ev_battery_remain = get_child_value(
-            state, "Green.BatteryManagement.BatteryRemain.Value"
-        )
-        vehicle.ev_battery_capacity = get_child_value(
-            state, "Green.BatteryManagement.BatteryCapacity.Value"
-        )
-        vehicle.ev_battery_soh_percentage = get_child_value(
-            state, "Green.BatteryManagement.SoH.Ratio"
-        )
-        vehicle.ev_battery_is_plugged_in = get_child_value(
-            state, "Green.ChargingInformation.ElectricCurrentLevel.State"
-        )
-        vehicle.ev_battery_is_plugged_in = get_child_value(
-            state, "Green.ChargingInformation.ConnectorFastening.State"
-        )
-        charging_door_state = get_child_value(state, "Green.ChargingDoor.State")
-        if charging_door_state in [0, 2]:
-            vehicle.ev_charge_port_door_is_open = False
-        elif charging_door_state == 1:
-            vehicle.ev_charge_port_door_is_open = True
-
         vehicle.total_driving_range = (
             float(
                 get_child_value(
@@ -667,38 +889,6 @@ class ApiImplType1(ApiImpl):
                     vehicle.total_driving_range_unit,
                 )
 
-        vehicle.washer_fluid_warning_is_on = get_child_value(
-            state, "Body.Windshield.Front.WasherFluid.LevelLow"
-        )
-
-        vehicle.ev_estimated_current_charge_duration = (
-            get_child_value(state, "Green.ChargingInformation.Charging.RemainTime"),
-            "m",
-        )
-        vehicle.ev_estimated_fast_charge_duration = (
-            get_child_value(state, "Green.ChargingInformation.EstimatedTime.Quick"),
-            "m",
-        )
-        vehicle.ev_estimated_portable_charge_duration = (
-            get_child_value(state, "Green.ChargingInformation.EstimatedTime.ICCB"),
-            "m",
-        )
-        vehicle.ev_estimated_station_charge_duration = (
-            get_child_value(state, "Green.ChargingInformation.EstimatedTime.Standard"),
-            "m",
-        )
-        vehicle.ev_charge_limits_ac = get_child_value(
-            state, "Green.ChargingInformation.TargetSoC.Standard"
-        )
-        vehicle.ev_charge_limits_dc = get_child_value(
-            state, "Green.ChargingInformation.TargetSoC.Quick"
-        )
-        vehicle.ev_charging_current = get_child_value(
-            state, "Green.ChargingInformation.ElectricCurrentLevel.State"
-        )
-        vehicle.ev_v2l_discharge_limit = get_child_value(
-            state, "Green.Electric.SmartGrid.VehicleToLoad.DischargeLimitation.SoC"
-        )
         vehicle.ev_target_range_charge_AC = (
             get_child_value(
                 state,
@@ -723,118 +913,10 @@ class ApiImplType1(ApiImpl):
                 )
             ],
         )
-        vehicle.ev_first_departure_enabled = bool(
-            get_child_value(state, "Green.Reservation.Departure.Schedule1.Enable")
-        )
-
-        vehicle.ev_second_departure_enabled = bool(
-            get_child_value(state, "Green.Reservation.Departure.Schedule2.Enable")
-        )
-
-        vehicle.ev_power_consumption_battery_cooling = get_child_value(
-            state, "Green.PowerConsumption.Moment.BatteryCooling"
-        )
-
-        vehicle.ev_power_consumption_battery_heater = get_child_value(
-            state, "Green.PowerConsumption.Moment.BatteryHeater"
-        )
-        vehicle.ev_power_consumption_air_conditioning = get_child_value(
-            state, "Green.PowerConsumption.Moment.ClimateAirConditioning"
-        )
-
-        # Green.Reservation.OffPeakTime — off-peak charging window + priority mode.
-        # Mode 0 = off, 2 = target-priority (off-peak tariffs prioritized),
-        # 3 = time-priority (charge only during off-peak). 1 is reserved/unused.
-        # When the block is absent (HEV / unconfigured EV) all fields stay None —
-        # do NOT synthesise dt.time(0,0), which would create phantom time
-        # entities downstream and collide with a legitimate midnight window.
-        # The 31:70 "unconfigured" sentinel (#1269) is handled silently by
-        # ccs2_reservation_time_or_none.
-        off_peak = get_child_value(state, "Green.Reservation.OffPeakTime")
-        if off_peak:
-            try:
-                vehicle.ev_off_peak_start_time = ccs2_reservation_time_or_none(
-                    off_peak.get("StartHour"), off_peak.get("StartMin")
-                )
-                vehicle.ev_off_peak_end_time = ccs2_reservation_time_or_none(
-                    off_peak.get("EndHour"), off_peak.get("EndMin")
-                )
-            except (TypeError, ValueError):
-                _LOGGER.warning("%s - CCS2 OffPeakTime malformed: %s", DOMAIN, off_peak)
-                vehicle.ev_off_peak_start_time = None
-                vehicle.ev_off_peak_end_time = None
-
-            mode = off_peak.get("Mode")
-            if mode == 0:
-                vehicle.ev_schedule_charge_enabled = False
-                vehicle.ev_off_peak_charge_only_enabled = None
-            elif mode == 2:
-                vehicle.ev_schedule_charge_enabled = True
-                vehicle.ev_off_peak_charge_only_enabled = False
-            elif mode == 3:
-                vehicle.ev_schedule_charge_enabled = True
-                vehicle.ev_off_peak_charge_only_enabled = True
-            elif mode is not None:
-                _LOGGER.warning("%s - unknown CCS2 OffPeakTime.Mode: %s", DOMAIN, mode)
-        # off_peak is None/falsy -> no OffPeakTime block (HEV/unconfigured) ->
-        # ev_off_peak_* and ev_schedule_charge_enabled stay None (None default).
-
-        # Departure schedules — same None-when-absent rule. A missing or
-        # stub Schedule block (e.g. EV9 ships Schedule1 = {"Enable": False}
-        # with no Hour/Min) must yield None time/days, not a synthesised
-        # dt.time(0,0). ev_*_departure_enabled is set earlier from the
-        # Enable field and is unaffected. Guard on Hour presence so a
-        # disabled-but-remembered schedule (EV6: Enable=0 + Hour present)
-        # still parses, while an unconfigured stub (EV9: no Hour) stays None.
-        # The 31:70 sentinel can also appear here (ccNC EVs, #1269) and is
-        # handled silently by ccs2_reservation_time_or_none.
-        schedule1 = get_child_value(state, "Green.Reservation.Departure.Schedule1")
-        schedule2 = get_child_value(state, "Green.Reservation.Departure.Schedule2")
-        if schedule1 and "Hour" in schedule1:
-            try:
-                vehicle.ev_first_departure_time = ccs2_reservation_time_or_none(
-                    schedule1.get("Hour"), schedule1.get("Min")
-                )
-            except (TypeError, ValueError):
-                _LOGGER.warning("%s - CCS2 Schedule1 time malformed", DOMAIN)
-            vehicle.ev_first_departure_days = [
-                i
-                for i, k in enumerate(["Sun", "Mon", "Tue", "Wed", "Thu", "Fri", "Sat"])
-                if schedule1.get(k) == 1
-            ] or None
-        if schedule2 and "Hour" in schedule2:
-            try:
-                vehicle.ev_second_departure_time = ccs2_reservation_time_or_none(
-                    schedule2.get("Hour"), schedule2.get("Min")
-                )
-            except (TypeError, ValueError):
-                _LOGGER.warning("%s - CCS2 Schedule2 time malformed", DOMAIN)
-            vehicle.ev_second_departure_days = [
-                i
-                for i, k in enumerate(["Sun", "Mon", "Tue", "Wed", "Thu", "Fri", "Sat"])
-                if schedule2.get(k) == 1
-            ] or None
 
         # TODO: ev_*_departure_climate_* from Green.Reservation.Departure.Schedule2.Climate
         # and Green.Reservation.Departure.Climate — needs climate-temp-unit shape check.
 
-        vehicle.washer_fluid_warning_is_on = get_child_value(
-            state, "Body.Windshield.Front.WasherFluid.LevelLow"
-        )
-        vehicle.brake_fluid_warning_is_on = get_child_value(
-            state, "Chassis.Brake.Fluid.Warning"
-        )
-
-        vehicle.fuel_level = get_child_value(state, "Drivetrain.FuelSystem.FuelLevel")
-        vehicle.fuel_level_is_low = get_child_value(
-            state, "Drivetrain.FuelSystem.LowFuelWarning"
-        )
-        vehicle.air_control_is_on = get_child_value(
-            state, "Cabin.HVAC.Row1.Driver.Blower.SpeedLevel"
-        )
-        vehicle.smart_key_battery_warning_is_on = bool(
-            get_child_value(state, "Electronics.FOB.LowBattery")
-        )
         if vehicle._ev_estimated_current_charge_duration is not None:
             if vehicle._ev_estimated_current_charge_duration == 0:
                 vehicle.ev_battery_is_charging = False
@@ -1027,8 +1109,6 @@ class ApiImplType1(ApiImpl):
         synchronous: bool = False,
         timeout: int = 0,
     ) -> ORDER_STATUS:
-        url = self.SPA_API_URL + "notifications/" + vehicle.id + "/records"
-
         if synchronous:
             if timeout < 1:
                 raise APIError("Timeout must be 1 or higher")
@@ -1051,33 +1131,53 @@ class ApiImplType1(ApiImpl):
             return ORDER_STATUS.TIMEOUT
 
         else:
-            response = self.session.get(
-                url,
-                headers=self._get_authenticated_headers(
-                    token, vehicle.ccu_ccs2_protocol_support
-                ),
-            ).json()
-            _LOGGER.debug(f"{DOMAIN} - Check last action status Response: {response}")
-            _check_response_for_errors(response)
-
-            for action in response["resMsg"]:
-                if action["recordId"] == action_id:
-                    if action["result"] == "success":
-                        return ORDER_STATUS.SUCCESS
-                    elif action["result"] == "fail":
-                        return ORDER_STATUS.FAILED
-                    elif action["result"] == "non-response":
-                        return ORDER_STATUS.TIMEOUT
-                    elif action["result"] is None:
-                        _LOGGER.info(
-                            "Action status not set yet by server - try again in a few seconds"
-                        )
-                        return ORDER_STATUS.PENDING
-
-            # if iterate the whole notifications list and
-            # can't find the action, raise an exception
-            # Old code: raise APIError(f"No action found with ID {action_id}")
-            return ORDER_STATUS.UNKNOWN
+            return self._check_action_statuses(token, vehicle, [action_id])[action_id]
+
+    @_retry_on_device_id_error
+    def check_action_statuses(
+        self, token: Token, vehicle: Vehicle, action_ids: list[str]
+    ) -> dict[str, ORDER_STATUS]:
+        """Status of several actions from one fetch of the notification records."""
+        return self._check_action_statuses(token, vehicle, action_ids)
+
+    def _check_action_statuses(
+        self, token: Token, vehicle: Vehicle, action_ids: list[str]
+    ) -> dict[str, ORDER_STATUS]:
+        url = self.SPA_API_URL + "notifications/" + vehicle.id + "/records"
+        response = self.session.get(
+            url,
+            headers=self._get_authenticated_headers(
+                token, vehicle.ccu_ccs2_protocol_support
+            ),
+        ).json()
+        _LOGGER.debug(f"{DOMAIN} - Check last action status Response: {response}")
+        _check_response_for_errors(response)
+
+        records = {}
+        for action in response["resMsg"]:
+            records.setdefault(action["recordId"], action)
+        return {
+            action_id: self._action_record_status(records.get(action_id))
+            for action_id in action_ids
+        }
+
+    def _action_record_status(self, action: dict | None) -> ORDER_STATUS:
+        if action is not None:
+            if action["result"] == "success":
+                return ORDER_STATUS.SUCCESS
+            elif action["result"] == "fail":
+                return ORDER_STATUS.FAILED
+            elif action["result"] == "non-response":
+                return ORDER_STATUS.TIMEOUT
+            elif action["result"] is None:
+                _LOGGER.info(
+                    "Action status not set yet by server - try again in a few seconds"
+                )
+                return ORDER_STATUS.PENDING
+
+        # if the action is not in the notifications list, its status is unknown
+        # Old code: raise APIError(f"No action found with ID {action_id}")
+        return ORDER_STATUS.UNKNOWN
 
     @_retry_on_device_id_error
     def schedule_charging_and_climate(
@@ -1577,6 +1677,14 @@ class ApiImplType1(ApiImpl):
                 )
         return self.login(token.username, token.password, token.pin)
 
+    def refresh_control_token(self, token: Token) -> bool:
+        if not token.pin:
+            return False
+        # Drop the cached value so _get_control_token requests a new one.
+        token.control_token_expiry = 0
+        token.control_token, token.control_token_expiry = self._get_control_token(token)
+        return True
+
     def _get_control_token(self, token: Token) -> Token:
         # Return cached control token if still valid
         if token.control_token is not None and token.control_token_expiry > time.time():
@@ -0,0 +1,309 @@
+"""AsyncVehicleManager.py"""
+
+# pylint:disable=logging-fstring-interpolation,missing-function-docstring,invalid-name
+
+import asyncio
+import contextlib
+import datetime as dt
+import functools
+import logging
+from collections.abc import Awaitable, Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Self
+
+from .ApiImpl import (
+    ApiImpl,
+    ClimateRequestOptions,
+    ForceRefreshPolling,
+    OTPRequest,
+    POIInfo,
+    ScheduleChargingClimateRequestOptions,
+    WindowRequestOptions,
+)
+from .ChangeSet import ChangeSet, vehicle_state
+from .const import DOMAIN, ORDER_STATUS, OTP_NOTIFY_TYPE
+from .exceptions import APIError
+from .Token import Token
+from .Vehicle import Vehicle
+from .VehicleManager import VehicleManager, VehicleUpdateResult
+
+_LOGGER = logging.getLogger(__name__)
+
+_DONE = object()
+
+
+class AsyncVehicleManager:
+    """asyncio front end for VehicleManager.
+
+    Takes the same arguments as VehicleManager (plus ``max_workers``) and
+    exposes awaitable versions of its methods. The region implementations
+    and their payload parsers are shared unchanged: each blocking HTTP
+    exchange runs on a small executor owned by this manager, while every
+    wait between exchanges (the CCS2 wake-up settle time, action status
+    polling) is an ``asyncio.sleep`` that holds no thread.
+    """
+
+    def __init__(self, *args, max_workers: int = 4, **kwargs) -> None:
+        self.manager: VehicleManager = VehicleManager(*args, **kwargs)
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix=f"{DOMAIN}-async"
+        )
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Close the manager and release the executor running the blocking calls."""
+        # Joins background threads that may be mid-request: not on the loop.
+        await self._run(self.manager.close)
+        self._executor.shutdown(wait=False)
+
+    @property
+    def api(self) -> ApiImpl:
+        return self.manager.api
+
+    @property
+    def token(self) -> Token:
+        return self.manager.token
+
+    @property
+    def vehicles(self) -> dict:
+        return self.manager.vehicles
+
+    def get_vehicle(self, vehicle_id: str) -> Vehicle:
+        return self.manager.get_vehicle(vehicle_id)
+
+    def add_change_listener(
+        self, listener: Callable[[ChangeSet], None]
+    ) -> Callable[[], None]:
+        """See VehicleManager.add_change_listener.
+
+        Listeners run on the executor thread of the update; use
+        ``loop.call_soon_threadsafe`` to get back to the event loop.
+        """
+        return self.manager.add_change_listener(listener)
+
+    async def _run(self, func: Callable, *args, **kwargs) -> Any:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, functools.partial(func, *args, **kwargs)
+        )
+
+    async def _for_each_vehicle(
+        self, update: Callable[[Vehicle], Awaitable[tuple[Any, ChangeSet | None]]]
+    ) -> VehicleUpdateResult:
+        """Awaitable counterpart of VehicleManager._for_each_vehicle.
+
+        Vehicles always update concurrently; the executor size bounds the
+        number of HTTP exchanges in flight.
+        """
+        result = VehicleUpdateResult()
+        vehicles = list(self.vehicles.values())
+        outcomes = await asyncio.gather(
+            *(update(vehicle) for vehicle in vehicles),
+            return_exceptions=True,
+        )
+        for vehicle_id, outcome in zip(
+            (vehicle.id for vehicle in vehicles), outcomes, strict=True
+        ):
+            if isinstance(outcome, Exception):
+                _LOGGER.warning(
+                    f"{DOMAIN} - Update of vehicle {vehicle_id} failed: {outcome!r}"
+                )
+                result.errors[vehicle_id] = outcome
+            elif isinstance(outcome, BaseException):
+                raise outcome
+            else:
+                result.add(vehicle_id, *outcome)
+        return result
+
+    async def login(self) -> bool | OTPRequest:
+        return await self._run(self.manager.login)
+
+    async def send_otp(self, notify_type: OTP_NOTIFY_TYPE) -> None:
+        await self._run(self.manager.send_otp, notify_type)
+
+    async def verify_otp_and_complete_login(self, otp_code: str) -> None:
+        await self._run(self.manager.verify_otp_and_complete_login, otp_code)
+
+    async def initialize_vehicles(self) -> None:
+        await self._run(self.manager.initialize_vehicles)
+
+    async def check_and_refresh_token(self) -> bool:
+        return await self._run(self.manager.check_and_refresh_token)
+
+    async def update_all_vehicles_with_cached_state(self) -> VehicleUpdateResult:
+        return await self._for_each_vehicle(
+            functools.partial(self._run, self.manager._update_vehicle_with_cached_state)
+        )
+
+    async def update_vehicle_with_cached_state(self, vehicle_id: str) -> bool:
+        return await self._run(
+            self.manager.update_vehicle_with_cached_state, vehicle_id
+        )
+
+    async def check_and_force_update_vehicles(
+        self, force_refresh_interval: int
+    ) -> VehicleUpdateResult:
+        return await self._for_each_vehicle(
+            functools.partial(
+                self._check_and_force_update_vehicle, force_refresh_interval
+            )
+        )
+
+    async def check_and_force_update_vehicle(
+        self, force_refresh_interval: int, vehicle_id: str
+    ) -> bool:
+        return (
+            await self._check_and_force_update_vehicle(
+                force_refresh_interval, self.get_vehicle(vehicle_id)
+            )
+        )[0]
+
+    async def _check_and_force_update_vehicle(
+        self, force_refresh_interval: int, vehicle: Vehicle
+    ) -> tuple[bool, ChangeSet | None]:
+        if self.manager._needs_force_refresh(force_refresh_interval, vehicle):
+            return True, (await self._force_refresh_vehicle_state(vehicle))[1]
+        return await self._run(self.manager._update_vehicle_with_cached_state, vehicle)
+
+    async def force_refresh_all_vehicles_states(self) -> VehicleUpdateResult:
+        return await self._for_each_vehicle(self._force_refresh_vehicle_state)
+
+    async def force_refresh_vehicle_state(
+        self, vehicle_id: str, polling: ForceRefreshPolling | None = None
+    ) -> None:
+        """Force refresh one vehicle; see VehicleManager.start_force_refresh for ``polling``."""
+        await self._force_refresh_vehicle_state(self.get_vehicle(vehicle_id), polling)
+
+    async def _force_refresh_vehicle_state(
+        self, vehicle: Vehicle, polling: ForceRefreshPolling | None = None
+    ) -> tuple[None, ChangeSet | None]:
+        if not vehicle.enabled:
+            _LOGGER.debug(f"{DOMAIN} - Vehicle Disabled, skipping.")
+            return None, None
+        before = vehicle_state(vehicle)
+        vehicle.last_scanned_at = dt.datetime.now(dt.UTC)
+        steps = self.api.force_refresh_vehicle_state_steps(self.token, vehicle, polling)
+        try:
+            while (delay := await self._run(next, steps, _DONE)) is not _DONE:
+                await asyncio.sleep(delay)
+        finally:
+            # Finalize a cancelled refresh now rather than whenever the GC
+            # collects it. A step still running on the executor cannot be
+            # closed; it ends with that step.
+            with contextlib.suppress(ValueError):
+                steps.close()
+        return None, self.manager._changed(vehicle, before)
+
+    async def check_action_status(
+        self,
+        vehicle_id: str,
+        action_id: str,
+        synchronous: bool = False,
+        timeout: int = 120,
+    ) -> ORDER_STATUS:
+        """See VehicleManager.check_action_status.
+
+        In synchronous mode pending actions are re-checked every
+        ``api.action_status_poll_interval`` seconds without blocking the loop.
+        Regions without a single-shot poll fall back to their own loop on the
+        executor.
+        """
+        interval = self.api.action_status_poll_interval
+        if not synchronous or interval is None:
+            return await self._run(
+                self.manager.check_action_status,
+                vehicle_id,
+                action_id,
+                synchronous,
+                timeout,
+            )
+        if timeout < 1:
+            raise APIError("Timeout must be 1 or higher")
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        while loop.time() < deadline:
+            state = await self._run(
+                self.manager.check_action_status, vehicle_id, action_id
+            )
+            if state != ORDER_STATUS.PENDING:
+                return state
+            await asyncio.sleep(interval)
+        return ORDER_STATUS.TIMEOUT
+
+    async def start_climate(
+        self, vehicle_id: str, options: ClimateRequestOptions
+    ) -> str:
+        return await self._run(self.manager.start_climate, vehicle_id, options)
+
+    async def stop_climate(self, vehicle_id: str) -> str:
+        return await self._run(self.manager.stop_climate, vehicle_id)
+
+    async def lock(self, vehicle_id: str) -> str:
+        return await self._run(self.manager.lock, vehicle_id)
+
+    async def unlock(self, vehicle_id: str) -> str:
+        return await self._run(self.manager.unlock, vehicle_id)
+
+    async def start_charge(self, vehicle_id: str) -> str:
+        return await self._run(self.manager.start_charge, vehicle_id)
+
+    async def stop_charge(self, vehicle_id: str) -> str:
+        return await self._run(self.manager.stop_charge, vehicle_id)
+
+    async def start_hazard_lights(self, vehicle_id: str) -> str:
+        return await self._run(self.manager.start_hazard_lights, vehicle_id)
+
+    async def start_hazard_lights_and_horn(self, vehicle_id: str) -> str:
+        return await self._run(self.manager.start_hazard_lights_and_horn, vehicle_id)
+
+    async def set_charge_limits(self, vehicle_id: str, ac: int, dc: int) -> str:
+        return await self._run(self.manager.set_charge_limits, vehicle_id, ac, dc)
+
+    async def set_charging_current(self, vehicle_id: str, level: int) -> str:
+        return await self._run(self.manager.set_charging_current, vehicle_id, level)
+
+    async def set_windows_state(
+        self, vehicle_id: str, options: WindowRequestOptions
+    ) -> str:
+        return await self._run(self.manager.set_windows_state, vehicle_id, options)
+
+    async def open_charge_port(self, vehicle_id: str) -> str:
+        return await self._run(self.manager.open_charge_port, vehicle_id)
+
+    async def close_charge_port(self, vehicle_id: str) -> str:
+        return await self._run(self.manager.close_charge_port, vehicle_id)
+
+    async def update_month_trip_info(self, vehicle_id: str, yyyymm_string: str) -> None:
+        await self._run(self.manager.update_month_trip_info, vehicle_id, yyyymm_string)
+
+    async def update_day_trip_info(self, vehicle_id: str, yyyymmdd_string: str) -> None:
+        await self._run(self.manager.update_day_trip_info, vehicle_id, yyyymmdd_string)
+
+    async def schedule_charging_and_climate(
+        self, vehicle_id: str, options: ScheduleChargingClimateRequestOptions
+    ) -> str:
+        return await self._run(
+            self.manager.schedule_charging_and_climate, vehicle_id, options
+        )
+
+    async def start_valet_mode(self, vehicle_id: str) -> str:
+        return await self._run(self.manager.start_valet_mode, vehicle_id)
+
+    async def stop_valet_mode(self, vehicle_id: str) -> str:
+        return await self._run(self.manager.stop_valet_mode, vehicle_id)
+
+    async def set_vehicle_to_load_discharge_limit(
+        self, vehicle_id: str, limit: int
+    ) -> str:
+        return await self._run(
+            self.manager.set_vehicle_to_load_discharge_limit, vehicle_id, limit
+        )
+
+    async def set_navigation(self, vehicle_id: str, poi_list: list[POIInfo]) -> str:
+        return await self._run(self.manager.set_navigation, vehicle_id, poi_list)
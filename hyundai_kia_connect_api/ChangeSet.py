@@ -0,0 +1,78 @@
+"""ChangeSet.py"""
+
+import dataclasses
+from dataclasses import dataclass, field
+from operator import attrgetter
+from typing import Any
+
+from .Vehicle import Vehicle
+
+# Public Vehicle fields that are not vehicle state: the raw payload, how it is
+# kept, and when the manager last asked for an update.
+_UNTRACKED = {"data", "raw_data_retention", "last_scanned_at"}
+
+# Public fields and properties compared by ChangeSet.
+TRACKED_FIELDS: tuple[str, ...] = tuple(
+    sorted(
+        {
+            f.name
+            for f in dataclasses.fields(Vehicle)
+            if not f.name.startswith("_") and f.name not in _UNTRACKED
+        }
+        | {
+            name
+            for name, value in vars(Vehicle).items()
+            if isinstance(value, property)
+            and not name.startswith("_")
+            and name not in _UNTRACKED
+        }
+    )
+)
+
+_tracked_values = attrgetter(*TRACKED_FIELDS)
+
+
+def vehicle_state(vehicle: Vehicle) -> tuple:
+    """The values of TRACKED_FIELDS, to pass to ChangeSet.since later."""
+    return _tracked_values(vehicle)
+
+
+@dataclass
+class ChangeSet:
+    """Fields of a vehicle changed by one update, as field -> (old, new).
+
+    Empty (and false) when the update left every tracked field as it was.
+    """
+
+    vehicle_id: str
+    changes: dict[str, tuple[Any, Any]] = field(default_factory=dict)
+
+    @classmethod
+    def since(cls, vehicle: Vehicle, before: tuple) -> "ChangeSet":
+        """Compare the vehicle with a ``vehicle_state`` taken before an update."""
+        after = _tracked_values(vehicle)
+        change_set = cls(vehicle.id)
+        if after == before:
+            return change_set
+        for name, old, new in zip(TRACKED_FIELDS, before, after, strict=True):
+            if old is not new and old != new:
+                change_set.changes[name] = (old, new)
+        return change_set
+
+    def __bool__(self) -> bool:
+        return bool(self.changes)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.changes
+
+    def __iter__(self):
+        return iter(self.changes)
+
+    def __len__(self) -> int:
+        return len(self.changes)
+
+    def old(self, name: str) -> Any:
+        return self.changes[name][0]
+
+    def new(self, name: str) -> Any:
+        return self.changes[name][1]
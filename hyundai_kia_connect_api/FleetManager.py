@@ -0,0 +1,255 @@
+"""FleetManager.py"""
+
+# pylint:disable=logging-fstring-interpolation,invalid-name,broad-exception-caught
+
+import logging
+import threading
+import time
+from collections import Counter, deque
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .const import DOMAIN
+from .VehicleManager import VehicleManager, VehicleUpdateResult
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass
+class FleetStats:
+    """Aggregate counters of a FleetManager since it was created."""
+
+    completed: int = 0
+    failed: int = 0
+    running: int = 0
+    queued: int = 0
+    elapsed: float = 0.0
+
+    @property
+    def throughput(self) -> float:
+        """Finished tasks (completed or failed) per second."""
+        if self.elapsed <= 0:
+            return 0.0
+        return (self.completed + self.failed) / self.elapsed
+
+
+@dataclass
+class _Task:
+    account_id: str
+    manager: VehicleManager
+    host: tuple[int, int]
+    func: Callable[[VehicleManager], Any]
+    future: Future
+
+
+class FleetManager:
+    """Runs many VehicleManager accounts on one bounded worker pool.
+
+    Accounts are built through VehicleManager (and so its
+    ``get_implementation_by_region_brand`` factory). Accounts of the same
+    region and brand talk to the same API host, so their sessions are mounted
+    with a shared adapter and share its connection pools; region specific
+    adapters (the USA TLS adapters) are shared as they are.
+
+    Work submitted for an account runs on the fleet's worker pool once a slot
+    is free for the account (``max_concurrent_per_account``) and for its
+    host (``max_concurrent_per_host``); until then it waits in a FIFO queue
+    without holding a worker.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 16,
+        max_concurrent_per_account: int = 1,
+        max_concurrent_per_host: int = 8,
+    ) -> None:
+        self.max_concurrent_per_account = max_concurrent_per_account
+        self.max_concurrent_per_host = max_concurrent_per_host
+        self.accounts: dict[str, VehicleManager] = {}
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix=f"{DOMAIN}-fleet"
+        )
+        self._adapters: dict[tuple[tuple[int, int], str], HTTPAdapter] = {}
+        self._lock = threading.Lock()
+        self._queue: deque[_Task] = deque()
+        self._running_per_account: Counter = Counter()
+        self._running_per_host: Counter = Counter()
+        self._completed = 0
+        self._failed = 0
+        self._started_at = time.monotonic()
+        self._closed = False
+
+    def add_account(
+        self,
+        account_id: str,
+        region: int,
+        brand: int,
+        username: str,
+        password: str,
+        pin: str,
+        **kwargs,
+    ) -> VehicleManager:
+        """Create the VehicleManager of an account; kwargs go to its constructor."""
+        if account_id in self.accounts:
+            raise ValueError(f"Account {account_id} already exists")
+        manager = VehicleManager(
+            region=region,
+            brand=brand,
+            username=username,
+            password=password,
+            pin=pin,
+            **kwargs,
+        )
+        self._share_connection_pools(manager)
+        self.accounts[account_id] = manager
+        return manager
+
+    def remove_account(self, account_id: str) -> VehicleManager:
+        """Remove an account, cancel its queued work and close its manager."""
+        manager = self.accounts.pop(account_id)
+        with self._lock:
+            queued = [task for task in self._queue if task.account_id == account_id]
+        for task in queued:
+            task.future.cancel()
+        manager.close()
+        return manager
+
+    def get_account(self, account_id: str) -> VehicleManager:
+        return self.accounts[account_id]
+
+    def _share_connection_pools(self, manager: VehicleManager) -> None:
+        host = (manager.region, manager.brand)
+        for name in ("session", "sessions"):
+            session = getattr(manager.api, name, None)
+            if not isinstance(session, requests.Session):
+                continue
+            for prefix, adapter in list(session.adapters.items()):
+                with self._lock:
+                    shared = self._adapters.get((host, prefix))
+                    if shared is None:
+                        shared = self._adapters[(host, prefix)] = self._pool_adapter(
+                            adapter
+                        )
+                session.mount(prefix, shared)
+
+    def _pool_adapter(self, adapter: HTTPAdapter) -> HTTPAdapter:
+        if type(adapter) is not HTTPAdapter:
+            # Region specific adapter (custom TLS setup): share it as is.
+            return adapter
+        return HTTPAdapter(pool_maxsize=self.max_concurrent_per_host)
+
+    def submit(self, account_id: str, func: Callable[[VehicleManager], Any]) -> Future:
+        """Run ``func(manager)`` for an account within the concurrency caps."""
+        manager = self.accounts[account_id]
+        task = _Task(
+            account_id, manager, (manager.region, manager.brand), func, Future()
+        )
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("FleetManager is shut down")
+            self._queue.append(task)
+        self._dispatch()
+        return task.future
+
+    def _dispatch(self) -> None:
+        ready = []
+        with self._lock:
+            waiting = deque()
+            while self._queue:
+                task = self._queue.popleft()
+                if task.future.cancelled():
+                    continue
+                if (
+                    self._running_per_account[task.account_id]
+                    >= self.max_concurrent_per_account
+                    or self._running_per_host[task.host] >= self.max_concurrent_per_host
+                ):
+                    waiting.append(task)
+                    continue
+                self._running_per_account[task.account_id] += 1
+                self._running_per_host[task.host] += 1
+                ready.append(task)
+            self._queue = waiting
+        for task in ready:
+            self._executor.submit(self._run, task)
+
+    def _run(self, task: _Task) -> None:
+        try:
+            if task.future.set_running_or_notify_cancel():
+                try:
+                    result = task.func(task.manager)
+                except BaseException as err:
+                    _LOGGER.warning(
+                        f"{DOMAIN} - Fleet task for account {task.account_id} "
+                        f"failed: {err!r}"
+                    )
+                    with self._lock:
+                        self._failed += 1
+                    # Settle the future first: nothing else would.
+                    task.future.set_exception(err)
+                    if not isinstance(err, Exception):
+                        raise
+                else:
+                    with self._lock:
+                        self._completed += 1
+                    task.future.set_result(result)
+        finally:
+            with self._lock:
+                self._running_per_account[task.account_id] -= 1
+                self._running_per_host[task.host] -= 1
+            self._dispatch()
+
+    def update_all_accounts(self) -> dict[str, Future]:
+        """Refresh the token and cached state of every account.
+
+        Returns a Future per account resolving to its VehicleUpdateResult.
+        """
+        return {
+            account_id: self.submit(account_id, _update_with_cached_state)
+            for account_id in self.accounts
+        }
+
+    def check_and_force_update_all_accounts(
+        self, force_refresh_interval: int
+    ) -> dict[str, Future]:
+        """Like update_all_accounts, force refreshing vehicles that are due."""
+
+        def update(manager: VehicleManager) -> VehicleUpdateResult:
+            manager.check_and_refresh_token()
+            return manager.check_and_force_update_vehicles(force_refresh_interval)
+
+        return {
+            account_id: self.submit(account_id, update) for account_id in self.accounts
+        }
+
+    @property
+    def stats(self) -> FleetStats:
+        with self._lock:
+            return FleetStats(
+                completed=self._completed,
+                failed=self._failed,
+                running=sum(self._running_per_account.values()),
+                queued=len(self._queue),
+                elapsed=time.monotonic() - self._started_at,
+            )
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Cancel queued work, stop the worker pool and close the accounts."""
+        with self._lock:
+            self._closed = True
+            queued, self._queue = self._queue, deque()
+        for task in queued:
+            task.future.cancel()
+        self._executor.shutdown(wait=wait)
+        for manager in self.accounts.values():
+            manager.close()
+
+
+def _update_with_cached_state(manager: VehicleManager) -> VehicleUpdateResult:
+    manager.check_and_refresh_token()
+    return manager.update_all_vehicles_with_cached_state()
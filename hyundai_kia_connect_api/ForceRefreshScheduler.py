@@ -0,0 +1,112 @@
+"""ForceRefreshScheduler.py"""
+
+# pylint:disable=logging-fstring-interpolation,invalid-name
+
+import heapq
+import itertools
+import logging
+import threading
+import time
+from collections.abc import Iterator
+from concurrent.futures import Future
+from typing import Any
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def _close(steps: Iterator[float]) -> None:
+    close = getattr(steps, "close", None)
+    if close is not None:
+        close()
+
+
+class ForceRefreshScheduler:
+    """Drives force-refresh step generators from a single background thread.
+
+    ``submit`` takes the generator returned by
+    ``ApiImpl.force_refresh_vehicle_state_steps`` and returns a Future at once.
+    The scheduler thread advances each generator (one short blocking HTTP step
+    at a time) and re-queues it for the delay it yields, so any number of
+    woken cars can be waiting for their data without holding a thread each.
+    """
+
+    def __init__(self) -> None:
+        self._queue: list[tuple[float, int, Iterator[float], Future, Any]] = []
+        self._counter = itertools.count()
+        self._condition = threading.Condition()
+        self._thread: threading.Thread | None = None
+        self._closed = False
+
+    def submit(self, steps: Iterator[float], result: Any = None) -> Future:
+        """Schedule ``steps``; the Future resolves to ``result`` when they finish."""
+        future = Future()
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("ForceRefreshScheduler is shut down")
+            self._push(time.monotonic(), steps, future, result)
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name=f"{DOMAIN}-force-refresh", daemon=True
+                )
+                self._thread.start()
+        return future
+
+    @property
+    def pending(self) -> int:
+        with self._condition:
+            return len(self._queue)
+
+    def shutdown(self, cancel_pending: bool = True) -> None:
+        """Stop the scheduler thread, cancelling refreshes still in flight."""
+        with self._condition:
+            self._closed = True
+            queue, self._queue = self._queue, []
+            self._condition.notify_all()
+            thread = self._thread
+        for _, _, steps, future, _ in queue:
+            _close(steps)
+            if cancel_pending:
+                future.cancel()
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+
+    def _push(self, due: float, steps, future: Future, result: Any) -> None:
+        heapq.heappush(self._queue, (due, next(self._counter), steps, future, result))
+        self._condition.notify()
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while not self._closed:
+                    if self._queue:
+                        wait = self._queue[0][0] - time.monotonic()
+                        if wait <= 0:
+                            break
+                        self._condition.wait(wait)
+                    else:
+                        self._condition.wait()
+                if self._closed:
+                    return
+                _, _, steps, future, result = heapq.heappop(self._queue)
+
+            if future.cancelled():
+                _close(steps)
+                continue
+            try:
+                delay = next(steps)
+            except StopIteration:
+                if not future.cancelled():
+                    future.set_result(result)
+            except Exception as err:
+                _LOGGER.debug(f"{DOMAIN} - Scheduled force refresh failed: {err!r}")
+                if not future.cancelled():
+                    future.set_exception(err)
+            else:
+                with self._condition:
+                    if self._closed:
+                        _close(steps)
+                        future.cancel()
+                    else:
+                        self._push(time.monotonic() + delay, steps, future, result)
@@ -5,13 +5,19 @@
 import datetime as dt
 import logging
 import typing as ty
+from collections.abc import Iterator
 from datetime import timedelta
 from time import sleep
 from urllib.parse import parse_qs, urljoin, urlparse
 
 from requests import Response
 
-from .ApiImpl import ApiImplSession, ClimateRequestOptions, WindowRequestOptions
+from .ApiImpl import (
+    ApiImplSession,
+    ClimateRequestOptions,
+    ForceRefreshPolling,
+    WindowRequestOptions,
+)
 from .ApiImplType1 import ApiImplType1
 from .const import (
     BRAND_HYUNDAI,
@@ -325,9 +331,18 @@ class HyundaiBlueLinkApiBR(ApiImplType1):
     def update_vehicle_with_cached_state(self, token: Token, vehicle: Vehicle) -> None:
         """Update with the server-cached CCS2 state (does not wake the car)."""
         state = self._get_cached_vehicle_state(token, vehicle)
-        self._update_vehicle_properties_ccs2(vehicle, state)
+        self._apply_state(vehicle, state, self._update_vehicle_properties_ccs2)
 
     def force_refresh_vehicle_state(self, token: Token, vehicle: Vehicle) -> None:
+        for delay in self.force_refresh_vehicle_state_steps(token, vehicle):
+            sleep(delay)
+
+    def force_refresh_vehicle_state_steps(
+        self,
+        token: Token,
+        vehicle: Vehicle,
+        polling: ForceRefreshPolling | None = None,
+    ) -> Iterator[float]:
         """Force a fresh reading from the vehicle (wakes the car).
 
         BR CCS2 force is asynchronous: ``GET /ccs2/carstatus`` only acknowledges,
@@ -336,6 +351,8 @@ class HyundaiBlueLinkApiBR(ApiImplType1):
         snapshot's ``lastUpdateTime`` did not advance, the car did not report in
         time — do not apply stale data; raise so the coordinator surfaces
         ``UpdateFailed`` and entities go unavailable until the next poll.
+
+        Without ``polling`` the snapshot is read once, 25 s after the wake.
         """
         headers = self._get_authenticated_headers(token)
         latest_url = self._build_api_url(
@@ -343,26 +360,38 @@ class HyundaiBlueLinkApiBR(ApiImplType1):
         )
         trigger_url = self._build_api_url(f"/spa/vehicles/{vehicle.id}/ccs2/carstatus")
 
-        # Baseline: current cached lastUpdateTime before waking.
-        pre = self.session.get(latest_url, headers=headers)
-        pre.raise_for_status()
-        baseline_ts = pre.json()["resMsg"].get("lastUpdateTime")
-
-        # Wake the vehicle; errors propagate so a failed wake does not fall
-        # through to a stale /latest apply.
-        self.session.get(trigger_url, headers=headers).raise_for_status()
-        sleep(25)
-
-        response = self.session.get(latest_url, headers=headers)
-        response.raise_for_status()
-        resmsg = response.json()["resMsg"]
-        if resmsg.get("lastUpdateTime") == baseline_ts:
+        def read_latest() -> dict:
+            response = self.session.get(latest_url, headers=headers)
+            response.raise_for_status()
+            return response.json()["resMsg"]
+
+        def wake() -> None:
+            # Errors propagate so a failed wake does not fall through to a
+            # stale /latest apply.
+            self.session.get(trigger_url, headers=headers).raise_for_status()
+
+        resmsg, fresh = yield from self._poll_for_fresh_state(
+            polling or ForceRefreshPolling(initial_delay=25, timeout=0),
+            wake=wake,
+            read_latest=read_latest,
+            timestamp_of=lambda r: r.get("lastUpdateTime"),
+        )
+        if not fresh:
             raise APIError(
                 "Brazilian Hyundai force refresh did not return fresh data "
                 "in time; vehicle may be unreachable."
             )
         self._update_vehicle_properties_ccs2(vehicle, resmsg["state"]["Vehicle"])
 
+    def refresh_control_token(self, token: Token) -> bool:
+        if not token.pin:
+            return False
+        token.control_token_expires_at = None
+        self._ensure_control_token(token)
+        # Mirror the expiry in the shared field the token renewer schedules on.
+        token.control_token_expiry = token.control_token_expires_at.timestamp()
+        return True
+
     def _ensure_control_token(self, token: Token) -> str:
         """Ensure we have a valid control token for remote commands."""
         control_token = getattr(token, "control_token", None)
@@ -454,6 +483,12 @@ class HyundaiBlueLinkApiBR(ApiImplType1):
 
             return ORDER_STATUS.TIMEOUT
 
+        return self.check_action_statuses(token, vehicle, [action_id])[action_id]
+
+    def check_action_statuses(
+        self, token: Token, vehicle: Vehicle, action_ids: list[str]
+    ) -> dict[str, ORDER_STATUS]:
+        """Status of several remote commands from one fetch of the records."""
         url = self._build_api_url(f"/spa/notifications/{vehicle.id}/records")
         headers = self._get_authenticated_headers(token)
 
@@ -462,21 +497,26 @@ class HyundaiBlueLinkApiBR(ApiImplType1):
         data = response.json()
         _LOGGER.debug(f"{DOMAIN} - Action status response: %s", data)
 
-        records = data.get("resMsg", [])
-        for record in records:
-            if record.get("recordId") != action_id:
-                continue
-
-            result = (record.get("result") or "").lower()
-            if result == "success":
-                return ORDER_STATUS.SUCCESS
-            if result == "fail":
-                return ORDER_STATUS.FAILED
-            if result == "non-response":
-                return ORDER_STATUS.TIMEOUT
-            if result in ("", "pending", None):
-                return ORDER_STATUS.PENDING
+        records = {}
+        for record in data.get("resMsg", []):
+            records.setdefault(record.get("recordId"), record)
+        return {
+            action_id: self._action_record_status(records.get(action_id))
+            for action_id in action_ids
+        }
 
+    def _action_record_status(self, record: dict | None) -> ORDER_STATUS:
+        if record is None:
+            return ORDER_STATUS.UNKNOWN
+        result = (record.get("result") or "").lower()
+        if result == "success":
+            return ORDER_STATUS.SUCCESS
+        if result == "fail":
+            return ORDER_STATUS.FAILED
+        if result == "non-response":
+            return ORDER_STATUS.TIMEOUT
+        if result in ("", "pending", None):
+            return ORDER_STATUS.PENDING
         return ORDER_STATUS.UNKNOWN
 
     def set_windows_state(
@@ -4,6 +4,7 @@
 
 import datetime as dt
 import logging
+import threading
 import time
 from typing import ClassVar
 
@@ -144,12 +145,20 @@ class HyundaiBlueLinkApiUSA(ApiImpl):
     _action_service_types: ClassVar[dict[str, str]] = {}
 
     # Cached enrollment/details response. Capabilities, seat configs,
-    # generation and model rarely change, so the response is cached for
-    # the instance lifetime. get_vehicles force-refreshes (vehicle list
-    # can change); _get_vehicle_details uses the cache.
+    # generation and model rarely change, so polls reuse the response and
+    # refresh it in the background once it is enrollment_ttl seconds old.
+    # get_vehicles force-refreshes (vehicle list can change) and login
+    # drops it.
+    enrollment_ttl: float = 3600
     _enrollment_details_cache: dict | None = None
+    _enrollment_fetched_at: float = 0.0
+    # Bumped by invalidate_enrollment_details, so a fetch started before an
+    # auth change does not store the previous session's response.
+    _enrollment_generation: int = 0
+    _enrollment_refresh: threading.Thread | None = None
 
     def __init__(self, region: int, brand: int, language: str):
+        self._enrollment_lock = threading.Lock()
         self.LANGUAGE: str = language
         self.BASE_URL: str = "api.telematics.hyundaiusa.com"
         self.LOGIN_API: str = "https://" + self.BASE_URL + "/v2/ac/"
@@ -232,6 +241,7 @@ class HyundaiBlueLinkApiUSA(ApiImpl):
 
         valid_until = dt.datetime.now(dt.UTC) + dt.timedelta(seconds=expires_in)
 
+        self.invalidate_enrollment_details()
         return Token(
             username=username,
             password=password,
@@ -252,6 +262,11 @@ class HyundaiBlueLinkApiUSA(ApiImpl):
         "password required"). Falls back to full login if the refresh
         token is missing or the exchange fails.
 
+        A successful refresh keeps the cached enrollment details: the
+        refreshed token belongs to the same account, and enrollment details
+        are per account rather than per access token. Only the fallback
+        login, which may authenticate a different account, drops them.
+
         Confirmed working live (2026-06-22, issue #1186): ~0.02s refresh
         vs ~0.74s full login, refresh_token rotates, expires_in ~1800s.
         """
@@ -305,12 +320,21 @@ class HyundaiBlueLinkApiUSA(ApiImpl):
         """Return enrollment details for the account, cached on the instance.
 
         Capabilities, seat configs, generation and model change rarely, so
-        the response is cached for the instance lifetime. ``get_vehicles``
-        forces a refresh (the vehicle list can change); ``_get_vehicle_details``
-        uses the cache.
+        the cached response is returned even once it is older than
+        ``enrollment_ttl``; it is then refreshed in the background, so polls
+        never wait on enrollment and changes show up within the TTL plus one
+        poll. ``get_vehicles`` forces a refresh (the vehicle list can change);
+        ``_get_vehicle_details`` uses the cache.
         """
-        if self._enrollment_details_cache is not None and not force_refresh:
-            return self._enrollment_details_cache
+        cached = self._enrollment_details_cache
+        if cached is None or force_refresh:
+            return self._fetch_enrollment_details(token)
+        if time.monotonic() - self._enrollment_fetched_at > self.enrollment_ttl:
+            self._refresh_enrollment_details_in_background(token)
+        return cached
+
+    def _fetch_enrollment_details(self, token: Token) -> dict:
+        generation = self._enrollment_generation
         url = self.API_URL + "enrollment/details/" + token.username
         headers = self._get_authenticated_headers(token)
         response = self.session.get(url, headers=headers)
@@ -319,9 +343,39 @@ class HyundaiBlueLinkApiUSA(ApiImpl):
         _check_response_for_errors(response_json)
         if "enrolledVehicleDetails" not in response_json:
             raise AuthenticationError("Missing enrolledVehicleDetails in response")
-        self._enrollment_details_cache = response_json
+        with self._enrollment_lock:
+            if generation == self._enrollment_generation:
+                self._enrollment_details_cache = response_json
+                self._enrollment_fetched_at = time.monotonic()
         return response_json
 
+    def _refresh_enrollment_details_in_background(self, token: Token) -> None:
+        with self._enrollment_lock:
+            if self._enrollment_refresh is not None and (
+                self._enrollment_refresh.is_alive()
+            ):
+                return
+            self._enrollment_refresh = threading.Thread(
+                target=self._refresh_enrollment_details,
+                args=(token,),
+                name=f"{DOMAIN}-enrollment",
+                daemon=True,
+            )
+            self._enrollment_refresh.start()
+
+    def _refresh_enrollment_details(self, token: Token) -> None:
+        try:
+            self._fetch_enrollment_details(token)
+        except Exception as err:
+            # Keep serving the cached copy; the next poll tries again.
+            _LOGGER.warning(f"{DOMAIN} - Enrollment details refresh failed: {err!r}")
+
+    def invalidate_enrollment_details(self) -> None:
+        """Drop the cached enrollment details, e.g. after an auth change."""
+        with self._enrollment_lock:
+            self._enrollment_generation += 1
+            self._enrollment_details_cache = None
+
     def _get_vehicle_details(self, token: Token, vehicle: Vehicle):
         response = self._get_enrollment_details(token)
         for entry in response["enrolledVehicleDetails"]:
@@ -726,8 +780,9 @@ class HyundaiBlueLinkApiUSA(ApiImpl):
             trips.append(processed_trip)
 
         _LOGGER.debug(f"_update_vehicle_properties filled_trips: {trips}")
-        if len(trips) > 0:
-            state["filled_trips"] = trips
+        # Kept on the vehicle rather than in vehicle.data, which may be
+        # dropped (RAW_DATA_RETENTION.DROP).
+        vehicle._filled_trips = trips or None
 
         vehicle.data = state
 
@@ -748,12 +803,11 @@ class HyundaiBlueLinkApiUSA(ApiImpl):
         _LOGGER.debug(f"update_month_trip_info: {yyyymm_string}")
         vehicle.month_trip_info = None
 
-        if vehicle.data is None or "filled_trips" not in vehicle.data:
-            _LOGGER.debug(f"filled_trips is empty: {vehicle.data}")
+        trips = vehicle._filled_trips
+        if not trips:
+            _LOGGER.debug("filled_trips is empty")
             return  # nothing to fill
 
-        trips = vehicle.data["filled_trips"]
-
         month_trip_info: MonthTripInfo = None
         month_trip_info_count = 0
 
@@ -821,11 +875,10 @@ class HyundaiBlueLinkApiUSA(ApiImpl):
         _LOGGER.debug(f"update_day_trip_info: {yyyymmdd_string}")
         vehicle.day_trip_info = None
 
-        if vehicle.data is None or "filled_trips" not in vehicle.data:
-            _LOGGER.debug(f"filled_trips is empty: {vehicle.data}")
+        trips = vehicle._filled_trips
+        if not trips:
+            _LOGGER.debug("filled_trips is empty")
             return  # nothing to fill
-
-        trips = vehicle.data["filled_trips"]
         _LOGGER.debug(f"filled_trips: {trips}")
 
         day_trip_info: DayTripInfo = None
@@ -909,7 +962,7 @@ class HyundaiBlueLinkApiUSA(ApiImpl):
                     f"{DOMAIN} - update_vehicle_with_cached_state Location fallback"
                 )
 
-        self._update_vehicle_properties(vehicle, state)
+        self._apply_state(vehicle, state, self._update_vehicle_properties)
 
     def force_refresh_vehicle_state(self, token: Token, vehicle: Vehicle) -> None:
         state = {}
@@ -150,7 +150,7 @@ class KiaUvoApiAU(ApiImplType1):
 
         if is_ccs2:
             state = response["resMsg"]["state"]["Vehicle"]
-            self._update_vehicle_properties_ccs2(vehicle, state)
+            self._apply_state(vehicle, state, self._update_vehicle_properties_ccs2)
             # The CCS2 status response embeds a stale cached location.
             # Override it with the more current /location/park endpoint.
             location = self._get_location(token, vehicle)
@@ -164,18 +164,19 @@ class KiaUvoApiAU(ApiImplType1):
                 )
         else:
             location = self._get_location(token, vehicle)
-            self._update_vehicle_properties(
+            self._apply_state(
                 vehicle,
                 {
                     "status": response["resMsg"],
                     "vehicleLocation": location,
                 },
+                self._update_vehicle_properties,
             )
 
         if (
             vehicle.engine_type == ENGINE_TYPES.EV
             or vehicle.engine_type == ENGINE_TYPES.PHEV
-        ):
+        ) and self._driving_info_due(vehicle):
             try:
                 state = self._get_driving_info(token, vehicle)
             except Exception as e:
@@ -192,6 +193,7 @@ class KiaUvoApiAU(ApiImplType1):
                 )
             else:
                 self._update_vehicle_drive_info(vehicle, state)
+                self._driving_info_read(vehicle)
 
     def force_refresh_vehicle_state(self, token: Token, vehicle: Vehicle) -> None:
         is_ccs2 = vehicle.ccu_ccs2_protocol_support != 0
@@ -229,6 +231,7 @@ class KiaUvoApiAU(ApiImplType1):
                 )
             else:
                 self._update_vehicle_drive_info(vehicle, state)
+                self._driving_info_read(vehicle)
 
     def _force_refresh_vehicle_state_ccs2(self, token: Token, vehicle: Vehicle) -> None:
         url = self.SPA_API_URL + "vehicles/" + vehicle.id + "/ccs2/carstatus"
@@ -702,21 +705,12 @@ class KiaUvoApiAU(ApiImplType1):
         _check_response_for_errors(response)
         return response
 
-    def update_month_trip_info(
+    def get_month_trip_info(
         self,
-        token,
-        vehicle,
-        yyyymm_string,
-    ) -> None:
-        """
-        feature only available for some regions.
-        Updates the vehicle.month_trip_info for the specified month.
-
-        Default this information is None:
-
-        month_trip_info: MonthTripInfo = None
-        """
-        vehicle.month_trip_info = None
+        token: Token,
+        vehicle: Vehicle,
+        yyyymm_string: str,
+    ) -> MonthTripInfo | None:
         json_result = self._get_trip_info(
             token,
             vehicle,
@@ -744,23 +738,14 @@ class KiaUvoApiAU(ApiImplType1):
                 )
                 result.day_list.append(processed_day)
 
-            vehicle.month_trip_info = result
+            return result
 
-    def update_day_trip_info(
+    def get_day_trip_info(
         self,
-        token,
-        vehicle,
-        yyyymmdd_string,
-    ) -> None:
-        """
-        feature only available for some regions.
-        Updates the vehicle.day_trip_info information for the specified day.
-
-        Default this information is None:
-
-        day_trip_info: DayTripInfo = None
-        """
-        vehicle.day_trip_info = None
+        token: Token,
+        vehicle: Vehicle,
+        yyyymmdd_string: str,
+    ) -> DayTripInfo | None:
         json_result = self._get_trip_info(
             token,
             vehicle,
@@ -791,7 +776,7 @@ class KiaUvoApiAU(ApiImplType1):
                     max_speed=trip["tripMaxSpeed"],
                 )
                 result.trip_list.append(processed_trip)
-            vehicle.day_trip_info = result
+            return result
 
     def _get_driving_info(self, token: Token, vehicle: Vehicle) -> dict:
         url = self.SPA_API_URL + "vehicles/" + vehicle.id + "/drvhistory"
@@ -4,11 +4,14 @@
 
 import base64
 import datetime as dt
+import functools
 import json
 import logging
 import platform
+import re
 import time
 import uuid
+from collections.abc import Callable
 from zoneinfo import ZoneInfo
 
 import requests
@@ -94,12 +97,36 @@ class RetrySession(requests.Session):
         raise last_exception
 
 
+# Errors refusing a request's authorization: authentication expired, access
+# token deleted and access token IP validation (see test_token).
+_PIN_TOKEN_ERRORS = {"7403", "7602", "7606"}
+# The codes of a wrong or expired PIN authorization are not documented, so
+# those are recognised by their description.
+_PIN_ERROR = re.compile(r"\bpin\b|pauth", re.IGNORECASE)
+
+
+def _store_raw(vehicle: Vehicle, raw: dict | None, key: str, value: dict) -> None:
+    """Keep ``value`` under ``key`` of vehicle.data, or of ``raw`` if given."""
+    if raw is None:
+        vehicle.data = {**(vehicle.data or {}), key: value}
+    else:
+        raw[key] = value
+
+
 class KiaUvoApiCA(ApiImpl):
     """KiaUvoApiCA"""
 
     temperature_range_c_old = tuple(x * 0.5 for x in range(32, 64))
     temperature_range_c_new = tuple(x * 0.5 for x in range(28, 64))
     temperature_range_model_year = 2020
+    action_status_poll_interval: float = 10
+    # vrfypin returns the pAuth without an expiry. Five minutes covers a
+    # command and the rmtsts polls that follow it (action_status_poll_interval
+    # apart) with one PIN verification, while keeping the PIN authorization
+    # short-lived. Should the server expire it earlier, the error drops it
+    # (see _forget_pin_token_on_error) and the next request verifies the PIN
+    # again.
+    pin_token_lifetime: float = 300
 
     def __init__(self, region: int, brand: int, language: str) -> None:
         self.LANGUAGE: str = language
@@ -112,6 +139,8 @@ class KiaUvoApiCA(ApiImpl):
             self.BASE_URL: str = "genesisconnect.ca"
 
         self.old_vehicle_status = {}
+        # vehicle id -> (access token, pAuth, expiry in time.monotonic() terms)
+        self._pin_tokens: dict[str, tuple[str, str, float]] = {}
         self.API_URL: str = "https://" + self.BASE_URL + "/tods/api/"
         self.API_HEADERS = {
             "User-Agent": "Mozilla/5.0 (Linux; Android 10; K) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/130.0.0.0 Mobile Safari/537.36",
@@ -470,32 +499,100 @@ class KiaUvoApiCA(ApiImpl):
         return result
 
     def update_vehicle_with_cached_state(self, token: Token, vehicle: Vehicle) -> None:
-        state = self._get_cached_vehicle_state(token, vehicle)
-        self._update_vehicle_properties_base(vehicle, state)
+        self._update_vehicle_state(token, vehicle, self._get_cached_vehicle_state)
+
+    def force_refresh_vehicle_state(self, token: Token, vehicle: Vehicle) -> None:
+        self._update_vehicle_state(
+            token,
+            vehicle,
+            self._get_forced_vehicle_state,
+            self._guess_vehicle_timezone,
+        )
+
+    def _update_vehicle_state(
+        self,
+        token: Token,
+        vehicle: Vehicle,
+        get_state: Callable[[Token, Vehicle], dict],
+        on_state: Callable[[Vehicle, dict], None] | None = None,
+    ) -> None:
+        """Fetch and apply status, service, charge limits and EV trip details.
+
+        Only the location read depends on another response (it is skipped
+        when the service odometer has not advanced), so every other endpoint
+        is requested up front via _run_parallel and the location, if needed,
+        follows as a second step. Results are applied in the historical order.
+        """
+        is_ev = vehicle.engine_type == ENGINE_TYPES.EV
+        started = time.monotonic()
+        previous_update = vehicle.last_updated_at
+        # Create the lazily-built session before worker threads can race on it.
+        self.sessions  # noqa: B018
+
+        def get_service() -> dict:
+            return self._get_next_service(token, vehicle)
+
+        calls = [
+            lambda: get_state(token, vehicle),
+            lambda: self._cached_response("next_service", vehicle, get_service),
+        ]
+        if is_ev:
+            calls += [
+                lambda: self._cached_response(
+                    "charge_limits",
+                    vehicle,
+                    lambda: self._get_charge_limits(token, vehicle),
+                ),
+                lambda: self._get_trip_details(token, vehicle),
+            ]
+        # The raw status, service and location responses, merged into
+        # vehicle.data in one write: under RAW_DATA_RETENTION.COMPRESS each
+        # write decodes and compresses the whole payload.
+        raw: dict = {}
+        with self._parallel_requests(*calls) as futures:
+            state = futures[0].result()
+            if on_state is not None:
+                on_state(vehicle, state)
+            self._apply_state(
+                vehicle,
+                state,
+                functools.partial(self._update_vehicle_properties_base, raw=raw),
+            )
 
-        # Service Status Call
-        service = self._get_next_service(token, vehicle)
+            # Service Status Call
+            service = futures[1].result()
+            if (
+                self.response_cache is not None
+                and vehicle.last_updated_at != previous_update
+            ):
+                # The car has reported since the last update, so its odometer may
+                # have moved: only a service response from this update will do.
+                service = self._cached_response(
+                    "next_service", vehicle, get_service, time.monotonic() - started
+                )
 
-        # Get location if the car has moved since last call
-        if vehicle.odometer:
-            if vehicle.odometer < get_child_value(service, "currentOdometer"):
+            # Get location if the car has moved since last call
+            if vehicle.odometer:
+                if vehicle.odometer < get_child_value(service, "currentOdometer"):
+                    location = self.get_location(token, vehicle)
+                    self._update_vehicle_properties_location(vehicle, location, raw)
+            else:
                 location = self.get_location(token, vehicle)
-                self._update_vehicle_properties_location(vehicle, location)
-        else:
-            location = self.get_location(token, vehicle)
-            self._update_vehicle_properties_location(vehicle, location)
+                self._update_vehicle_properties_location(vehicle, location, raw)
 
-        # Update service after the fact so we still have the old odometer
-        # reading available for above.
-        self._update_vehicle_properties_service(vehicle, service)
-        if vehicle.engine_type == ENGINE_TYPES.EV:
-            charge = self._get_charge_limits(token, vehicle)
-            self._update_vehicle_properties_charge(vehicle, charge)
-            self._update_vehicle_properties_trip_details(token, vehicle)
+            # Update service after the fact so we still have the old odometer
+            # reading available for above.
+            self._update_vehicle_properties_service(vehicle, service, raw)
 
-    def force_refresh_vehicle_state(self, token: Token, vehicle: Vehicle) -> None:
-        state = self._get_forced_vehicle_state(token, vehicle)
+            if is_ev:
+                charge = futures[2].result()
+                self._update_vehicle_properties_charge(vehicle, charge)
+                self._update_vehicle_properties_trip_details(
+                    vehicle, futures[3].result()
+                )
+        vehicle.data = {**(vehicle.data or {}), **raw}
 
+    def _guess_vehicle_timezone(self, vehicle: Vehicle, state: dict) -> None:
         # lastStatusDate uses one of the Canadian timezones configured through
         # the car entertainment system.
         last_updated_at = parse_datetime(
@@ -521,30 +618,9 @@ class KiaUvoApiCA(ApiImpl):
                     f"delta is {raw_delta_seconds / 3600} hours"
                 )
 
-        self._update_vehicle_properties_base(vehicle, state)
-
-        # Service Status Call
-        service = self._get_next_service(token, vehicle)
-
-        # Get location if the car has moved since last call
-        if vehicle.odometer:
-            if vehicle.odometer < get_child_value(service, "currentOdometer"):
-                location = self.get_location(token, vehicle)
-                self._update_vehicle_properties_location(vehicle, location)
-        else:
-            location = self.get_location(token, vehicle)
-            self._update_vehicle_properties_location(vehicle, location)
-
-        # Update service after the fact so we still have the old odometer
-        # reading available for above.
-        self._update_vehicle_properties_service(vehicle, service)
-
-        if vehicle.engine_type == ENGINE_TYPES.EV:
-            charge = self._get_charge_limits(token, vehicle)
-            self._update_vehicle_properties_charge(vehicle, charge)
-            self._update_vehicle_properties_trip_details(token, vehicle)
-
-    def _update_vehicle_properties_base(self, vehicle: Vehicle, state: dict) -> None:
+    def _update_vehicle_properties_base(
+        self, vehicle: Vehicle, state: dict, raw: dict | None = None
+    ) -> None:
         _LOGGER.debug(f"{DOMAIN} - Old Vehicle Last Updated: {vehicle.last_updated_at}")
         vehicle.last_updated_at = parse_datetime(
             get_child_value(state, "status.lastStatusDate"), self.data_timezone
@@ -781,11 +857,11 @@ class KiaUvoApiCA(ApiImpl):
         vehicle.fuel_level_is_low = get_child_value(state, "status.lowFuelLight")
         vehicle.fuel_level = get_child_value(state, "status.fuelLevel")
         vehicle.air_control_is_on = get_child_value(state, "status.airCtrlOn")
-        if vehicle.data is None:
-            vehicle.data = {}
-        vehicle.data["status"] = state["status"]
+        _store_raw(vehicle, raw, "status", state["status"])
 
-    def _update_vehicle_properties_service(self, vehicle: Vehicle, state: dict) -> None:
+    def _update_vehicle_properties_service(
+        self, vehicle: Vehicle, state: dict, raw: dict | None = None
+    ) -> None:
         vehicle.odometer = (
             get_child_value(state, "currentOdometer"),
             DISTANCE_UNITS[get_child_value(state, "currentOdometerUnit")],
@@ -799,10 +875,10 @@ class KiaUvoApiCA(ApiImpl):
             DISTANCE_UNITS[get_child_value(state, "msopServiceOdometerUnit")],
         )
 
-        vehicle.data["service"] = state
+        _store_raw(vehicle, raw, "service", state)
 
     def _update_vehicle_properties_location(
-        self, vehicle: Vehicle, state: dict
+        self, vehicle: Vehicle, state: dict, raw: dict | None = None
     ) -> None:
         if get_child_value(state, "coord.lat"):
             vehicle.location = (
@@ -810,51 +886,55 @@ class KiaUvoApiCA(ApiImpl):
                 get_child_value(state, "coord.lon"),
                 parse_datetime(get_child_value(state, "time"), self.data_timezone),
             )
-        vehicle.data["vehicleLocation"] = state
+        _store_raw(vehicle, raw, "vehicleLocation", state)
 
-    def _update_vehicle_properties_trip_details(self, token: Token, vehicle: Vehicle):
+    def _get_trip_details(self, token: Token, vehicle: Vehicle) -> dict | None:
         url = self.API_URL + "alerts/maintenance/evTripDetails"
         headers = self.API_HEADERS.copy()
         headers["accessToken"] = token.access_token
         headers["vehicleId"] = vehicle.id
 
         response = self.sessions.post(url, headers=headers)
-        if response.ok:
-            response = response.json()
+        if not response.ok:
             _LOGGER.debug(
-                f"{DOMAIN} - Received _update_vehicle_properties_trip_details response {response}"
+                f"{DOMAIN} - Error with _update_vehicle_properties_trip_details response: {response.text}"
             )
+            return None
+        response = response.json()
+        _LOGGER.debug(
+            f"{DOMAIN} - Received _update_vehicle_properties_trip_details response {response}"
+        )
 
-            # Check for errors (including 7602 - access token deleted)
-            self._check_response_for_errors(response)
-
-            if "result" in response and "tripdetails" in response["result"]:
-                trip_stats = []
-                for trip in response["result"]["tripdetails"]:
-                    processed_trip = DailyDrivingStats(
-                        date=dt.datetime.strptime(
-                            trip["startdate"], "%Y-%m-%d %H:%M:%S"
-                        ),
-                        total_consumed=get_child_value(trip, "totalused"),
-                        engine_consumption=get_child_value(trip, "drivetrain"),
-                        climate_consumption=get_child_value(trip, "climate"),
-                        onboard_electronics_consumption=get_child_value(
-                            trip, "accessories"
-                        ),
-                        battery_care_consumption=get_child_value(trip, "batterycare"),
-                        regenerated_energy=get_child_value(trip, "regen"),
-                        distance=get_child_value(trip, "distance"),
-                        distance_unit=vehicle.odometer_unit,
-                    )
-                    trip_stats.append(processed_trip)
-                vehicle.daily_stats = trip_stats
-            else:
-                _LOGGER.debug(
-                    f"{DOMAIN} - Error with _update_vehicle_properties_trip_details response. Unknown format: {response}"
+        # Check for errors (including 7602 - access token deleted)
+        self._check_response_for_errors(response)
+        return response
+
+    def _update_vehicle_properties_trip_details(
+        self, vehicle: Vehicle, response: dict | None
+    ) -> None:
+        if response is None:
+            return
+        if "result" in response and "tripdetails" in response["result"]:
+            trip_stats = []
+            for trip in response["result"]["tripdetails"]:
+                processed_trip = DailyDrivingStats(
+                    date=dt.datetime.strptime(trip["startdate"], "%Y-%m-%d %H:%M:%S"),
+                    total_consumed=get_child_value(trip, "totalused"),
+                    engine_consumption=get_child_value(trip, "drivetrain"),
+                    climate_consumption=get_child_value(trip, "climate"),
+                    onboard_electronics_consumption=get_child_value(
+                        trip, "accessories"
+                    ),
+                    battery_care_consumption=get_child_value(trip, "batterycare"),
+                    regenerated_energy=get_child_value(trip, "regen"),
+                    distance=get_child_value(trip, "distance"),
+                    distance_unit=vehicle.odometer_unit,
                 )
+                trip_stats.append(processed_trip)
+            vehicle.daily_stats = trip_stats
         else:
             _LOGGER.debug(
-                f"{DOMAIN} - Error with _update_vehicle_properties_trip_details response: {response.text}"
+                f"{DOMAIN} - Error with _update_vehicle_properties_trip_details response. Unknown format: {response}"
             )
 
     def _get_cached_vehicle_state(self, token: Token, vehicle: Vehicle) -> dict:
@@ -924,6 +1004,7 @@ class KiaUvoApiCA(ApiImpl):
             headers["pAuth"] = self._get_pin_token(token, vehicle)
             response = self.sessions.post(url, headers=headers, json={"pin": token.pin})
             response = response.json()
+            self._forget_pin_token_on_error(vehicle, response)
             _LOGGER.debug(f"{DOMAIN} - Get Vehicle Location {response}")
             if response["responseHeader"]["responseCode"] != 0:
                 raise APIError("No Location Located")
@@ -932,15 +1013,43 @@ class KiaUvoApiCA(ApiImpl):
             _LOGGER.warning(f"{DOMAIN} - Get vehicle location failed")
             return None
 
-    def _get_pin_token(self, token: Token, vehicle: Vehicle) -> None:
+    def _get_pin_token(self, token: Token, vehicle: Vehicle) -> str:
+        # Reuse the vehicle's pAuth while it is fresh and was issued for the
+        # current access token.
+        cached = self._pin_tokens.get(vehicle.id)
+        if (
+            cached is not None
+            and cached[0] == token.access_token
+            and cached[2] > time.monotonic()
+        ):
+            return cached[1]
+
         url = self.API_URL + "vrfypin"
         headers = self.API_HEADERS.copy()
         headers["accessToken"] = token.access_token
         headers["vehicleId"] = vehicle.id
         response = self.sessions.post(url, headers=headers, json={"pin": token.pin})
         _LOGGER.debug(f"{DOMAIN} - Received Pin validation response {response.json()}")
-        result = response.json()["result"]
-        return result["pAuth"]
+        p_auth = response.json()["result"]["pAuth"]
+        self._pin_tokens[vehicle.id] = (
+            token.access_token,
+            p_auth,
+            time.monotonic() + self.pin_token_lifetime,
+        )
+        return p_auth
+
+    def _forget_pin_token_on_error(self, vehicle: Vehicle, response: dict) -> None:
+        """Drop the cached pAuth when a request was refused for its authorization.
+
+        Other failures (the car not answering, a rejected command) leave it be.
+        """
+        if get_child_value(response, "responseHeader.responseCode") != 1:
+            return
+        error = response.get("error") or {}
+        if error.get("errorCode") in _PIN_TOKEN_ERRORS or _PIN_ERROR.search(
+            str(error.get("errorDesc", ""))
+        ):
+            self._pin_tokens.pop(vehicle.id, None)
 
     def lock_action(self, token: Token, vehicle: Vehicle, action) -> str:
         _LOGGER.debug(f"{DOMAIN} - Action for lock is: {action}")
@@ -960,6 +1069,7 @@ class KiaUvoApiCA(ApiImpl):
         )
         response_headers = response.headers
         response = response.json()
+        self._forget_pin_token_on_error(vehicle, response)
 
         _LOGGER.debug(f"{DOMAIN} - Received lock_action response {response}")
         return response_headers["transactionId"]
@@ -1096,6 +1206,7 @@ class KiaUvoApiCA(ApiImpl):
         response = self.sessions.post(url, headers=headers, data=json.dumps(payload))
         response_headers = response.headers
         response = response.json()
+        self._forget_pin_token_on_error(vehicle, response)
 
         _LOGGER.debug(f"{DOMAIN} - Received start_climate response {response}")
         return response_headers["transactionId"]
@@ -1115,6 +1226,7 @@ class KiaUvoApiCA(ApiImpl):
         )
         response_headers = response.headers
         response = response.json()
+        self._forget_pin_token_on_error(vehicle, response)
 
         _LOGGER.debug(f"{DOMAIN} - Received stop_climate response: {response}")
         return response_headers["transactionId"]
@@ -1139,6 +1251,7 @@ class KiaUvoApiCA(ApiImpl):
         headers["pAuth"] = self._get_pin_token(token, vehicle)
         response = self.sessions.post(url, headers=headers)
         response = response.json()
+        self._forget_pin_token_on_error(vehicle, response)
 
         last_action_completed = (
             response["result"]["transaction"]["apiStatusCode"] != "null"
@@ -1180,6 +1293,7 @@ class KiaUvoApiCA(ApiImpl):
         )
         response_headers = response.headers
         response = response.json()
+        self._forget_pin_token_on_error(vehicle, response)
 
         _LOGGER.debug(f"{DOMAIN} - Received start_charge response {response}")
         return response_headers["transactionId"]
@@ -1196,6 +1310,7 @@ class KiaUvoApiCA(ApiImpl):
         )
         response_headers = response.headers
         response = response.json()
+        self._forget_pin_token_on_error(vehicle, response)
 
         _LOGGER.debug(f"{DOMAIN} - Received stop_charge response {response}")
         return response_headers["transactionId"]
@@ -1261,6 +1376,7 @@ class KiaUvoApiCA(ApiImpl):
         response = self.sessions.post(url, headers=headers, data=json.dumps(payload))
         response_headers = response.headers
         response = response.json()
+        self._forget_pin_token_on_error(vehicle, response)
         _LOGGER.debug(f"{DOMAIN} - Received set_charge_limits response {response}")
         return response_headers["transactionId"]
 
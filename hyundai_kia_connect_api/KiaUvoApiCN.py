@@ -222,9 +222,9 @@ class KiaUvoApiCN(ApiImplType1):
 
     def update_vehicle_with_cached_state(self, token: Token, vehicle: Vehicle) -> None:
         state = self._get_cached_vehicle_state(token, vehicle)
-        self._update_vehicle_properties(vehicle, state)
+        self._apply_state(vehicle, state, self._update_vehicle_properties)
 
-        if vehicle.engine_type == ENGINE_TYPES.EV:
+        if vehicle.engine_type == ENGINE_TYPES.EV and self._driving_info_due(vehicle):
             try:
                 state = self._get_driving_info(token, vehicle)
             except Exception as e:
@@ -241,6 +241,7 @@ class KiaUvoApiCN(ApiImplType1):
                 )
             else:
                 self._update_vehicle_drive_info(vehicle, state)
+                self._driving_info_read(vehicle)
 
     def force_refresh_vehicle_state(self, token: Token, vehicle: Vehicle) -> None:
         is_ccs2 = vehicle.ccu_ccs2_protocol_support != 0
@@ -268,6 +269,7 @@ class KiaUvoApiCN(ApiImplType1):
                 )
             else:
                 self._update_vehicle_drive_info(vehicle, state)
+                self._driving_info_read(vehicle)
 
     def _force_refresh_vehicle_state_ccs2(self, token: Token, vehicle: Vehicle) -> None:
         url = self.SPA_API_URL + "vehicles/" + vehicle.id + "/ccs2/carstatus"
@@ -840,21 +842,12 @@ class KiaUvoApiCN(ApiImplType1):
         _check_response_for_errors(response)
         return response
 
-    def update_month_trip_info(
+    def get_month_trip_info(
         self,
-        token,
-        vehicle,
-        yyyymm_string,
-    ) -> None:
-        """
-        feature only available for some regions.
-        Updates the vehicle.month_trip_info for the specified month.
-
-        Default this information is None:
-
-        month_trip_info: MonthTripInfo = None
-        """
-        vehicle.month_trip_info = None
+        token: Token,
+        vehicle: Vehicle,
+        yyyymm_string: str,
+    ) -> MonthTripInfo | None:
         json_result = self._get_trip_info(
             token,
             vehicle,
@@ -882,23 +875,14 @@ class KiaUvoApiCN(ApiImplType1):
                 )
                 result.day_list.append(processed_day)
 
-            vehicle.month_trip_info = result
+            return result
 
-    def update_day_trip_info(
+    def get_day_trip_info(
         self,
-        token,
-        vehicle,
-        yyyymmdd_string,
-    ) -> None:
-        """
-        feature only available for some regions.
-        Updates the vehicle.day_trip_info information for the specified day.
-
-        Default this information is None:
-
-        day_trip_info: DayTripInfo = None
-        """
-        vehicle.day_trip_info = None
+        token: Token,
+        vehicle: Vehicle,
+        yyyymmdd_string: str,
+    ) -> DayTripInfo | None:
         json_result = self._get_trip_info(
             token,
             vehicle,
@@ -929,7 +913,7 @@ class KiaUvoApiCN(ApiImplType1):
                     max_speed=trip["tripMaxSpeed"],
                 )
                 result.trip_list.append(processed_trip)
-            vehicle.day_trip_info = result
+            return result
 
     def _get_driving_info(self, token: Token, vehicle: Vehicle) -> dict:
         url = self.SPA_API_URL + "vehicles/" + vehicle.id + "/drvhistory"
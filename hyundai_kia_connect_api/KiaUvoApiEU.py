@@ -8,6 +8,7 @@ import logging
 import random
 import re
 import uuid
+from collections.abc import Iterator
 from time import sleep
 from urllib.parse import parse_qs, urlparse
 from zoneinfo import ZoneInfo
@@ -16,11 +17,13 @@ import requests
 from Crypto.Cipher import PKCS1_v1_5
 from Crypto.PublicKey import RSA
 
+from .ApiImpl import ForceRefreshPolling
 from .ApiImplType1 import (
     ApiImplSession,
     ApiImplType1,
     _check_response_for_errors,
     _retry_on_device_id_error,
+    _retry_steps_on_device_id_error,
 )
 from .const import (
     BRAND_GENESIS,
@@ -621,55 +624,96 @@ class KiaUvoApiEU(ApiImplType1):
         else:
             url += "/status/latest"
 
-        response = self.session.get(
-            url,
-            headers=self._get_authenticated_headers(
-                token, vehicle.ccu_ccs2_protocol_support
+        # Status, park location and both drive-history reads are independent
+        # of each other; issue them together and apply in the original order
+        # (drive info needs the odometer unit parsed from the status). The
+        # drive history is only read when it may have changed.
+        wants_driving_info = vehicle.engine_type in (
+            ENGINE_TYPES.EV,
+            ENGINE_TYPES.PHEV,
+        )
+        driving_calls = [
+            lambda: self._cached_response(
+                "driving_history_total",
+                vehicle,
+                lambda: self._get_driving_history(token, vehicle, 1),
             ),
-        ).json()
-
-        _LOGGER.debug(f"{DOMAIN} - get_cached_vehicle_status response: {response}")
-        _check_response_for_errors(response)
-
-        if vehicle.ccu_ccs2_protocol_support == 0:
-            self._update_vehicle_properties(
-                vehicle, response["resMsg"]["vehicleStatusInfo"]
-            )
-        else:
-            state = response["resMsg"]["state"]["Vehicle"]
-            self._update_vehicle_properties_ccs2(vehicle, state)
-
-        # The status response embeds a stale cached location.
-        # Override it with the more current /location/park endpoint.
-        # this is not a force endpoint so car will not wake up
-        self._set_cached_location_park(token, vehicle)
+            lambda: self._get_driving_history(token, vehicle, 0),
+        ]
+        read_driving_info = wants_driving_info and self._driving_info_due(vehicle)
+        calls = [
+            lambda: self.session.get(
+                url,
+                headers=self._get_authenticated_headers(
+                    token, vehicle.ccu_ccs2_protocol_support
+                ),
+            ).json(),
+            lambda: self._get_location_park(token, vehicle),
+        ]
+        if read_driving_info:
+            calls += driving_calls
+        with self._parallel_requests(*calls) as futures:
+            response = futures[0].result()
+            _LOGGER.debug(f"{DOMAIN} - get_cached_vehicle_status response: {response}")
+            _check_response_for_errors(response)
 
-        if (
-            vehicle.engine_type == ENGINE_TYPES.EV
-            or vehicle.engine_type == ENGINE_TYPES.PHEV
-        ):
-            try:
-                state = self._get_driving_info(token, vehicle)
-            except Exception as e:
-                # we don't know if all car types (ex: ICE cars) provide this
-                # information. We also don't know what the API returns if
-                # the info is unavailable. So, catch any exception and move on.
-                _LOGGER.exception(
-                    """Failed to parse driving info. Possible reasons:
-                                    - incompatible vehicle (ICE)
-                                    - new API format
-                                    - API outage
-                            """,
-                    exc_info=e,
+            if vehicle.ccu_ccs2_protocol_support == 0:
+                self._apply_state(
+                    vehicle,
+                    response["resMsg"]["vehicleStatusInfo"],
+                    self._update_vehicle_properties,
                 )
             else:
-                self._update_vehicle_drive_info(vehicle, state)
+                state = response["resMsg"]["state"]["Vehicle"]
+                self._apply_state(vehicle, state, self._update_vehicle_properties_ccs2)
+
+            # The status response embeds a stale cached location.
+            # Override it with the more current /location/park endpoint.
+            # this is not a force endpoint so car will not wake up
+            self._apply_location_park(vehicle, futures[1].result())
+
+            if wants_driving_info and not read_driving_info:
+                # The status just applied may show that the car has driven.
+                read_driving_info = self._driving_info_due(vehicle)
+                if read_driving_info:
+                    futures += self._run_parallel(*driving_calls)
+            if read_driving_info:
+                try:
+                    state = self._build_driving_info(
+                        vehicle, futures[2].result(), futures[3].result()
+                    )
+                except Exception as e:
+                    # we don't know if all car types (ex: ICE cars) provide this
+                    # information. We also don't know what the API returns if
+                    # the info is unavailable. So, catch any exception and move on.
+                    _LOGGER.exception(
+                        """Failed to parse driving info. Possible reasons:
+                                        - incompatible vehicle (ICE)
+                                        - new API format
+                                        - API outage
+                                """,
+                        exc_info=e,
+                    )
+                else:
+                    self._update_vehicle_drive_info(vehicle, state)
+                    self._driving_info_read(vehicle)
 
-    @_retry_on_device_id_error
     def force_refresh_vehicle_state(self, token: Token, vehicle: Vehicle) -> None:
+        for delay in self.force_refresh_vehicle_state_steps(token, vehicle):
+            sleep(delay)
+
+    @_retry_steps_on_device_id_error
+    def force_refresh_vehicle_state_steps(
+        self,
+        token: Token,
+        vehicle: Vehicle,
+        polling: ForceRefreshPolling | None = None,
+    ) -> Iterator[float]:
         is_ccs2 = vehicle.ccu_ccs2_protocol_support != 0
         if is_ccs2:
-            self._force_refresh_vehicle_state_ccs2(token, vehicle)
+            yield from self._force_refresh_vehicle_state_ccs2_steps(
+                token, vehicle, polling
+            )
         else:
             state = self._get_forced_vehicle_state(token, vehicle)
             state["vehicleLocation"] = self._get_location(token, vehicle)
@@ -695,16 +739,30 @@ class KiaUvoApiEU(ApiImplType1):
                 )
             else:
                 self._update_vehicle_drive_info(vehicle, state)
+                self._driving_info_read(vehicle)
 
     def _force_refresh_vehicle_state_ccs2(self, token: Token, vehicle: Vehicle) -> None:
+        for delay in self._force_refresh_vehicle_state_ccs2_steps(token, vehicle):
+            sleep(delay)
+
+    def _force_refresh_vehicle_state_ccs2_steps(
+        self,
+        token: Token,
+        vehicle: Vehicle,
+        polling: ForceRefreshPolling | None = None,
+    ) -> Iterator[float]:
         """Force-refresh CCS2 state: wake the vehicle, wait, read the cached snapshot.
 
         GET /ccs2/carstatus (no /latest) wakes the vehicle but returns an async
         command envelope ({retCode, resCode, msgId}), not state — reading
         resMsg.state.Vehicle from it raised KeyError: 'resMsg' (kia_uvo #1786,
-        #1806). Instead: wake, sleep for the car to report (~20s live-measured on
+        #1806). Instead: wake, wait for the car to report (~20s live-measured on
         a reachable EU CCS2 car), then read the now-fresh cached /latest snapshot.
 
+        With ``polling`` the fixed wait is replaced by re-reading /latest until
+        its ``Date`` moves past the pre-wake value; at the deadline the last
+        snapshot is applied, as after the fixed wait.
+
         The wake GET must return valid JSON; its body is discarded but errors
         propagate, so a failed wake does not fall through to a stale /latest apply.
         """
@@ -712,14 +770,32 @@ class KiaUvoApiEU(ApiImplType1):
             token, vehicle.ccu_ccs2_protocol_support
         )
         trigger_url = self.SPA_API_URL + "vehicles/" + vehicle.id + "/ccs2/carstatus"
-        self.session.get(trigger_url, headers=headers).json()
-        sleep(25)
         latest_url = trigger_url + "/latest"
-        response = self.session.get(latest_url, headers=headers).json()
-        _LOGGER.debug(
-            f"{DOMAIN} - Force refresh CCS2 vehicle status response: {response}"
-        )
-        _check_response_for_errors(response)
+
+        def read_latest() -> dict:
+            response = self.session.get(latest_url, headers=headers).json()
+            _LOGGER.debug(
+                f"{DOMAIN} - Force refresh CCS2 vehicle status response: {response}"
+            )
+            _check_response_for_errors(response)
+            return response
+
+        if polling is None:
+            self.session.get(trigger_url, headers=headers).json()
+            yield 25
+            response = read_latest()
+        else:
+            response, fresh = yield from self._poll_for_fresh_state(
+                polling,
+                wake=lambda: self.session.get(trigger_url, headers=headers).json(),
+                read_latest=read_latest,
+                timestamp_of=lambda r: get_child_value(r, "resMsg.state.Vehicle.Date"),
+            )
+            if not fresh:
+                _LOGGER.debug(
+                    f"{DOMAIN} - Vehicle {vehicle.id} did not report before the "
+                    "force refresh deadline, applying the latest snapshot"
+                )
         state = response["resMsg"]["state"]["Vehicle"]
         self._update_vehicle_properties_ccs2(vehicle, state)
         self._set_cached_location_park(token, vehicle)
@@ -1249,6 +1325,9 @@ class KiaUvoApiEU(ApiImplType1):
         return response
 
     def _set_cached_location_park(self, token: Token, vehicle: Vehicle) -> None:
+        self._apply_location_park(vehicle, self._get_location_park(token, vehicle))
+
+    def _get_location_park(self, token: Token, vehicle: Vehicle) -> dict | None:
         url = self.SPA_API_URL + "vehicles/" + vehicle.id + "/location/park"
 
         try:
@@ -1257,8 +1336,13 @@ class KiaUvoApiEU(ApiImplType1):
             ).json()
             _LOGGER.debug(f"{DOMAIN} - _get_location response: {response}")
             _check_response_for_errors(response)
+        except Exception:
+            _LOGGER.debug(f"{DOMAIN} - _get_location failed")
+            return None
+        return response["resMsg"]
 
-            location = response["resMsg"]
+    def _apply_location_park(self, vehicle: Vehicle, location: dict | None) -> None:
+        try:
             if location and get_child_value(location, "coord.lat"):
                 vehicle.location = (
                     get_child_value(location, "coord.lat"),
@@ -1269,7 +1353,6 @@ class KiaUvoApiEU(ApiImplType1):
                 )
         except Exception:
             _LOGGER.debug(f"{DOMAIN} - _get_location failed")
-            return
 
     def _get_location(self, token: Token, vehicle: Vehicle) -> dict:
         url = self.SPA_API_URL + "vehicles/" + vehicle.id + "/location"
@@ -1370,21 +1453,12 @@ class KiaUvoApiEU(ApiImplType1):
         _check_response_for_errors(response)
         return response
 
-    def update_month_trip_info(
+    def get_month_trip_info(
         self,
-        token,
-        vehicle,
-        yyyymm_string,
-    ) -> None:
-        """
-        feature only available for some regions.
-        Updates the vehicle.month_trip_info for the specified month.
-
-        Default this information is None:
-
-        month_trip_info: MonthTripInfo = None
-        """
-        vehicle.month_trip_info = None
+        token: Token,
+        vehicle: Vehicle,
+        yyyymm_string: str,
+    ) -> MonthTripInfo | None:
         json_result = self._get_trip_info(
             token,
             vehicle,
@@ -1412,23 +1486,14 @@ class KiaUvoApiEU(ApiImplType1):
                 )
                 result.day_list.append(processed_day)
 
-            vehicle.month_trip_info = result
+            return result
 
-    def update_day_trip_info(
+    def get_day_trip_info(
         self,
-        token,
-        vehicle,
-        yyyymmdd_string,
-    ) -> None:
-        """
-        feature only available for some regions.
-        Updates the vehicle.day_trip_info information for the specified day.
-
-        Default this information is None:
-
-        day_trip_info: DayTripInfo = None
-        """
-        vehicle.day_trip_info = None
+        token: Token,
+        vehicle: Vehicle,
+        yyyymmdd_string: str,
+    ) -> DayTripInfo | None:
         json_result = self._get_trip_info(
             token,
             vehicle,
@@ -1460,32 +1525,38 @@ class KiaUvoApiEU(ApiImplType1):
                 )
                 result.trip_list.append(processed_trip)
 
-            vehicle.day_trip_info = result
+            return result
 
     def _get_driving_info(self, token: Token, vehicle: Vehicle) -> dict:
+        with self._parallel_requests(
+            lambda: self._get_driving_history(token, vehicle, 1),
+            lambda: self._get_driving_history(token, vehicle, 0),
+        ) as (alltime, last_30_days):
+            responseAlltime = alltime.result()
+            response30d = last_30_days.result()
+        return self._build_driving_info(vehicle, responseAlltime, response30d)
+
+    def _get_driving_history(
+        self, token: Token, vehicle: Vehicle, period_target: int
+    ) -> dict:
+        """POST /drvhistory; periodTarget 1 is all-time, 0 the last 30 days."""
         url = self.SPA_API_URL + "vehicles/" + vehicle.id + "/drvhistory"
-
-        responseAlltime = self.session.post(
+        response = self.session.post(
             url,
-            json={"periodTarget": 1},
+            json={"periodTarget": period_target},
             headers=self._get_authenticated_headers(
                 token, vehicle.ccu_ccs2_protocol_support
             ),
+        ).json()
+        _LOGGER.debug(
+            f"{DOMAIN} - get_driving_info periodTarget {period_target}: {response}"
         )
-        responseAlltime = responseAlltime.json()
-        _LOGGER.debug(f"{DOMAIN} - get_driving_info responseAlltime {responseAlltime}")
-        _check_response_for_errors(responseAlltime)
+        _check_response_for_errors(response)
+        return response
 
-        response30d = self.session.post(
-            url,
-            json={"periodTarget": 0},
-            headers=self._get_authenticated_headers(
-                token, vehicle.ccu_ccs2_protocol_support
-            ),
-        )
-        response30d = response30d.json()
-        _LOGGER.debug(f"{DOMAIN} - get_driving_info response30d {response30d}")
-        _check_response_for_errors(response30d)
+    def _build_driving_info(
+        self, vehicle: Vehicle, responseAlltime: dict, response30d: dict
+    ) -> dict | None:
         if get_child_value(responseAlltime, "resMsg.drivingInfo.0"):
             drivingInfo = responseAlltime["resMsg"]["drivingInfo"][0]
 
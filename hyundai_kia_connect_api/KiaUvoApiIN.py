@@ -4,6 +4,7 @@
 
 import base64
 import datetime as dt
+import functools
 import logging
 import math
 import random
@@ -198,7 +199,7 @@ class KiaUvoApiIN(ApiImplType1):
     def update_vehicle_with_cached_state(self, token: Token, vehicle: Vehicle) -> None:
         state = self._get_cached_vehicle_state(token, vehicle)
 
-        self._update_vehicle_properties(vehicle, state)
+        self._apply_state(vehicle, state, self._update_vehicle_properties)
 
         state = self._get_maintenance_alert(token, vehicle)
 
@@ -209,7 +210,11 @@ class KiaUvoApiIN(ApiImplType1):
         self._update_vehicle_location(vehicle, state)
 
         if vehicle.engine_type == ENGINE_TYPES.EV:
-            charge = self._get_charge_limits(token, vehicle)
+            charge = self._cached_response(
+                "charge_limits",
+                vehicle,
+                lambda: self._get_charge_limits(token, vehicle),
+            )
             self._update_vehicle_properties_charge(vehicle, charge)
 
     def _update_vehicle_maintenance_alert(self, vehicle: Vehicle, state: dict) -> None:
@@ -266,6 +271,7 @@ class KiaUvoApiIN(ApiImplType1):
                 )
             else:
                 self._update_vehicle_drive_info(vehicle, state)
+                self._driving_info_read(vehicle)
 
     def _force_refresh_vehicle_state_ccs2(self, token: Token, vehicle: Vehicle) -> None:
         url = self.SPA_API_URL + "vehicles/" + vehicle.id + "/ccs2/carstatus"
@@ -770,21 +776,12 @@ class KiaUvoApiIN(ApiImplType1):
 
         return processed_trip
 
-    def update_month_trip_info(
+    def get_month_trip_info(
         self,
-        token,
-        vehicle,
-        yyyymm_string,
-    ) -> None:
-        """
-        feature only available for some regions.
-        Updates the vehicle.month_trip_info for the specified month.
-
-        Default this information is None:
-
-        month_trip_info: MonthTripInfo = None
-        """
-        vehicle.month_trip_info = None
+        token: Token,
+        vehicle: Vehicle,
+        yyyymm_string: str,
+    ) -> MonthTripInfo | None:
         json_result = self._get_trip_info(
             token,
             vehicle,
@@ -812,27 +809,18 @@ class KiaUvoApiIN(ApiImplType1):
                 )
                 result.day_list.append(processed_day)
 
-            vehicle.month_trip_info = result
+            return result
 
     def _get_drv_seat_loc(self, vehicle: Vehicle) -> str:
         """India uses RHD vehicles regardless of the odometer unit."""
         return "R"
 
-    def update_day_trip_info(
+    def get_day_trip_info(
         self,
-        token,
-        vehicle,
-        yyyymmdd_string,
-    ) -> None:
-        """
-        feature only available for some regions.
-        Updates the vehicle.day_trip_info information for the specified day.
-
-        Default this information is None:
-
-        day_trip_info: DayTripInfo = None
-        """
-        vehicle.day_trip_info = None
+        token: Token,
+        vehicle: Vehicle,
+        yyyymmdd_string: str,
+    ) -> DayTripInfo | None:
         json_result = self._get_trip_info(
             token,
             vehicle,
@@ -853,25 +841,38 @@ class KiaUvoApiIN(ApiImplType1):
                     max_speed=msg["tripMaxSpeed"],
                 ),
             )
-            for trip in msg["tripList"]:
-                # Hyundai EVs do not provide full trip info. Used "/tripinfo/detail" API instead
-                if "tripTime" in trip:
-                    processed_trip = TripInfo(
-                        hhmmss=trip["tripTime"],
-                        drive_time=trip["tripDrvTime"],
-                        idle_time=trip["tripIdleTime"],
-                        distance=trip["tripDist"],
-                        avg_speed=trip["tripAvgSpeed"],
-                        max_speed=trip["tripMaxSpeed"],
-                    )
-                else:
-                    processed_trip = self._get_detailed_trip_info(
-                        token, vehicle, yyyymmdd_string, trip
+            # Hyundai EVs do not provide full trip info. Used "/tripinfo/detail" API
+            # instead; those requests are independent of each other.
+            with self._parallel_requests(
+                *(
+                    functools.partial(
+                        self._get_detailed_trip_info,
+                        token,
+                        vehicle,
+                        yyyymmdd_string,
+                        trip,
                     )
+                    for trip in msg["tripList"]
+                    if "tripTime" not in trip
+                )
+            ) as details:
+                detailed_trips = iter(details)
+                for trip in msg["tripList"]:
+                    if "tripTime" in trip:
+                        processed_trip = TripInfo(
+                            hhmmss=trip["tripTime"],
+                            drive_time=trip["tripDrvTime"],
+                            idle_time=trip["tripIdleTime"],
+                            distance=trip["tripDist"],
+                            avg_speed=trip["tripAvgSpeed"],
+                            max_speed=trip["tripMaxSpeed"],
+                        )
+                    else:
+                        processed_trip = next(detailed_trips).result()
 
-                result.trip_list.append(processed_trip)
+                    result.trip_list.append(processed_trip)
 
-            vehicle.day_trip_info = result
+            return result
 
     def _get_driving_info(self, token: Token, vehicle: Vehicle) -> dict:
         url = self.SPA_API_URL + "vehicles/" + vehicle.id + "/drvhistory"
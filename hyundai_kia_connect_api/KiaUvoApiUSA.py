@@ -138,6 +138,8 @@ def _retry_on_auth_error(func):
 class KiaUvoApiUSA(ApiImpl):
     """KiaUvoApiUSA"""
 
+    vehicle_keys_per_session = True
+
     def __init__(self, region: int, brand: int, language) -> None:
         self.LANGUAGE: str = language
         self.temperature_range = range(62, 83)
@@ -468,7 +470,7 @@ class KiaUvoApiUSA(ApiImpl):
 
     def update_vehicle_with_cached_state(self, token: Token, vehicle: Vehicle) -> None:
         state = self._get_cached_vehicle_state(token, vehicle)
-        self._update_vehicle_properties(vehicle, state)
+        self._apply_state(vehicle, state, self._update_vehicle_properties)
         # Only EV/PHEV vehicles have charge targets; skip the /evc/gts call
         # for ICE vehicles. engine_type is set in get_vehicles from the
         # fuelType hint and refined in _update_vehicle_properties from the
@@ -0,0 +1,136 @@
+"""TokenRenewer.py"""
+
+# pylint:disable=logging-fstring-interpolation,invalid-name,broad-exception-caught
+
+import datetime as dt
+import logging
+import math
+import random
+import threading
+import time
+from typing import TYPE_CHECKING
+
+from .const import DOMAIN
+from .exceptions import AuthenticationOTPRequired
+from .Token import Token
+
+if TYPE_CHECKING:
+    from .VehicleManager import VehicleManager
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class TokenRenewer:
+    """Renews a VehicleManager's tokens ahead of expiry on a background thread.
+
+    The access token is refreshed ``lead_time`` seconds (minus up to ``jitter``
+    random seconds, so a fleet of managers does not renew in lockstep) before
+    ``Token.valid_until``. The PIN control token, once one has been issued, is
+    renewed ``control_lead_time`` seconds before ``Token.control_token_expiry``.
+    Renewals go through VehicleManager.check_and_refresh_token, so they
+    coalesce with refreshes started by callers, and token listeners are
+    notified of every new token.
+
+    A failed renewal is retried after ``retry_interval`` seconds; a renewal
+    that needs an OTP stops the renewer.
+    """
+
+    def __init__(
+        self,
+        manager: "VehicleManager",
+        lead_time: float = 300,
+        jitter: float = 60,
+        control_lead_time: float = 30,
+        retry_interval: float = 60,
+    ) -> None:
+        self.manager = manager
+        self.lead_time = lead_time
+        self.jitter = jitter
+        self.control_lead_time = control_lead_time
+        self.retry_interval = retry_interval
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._jittered_token: Token | None = None
+        self._jitter_offset: float = 0
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        if self.running:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name=f"{DOMAIN}-token-renewal", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: float | None = None) -> None:
+        self._stop.set()
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+
+    def _access_lead_time(self, token: Token) -> float:
+        # Draw the jitter once per token so the due time does not move
+        # between wake-ups.
+        if token is not self._jittered_token:
+            self._jittered_token = token
+            self._jitter_offset = random.uniform(0, self.jitter)
+        return self.lead_time + self._jitter_offset
+
+    def _due_in(self) -> tuple[float, float]:
+        """Seconds until the access and the control token are due for renewal."""
+        token = self.manager.token
+        if token is None:
+            return math.inf, math.inf
+        valid_until = token.valid_until
+        if not isinstance(valid_until, dt.datetime):
+            access = 0.0
+        else:
+            if valid_until.tzinfo is None:
+                valid_until = valid_until.replace(tzinfo=dt.UTC)
+            remaining = (valid_until - dt.datetime.now(dt.UTC)).total_seconds()
+            access = remaining - self._access_lead_time(token)
+        control = math.inf
+        if token.control_token and token.pin:
+            control = token.control_token_expiry - time.time() - self.control_lead_time
+        return access, control
+
+    def _renew(self, access: float, control: float) -> None:
+        if access <= 0:
+            _LOGGER.debug(f"{DOMAIN} - Renewing access token ahead of expiry")
+            self.manager.check_and_refresh_token(
+                lead_time=self._access_lead_time(self.manager.token)
+            )
+            _, control = self._due_in()
+        if control <= 0:
+            _LOGGER.debug(f"{DOMAIN} - Renewing control token ahead of expiry")
+            if self.manager.api.refresh_control_token(self.manager.token):
+                self.manager._notify_token_listeners()
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            access, control = self._due_in()
+            # Wake at least every retry_interval to pick up a token replaced
+            # by a login or by the caller.
+            wait = min(access, control, self.retry_interval)
+            if wait > 0:
+                self._stop.wait(wait)
+                continue
+            try:
+                self._renew(access, control)
+            except AuthenticationOTPRequired:
+                _LOGGER.warning(
+                    f"{DOMAIN} - Token renewal needs an OTP, stopping the renewer"
+                )
+                return
+            except Exception as err:
+                _LOGGER.warning(f"{DOMAIN} - Token renewal failed: {err!r}")
+                self._stop.wait(self.retry_interval)
+                continue
+            if min(self._due_in()) <= 0:
+                # Still due (e.g. a lifetime shorter than the lead time):
+                # back off rather than spin.
+                self._stop.wait(self.retry_interval)
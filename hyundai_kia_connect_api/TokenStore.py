@@ -0,0 +1,150 @@
+"""TokenStore.py"""
+
+# pylint:disable=logging-fstring-interpolation,invalid-name,broad-exception-caught
+
+import contextlib
+import errno
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+from abc import ABC, abstractmethod
+from collections.abc import Iterator
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+from .const import DOMAIN
+from .Token import Token
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def _lock_file(file) -> None:
+    """Block until this process holds the exclusive lock on ``file``."""
+    if fcntl is not None:
+        fcntl.flock(file.fileno(), fcntl.LOCK_EX)
+        return
+    # msvcrt locks byte ranges from the current position.
+    file.seek(0)
+    while True:
+        try:
+            msvcrt.locking(file.fileno(), msvcrt.LK_LOCK, 1)
+            return
+        except OSError as err:
+            # LK_LOCK gives up after about ten seconds; keep waiting as
+            # flock does.
+            if err.errno != errno.EDEADLOCK:
+                raise
+
+
+def _unlock_file(file) -> None:
+    if fcntl is not None:
+        fcntl.flock(file.fileno(), fcntl.LOCK_UN)
+        return
+    file.seek(0)
+    msvcrt.locking(file.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+class TokenStore(ABC):
+    """Where VehicleManager keeps the token of an account.
+
+    Managers of the same account, in this or other processes, share the
+    token (and with it the EU device id) through the store. ``lock`` holds
+    off the other managers while one checks, refreshes and saves the token,
+    so only one of them talks to the auth servers.
+    """
+
+    @abstractmethod
+    def load(self, key: str) -> Token | None:
+        """The saved token of the account, or None."""
+
+    @abstractmethod
+    def save(self, key: str, token: Token) -> None:
+        """Save the token of the account."""
+
+    @abstractmethod
+    def lock(self, key: str) -> contextlib.AbstractContextManager:
+        """Context manager excluding other managers of the account."""
+
+
+class MemoryTokenStore(TokenStore):
+    """TokenStore for managers within one process, and for tests."""
+
+    def __init__(self) -> None:
+        self._tokens: dict[str, dict] = {}
+        self._locks: dict[str, threading.Lock] = {}
+        self._locks_lock = threading.Lock()
+
+    def load(self, key: str) -> Token | None:
+        data = self._tokens.get(key)
+        return None if data is None else Token.from_dict(data)
+
+    def save(self, key: str, token: Token) -> None:
+        self._tokens[key] = token.to_dict()
+
+    @contextlib.contextmanager
+    def lock(self, key: str) -> Iterator[None]:
+        with self._locks_lock:
+            lock = self._locks.setdefault(key, threading.Lock())
+        with lock:
+            yield
+
+
+class FileTokenStore(TokenStore):
+    """TokenStore keeping one JSON file per account in ``directory``.
+
+    Files are written atomically (temporary file, then rename) and readable
+    by the owner only, as the token holds the account credentials. ``lock``
+    takes a lock on a sidecar file (flock, or msvcrt.locking on Windows),
+    which other processes using the same directory honour.
+    """
+
+    def __init__(self, directory: str) -> None:
+        self.directory = directory
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+        self._locks: dict[str, threading.Lock] = {}
+        self._locks_lock = threading.Lock()
+
+    def _path(self, key: str, suffix: str) -> str:
+        name = hashlib.sha256(key.encode()).hexdigest()[:32]
+        return os.path.join(self.directory, name + suffix)
+
+    def load(self, key: str) -> Token | None:
+        try:
+            with open(self._path(key, ".json"), encoding="utf-8") as file:
+                return Token.from_dict(json.load(file))
+        except FileNotFoundError:
+            return None
+        except Exception as err:
+            _LOGGER.warning(f"{DOMAIN} - Ignoring unreadable stored token: {err!r}")
+            return None
+
+    def save(self, key: str, token: Token) -> None:
+        fd, temp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as file:
+                json.dump(token.to_dict(), file)
+                file.flush()
+                os.fsync(file.fileno())
+            os.replace(temp_path, self._path(key, ".json"))
+        except BaseException:
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(temp_path)
+            raise
+
+    @contextlib.contextmanager
+    def lock(self, key: str) -> Iterator[None]:
+        with self._locks_lock:
+            thread_lock = self._locks.setdefault(key, threading.Lock())
+        with thread_lock, open(self._path(key, ".lock"), "a", encoding="utf-8") as file:
+            _lock_file(file)
+            try:
+                yield
+            finally:
+                _unlock_file(file)
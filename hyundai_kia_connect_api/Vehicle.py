@@ -1,11 +1,25 @@
 # pylint:disable=missing-class-docstring,missing-function-docstring,wildcard-import,unused-wildcard-import,invalid-name,logging-fstring-interpolation
 """Vehicle class"""
 
+import base64
+import dataclasses
 import datetime
+import json
 import logging
+import zlib
 from dataclasses import dataclass, field
-
-from .const import DISTANCE_UNITS, PRESSURE_UNITS, PressureUnit
+from enum import Enum
+from operator import attrgetter
+from zoneinfo import ZoneInfo
+
+from . import const
+from .const import (
+    DISTANCE_UNITS,
+    PRESSURE_UNITS,
+    RAW_DATA_RETENTION,
+    SNAPSHOT_ENCODING,
+    PressureUnit,
+)
 from .utils import float_or_none, get_float, get_safe_local_datetime
 
 _LOGGER = logging.getLogger(__name__)
@@ -63,7 +77,8 @@ class DailyDrivingStats:
     distance_unit: str = DISTANCE_UNITS[1]  # set to kms by default
 
 
-@dataclass
+# Slotted: a fleet process holds many vehicles of some 300 fields each.
+@dataclass(slots=True)
 class Vehicle:
     id: str = None
     name: str = None
@@ -124,6 +139,11 @@ class Vehicle:
     front_right_seat_status: str = None
     rear_left_seat_status: str = None
     rear_right_seat_status: str = None
+    # Kia USA seat heater levels
+    front_left_seat_heater_is_on: int = None
+    front_right_seat_heater_is_on: int = None
+    rear_left_seat_heater_is_on: int = None
+    rear_right_seat_heater_is_on: int = None
 
     # Door Status
     is_locked: bool = None
@@ -275,6 +295,10 @@ class Vehicle:
     # feature only available for some regions (getter/setter for sorting)
     _day_trip_info: DayTripInfo = None
 
+    # Hyundai USA: the trips of the last update, which month_trip_info and
+    # day_trip_info are filled from.
+    _filled_trips: list[TripInfo] | None = None
+
     @property
     def day_trip_info(self):
         return self._day_trip_info
@@ -388,8 +412,78 @@ class Vehicle:
     # Calculated fields
     engine_type: str = None
 
-    # Debug fields
+    # Debug fields. Declared before data: its setter reads the retention.
+    raw_data_retention: RAW_DATA_RETENTION = field(
+        default=RAW_DATA_RETENTION.KEEP, repr=False, compare=False
+    )
+    # The raw API payload, see _get_data below the class.
     data: dict = None
+    # Fingerprint of the last cached state applied, see ApiImpl._apply_state.
+    _state_fingerprint: bytes | None = field(default=None, repr=False, compare=False)
+    # Odometer, local date and monotonic time of the last drive history read,
+    # see ApiImpl._driving_info_due.
+    _driving_info_stamp: tuple | None = field(default=None, repr=False, compare=False)
+
+    def to_snapshot(
+        self, encoding: SNAPSHOT_ENCODING = SNAPSHOT_ENCODING.JSON
+    ) -> str | bytes:
+        """Serialize the parsed state, to be restored with ``from_snapshot``.
+
+        Fields still at their default are left out. The raw payload (``data``)
+        is not part of the snapshot. JSON gives a str, BINARY the same JSON
+        zlib-compressed behind a version header.
+        """
+        fields = {
+            name: _encode(value)
+            for name, value, default in zip(
+                _SNAPSHOT_FIELDS,
+                _snapshot_values(self),
+                _SNAPSHOT_DEFAULTS,
+                strict=True,
+            )
+            if value is not default and value != default
+        }
+        if encoding is SNAPSHOT_ENCODING.BINARY:
+            return (
+                _SNAPSHOT_MAGIC
+                + bytes((SNAPSHOT_VERSION,))
+                + zlib.compress(json.dumps(fields, separators=(",", ":")).encode())
+            )
+        return json.dumps(
+            {"version": SNAPSHOT_VERSION, "fields": fields}, separators=(",", ":")
+        )
+
+    @classmethod
+    def from_snapshot(cls, snapshot: str | bytes) -> "Vehicle":
+        """Restore a Vehicle from ``to_snapshot`` output of either encoding.
+
+        Fields unknown to this version of the library are ignored, fields
+        missing from the snapshot keep their default. Raises ValueError for
+        anything that is not a snapshot this version can read.
+        """
+        if isinstance(snapshot, bytes) and not snapshot.startswith(_SNAPSHOT_MAGIC):
+            raise ValueError("Not a binary Vehicle snapshot")
+        try:
+            if isinstance(snapshot, bytes):
+                version = snapshot[len(_SNAPSHOT_MAGIC)]
+                fields = json.loads(
+                    zlib.decompress(snapshot[len(_SNAPSHOT_MAGIC) + 1 :])
+                )
+            else:
+                document = json.loads(snapshot)
+                version = document["version"]
+                fields = document["fields"]
+            if version > SNAPSHOT_VERSION:
+                raise ValueError(f"Unsupported Vehicle snapshot version {version}")
+            # Set the fields one by one: keyword arguments are matched against
+            # the ~300 constructor parameters by a linear search.
+            vehicle = cls()
+            for name, value in fields.items():
+                if name in _SNAPSHOT_FIELD_SET:
+                    setattr(vehicle, name, _decode(value))
+        except (LookupError, TypeError, AttributeError, zlib.error) as err:
+            raise ValueError("Malformed Vehicle snapshot") from err
+        return vehicle
 
     @property
     def geocode(self):
@@ -734,3 +828,151 @@ class Vehicle:
         self._fuel_driving_range = value[0]
         if value[1] is not None:
             self._fuel_driving_range_unit = value[1]
+
+
+# Vehicle.data stays a dataclass field, so the constructor, fields() and
+# asdict() see it as before, but its slot is wrapped in a property that
+# stores the payload as raw_data_retention says.
+_data_slot = Vehicle.data
+
+
+def _get_data(self: Vehicle) -> dict | None:
+    """The raw API payload of the last update, see raw_data_retention.
+
+    With RAW_DATA_RETENTION.COMPRESS every read decodes a new copy: read it
+    once into a local, and assign ``data`` to change it, as changes to the
+    returned dict are not kept.
+    """
+    stored = _data_slot.__get__(self, Vehicle)
+    if type(stored) is bytes:
+        return json.loads(zlib.decompress(stored))
+    return stored
+
+
+def _set_data(self: Vehicle, value: dict | None) -> None:
+    if value is None or self.raw_data_retention is RAW_DATA_RETENTION.KEEP:
+        _data_slot.__set__(self, value)
+    elif self.raw_data_retention is RAW_DATA_RETENTION.COMPRESS:
+        # JSON, not pickle: the payload comes from a remote API.
+        _data_slot.__set__(
+            self, zlib.compress(json.dumps(value, separators=(",", ":")).encode())
+        )
+    else:
+        _data_slot.__set__(self, None)
+
+
+Vehicle.data = property(_get_data, _set_data, doc=_get_data.__doc__)
+
+
+# Vehicle snapshots (Vehicle.to_snapshot / from_snapshot). The schema is
+# computed once: every constructor field with its default, except the raw
+# payload and what only describes it or this process: the fingerprint of the
+# state the payload came from and the drive history stamp.
+SNAPSHOT_VERSION = 1
+_SNAPSHOT_MAGIC = b"HKVS"
+_SNAPSHOT_FIELDS = tuple(
+    f.name
+    for f in dataclasses.fields(Vehicle)
+    if f.init and f.name not in ("data", "_state_fingerprint", "_driving_info_stamp")
+)
+_SNAPSHOT_FIELD_SET = frozenset(_SNAPSHOT_FIELDS)
+_snapshot_values = attrgetter(*_SNAPSHOT_FIELDS)
+_SNAPSHOT_DEFAULTS = _snapshot_values(Vehicle())
+
+_PLAIN_TYPES = frozenset((str, int, float, bool, type(None)))
+_SNAPSHOT_ENUMS = {
+    value.__name__: value
+    for value in vars(const).values()
+    if isinstance(value, type) and issubclass(value, Enum) and value is not Enum
+}
+_SNAPSHOT_DATACLASSES = {
+    cls.__name__: cls
+    for cls in (TripInfo, DayTripCounts, MonthTripInfo, DayTripInfo, DailyDrivingStats)
+}
+
+
+def _encode_datetime(value: datetime.datetime) -> dict:
+    if isinstance(value.tzinfo, ZoneInfo):
+        return {"$dt": value.isoformat(), "zone": value.tzinfo.key}
+    return {"$dt": value.isoformat()}
+
+
+def _encode_tzinfo(value: datetime.tzinfo) -> dict:
+    if isinstance(value, ZoneInfo):
+        return {"$zone": value.key}
+    return {"$tz": value.utcoffset(None).total_seconds()}
+
+
+_ENCODERS = {
+    datetime.datetime: _encode_datetime,
+    datetime.date: lambda value: {"$date": value.isoformat()},
+    datetime.time: lambda value: {"$time": value.isoformat()},
+    datetime.timezone: _encode_tzinfo,
+    ZoneInfo: _encode_tzinfo,
+    list: lambda value: [_encode(item) for item in value],
+    tuple: lambda value: {"$tuple": [_encode(item) for item in value]},
+    # Wrapped like every other non-JSON value, so that a plain dict is never
+    # mistaken for a tagged one.
+    dict: lambda value: {"$dict": {key: _encode(item) for key, item in value.items()}},
+    bytes: lambda value: {"$bytes": base64.b64encode(value).decode()},
+}
+
+
+def _encode(value):
+    kind = type(value)
+    if kind in _PLAIN_TYPES:
+        return value
+    encoder = _ENCODERS.get(kind)
+    if encoder is not None:
+        return encoder(value)
+    if isinstance(value, Enum) and _SNAPSHOT_ENUMS.get(kind.__name__) is kind:
+        return {"$enum": kind.__name__, "value": _encode(value.value)}
+    if _SNAPSHOT_DATACLASSES.get(kind.__name__) is kind:
+        return {
+            "$dataclass": kind.__name__,
+            "fields": {
+                f.name: _encode(getattr(value, f.name))
+                for f in dataclasses.fields(value)
+            },
+        }
+    raise TypeError(f"Cannot snapshot {kind.__name__} value {value!r}")
+
+
+def _decode_datetime(value: dict) -> datetime.datetime:
+    result = datetime.datetime.fromisoformat(value["$dt"])
+    if "zone" in value:
+        result = result.astimezone(ZoneInfo(value["zone"]))
+    return result
+
+
+def _decode_timezone(value: dict) -> datetime.timezone:
+    offset = value["$tz"]
+    if offset == 0:
+        return datetime.UTC
+    return datetime.timezone(datetime.timedelta(seconds=offset))
+
+
+_DECODERS = {
+    "$dt": _decode_datetime,
+    "$date": lambda value: datetime.date.fromisoformat(value["$date"]),
+    "$time": lambda value: datetime.time.fromisoformat(value["$time"]),
+    "$tz": _decode_timezone,
+    "$zone": lambda value: ZoneInfo(value["$zone"]),
+    "$tuple": lambda value: tuple(_decode(item) for item in value["$tuple"]),
+    "$bytes": lambda value: base64.b64decode(value["$bytes"]),
+    "$enum": lambda value: _SNAPSHOT_ENUMS[value["$enum"]](_decode(value["value"])),
+    "$dict": lambda value: {key: _decode(item) for key, item in value["$dict"].items()},
+    "$dataclass": lambda value: _SNAPSHOT_DATACLASSES[value["$dataclass"]](
+        **{name: _decode(item) for name, item in value["fields"].items()}
+    ),
+}
+
+
+def _decode(value):
+    kind = type(value)
+    if kind is list:
+        return [_decode(item) for item in value]
+    if kind is not dict:
+        return value
+    # Every encoded dict is tagged, with the tag as its first key.
+    return _DECODERS[next(iter(value), None)](value)
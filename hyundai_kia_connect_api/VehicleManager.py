@@ -1,19 +1,28 @@
 """VehicleManager.py"""
 
-# pylint:disable=logging-fstring-interpolation,missing-class-docstring,missing-function-docstring,line-too-long,invalid-name
+# pylint:disable=logging-fstring-interpolation,missing-class-docstring,missing-function-docstring,line-too-long,invalid-name,broad-exception-caught
 
 import datetime as dt
 import logging
+import threading
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import timedelta
+from typing import Self
 
+from .ActionTracker import ActionTracker
 from .ApiImpl import (
     ApiImpl,
     ClimateRequestOptions,
+    ForceRefreshPolling,
     OTPRequest,
     POIInfo,
     ScheduleChargingClimateRequestOptions,
     WindowRequestOptions,
 )
+from .cache import GeocodeCache, ResponseCache, TripHistoryCache
+from .ChangeSet import ChangeSet, vehicle_state
 from .const import (
     BRAND_GENESIS,
     BRAND_HYUNDAI,
@@ -21,8 +30,10 @@ from .const import (
     BRANDS,
     CHARGE_PORT_ACTION,
     DOMAIN,
+    ENGINE_TYPES,
     ORDER_STATUS,
     OTP_NOTIFY_TYPE,
+    RAW_DATA_RETENTION,
     REGION_AUSTRALIA,
     REGION_BRAZIL,
     REGION_CANADA,
@@ -36,6 +47,7 @@ from .const import (
     VEHICLE_LOCK_ACTION,
 )
 from .exceptions import APIError, AuthenticationOTPRequired
+from .ForceRefreshScheduler import ForceRefreshScheduler
 from .HyundaiBlueLinkApiBR import HyundaiBlueLinkApiBR
 from .HyundaiBlueLinkApiUSA import HyundaiBlueLinkApiUSA
 from .KiaUvoApiAU import KiaUvoApiAU
@@ -45,12 +57,91 @@ from .KiaUvoApiEU import KiaUvoApiEU
 from .KiaUvoApiIN import KiaUvoApiIN
 from .KiaUvoApiUSA import KiaUvoApiUSA
 from .Token import Token
-from .Vehicle import Vehicle
+from .TokenRenewer import TokenRenewer
+from .TokenStore import TokenStore
+from .Vehicle import DayTripInfo, MonthTripInfo, Vehicle
 
 _LOGGER = logging.getLogger(__name__)
 
+# Seconds a cached read stays off after a write it depends on; actions get
+# as long to reach a final state, see check_action_status and ActionTracker.
+_WRITE_SETTLE_TIME = 120
+
+# Vehicle attributes kept in a roster snapshot, see roster_snapshot.
+ROSTER_FIELDS = (
+    "id",
+    "name",
+    "model",
+    "registration_date",
+    "year",
+    "VIN",
+    "key",
+    "engine_type",
+    "ccu_ccs2_protocol_support",
+    "generation",
+    "enabled",
+)
+
+
+@dataclass
+class VehicleUpdateResult:
+    """Outcome of a per-vehicle fan-out over all vehicles of an account.
+
+    ``updated`` lists the vehicle ids whose update completed, ``errors`` maps
+    vehicle id to the exception raised for that vehicle. ``unchanged`` lists
+    the updated vehicles whose server state was the same as on the previous
+    update. ``changes`` maps the updated vehicle ids to the fields the update
+    changed.
+    """
+
+    updated: list[str] = field(default_factory=list)
+    errors: dict[str, Exception] = field(default_factory=dict)
+    unchanged: list[str] = field(default_factory=list)
+    changes: dict[str, ChangeSet] = field(default_factory=dict)
+
+    @property
+    def ok(self) -> bool:
+        return not self.errors
+
+    def add(
+        self,
+        vehicle_id: str,
+        changed: bool | None,
+        changes: ChangeSet | None = None,
+    ) -> None:
+        """Record a completed update; ``changed`` False marks it unchanged."""
+        self.updated.append(vehicle_id)
+        if changed is False:
+            self.unchanged.append(vehicle_id)
+        if changes is not None:
+            self.changes[vehicle_id] = changes
+
+    def raise_for_errors(self) -> None:
+        """Re-raise the first collected exception, if any."""
+        for error in self.errors.values():
+            raise error
+
 
 class VehicleManager:
+    force_refresh_scheduler: ForceRefreshScheduler | None = None
+    # Token refreshes actually performed, and callers that waited on one
+    # already in progress instead (see check_and_refresh_token).
+    token_refresh_count: int = 0
+    token_refresh_coalesced: int = 0
+    _token_refresh: Future | None = None
+    _token_listeners: tuple[Callable[[Token], None], ...] = ()
+    _change_listeners: tuple[Callable[[ChangeSet], None], ...] = ()
+    token_renewer: TokenRenewer | None = None
+    action_tracker: ActionTracker | None = None
+    trip_cache: TripHistoryCache | None = None
+    token_store: TokenStore | None = None
+    # Background check of a roster loaded with load_roster, see
+    # revalidate_roster.
+    roster_revalidation: Future | None = None
+    _roster_stale: bool = False
+    # What the vehicles keep of their raw API payloads, see Vehicle.data.
+    raw_data_retention: RAW_DATA_RETENTION = RAW_DATA_RETENTION.KEEP
+
     def __init__(
         self,
         region: int,
@@ -64,6 +155,14 @@ class VehicleManager:
         geocode_api_key: str | None = None,
         token: Token | None = None,
         language: str = "en",
+        max_concurrent_updates: int = 1,
+        max_parallel_requests: int = 1,
+        geocode_cache: GeocodeCache | None = None,
+        response_cache: ResponseCache | None = None,
+        trip_cache: TripHistoryCache | None = None,
+        token_store: TokenStore | None = None,
+        roster: list[dict] | None = None,
+        raw_data_retention: RAW_DATA_RETENTION = RAW_DATA_RETENTION.KEEP,
     ):
         self.region: int = region
         self.brand: int = brand
@@ -75,14 +174,36 @@ class VehicleManager:
         self.pin: str = pin
         self.language: str = language
         self.geocode_api_key: str = geocode_api_key
+        self.raw_data_retention = raw_data_retention
+        # Upper bound on vehicles updated in parallel by the *_all_vehicles /
+        # check_and_force_update_vehicles fan-outs. 1 keeps the sequential loop
+        # that stops on the first failure.
+        self.max_concurrent_updates: int = max_concurrent_updates
 
         self.api: ApiImpl = self.get_implementation_by_region_brand(
             self.region, self.brand, self.language
         )
+        # Concurrent sub-requests within one vehicle update, where the region
+        # supports it (see ApiImpl._run_parallel).
+        self.api.max_parallel_requests = max_parallel_requests
+        # Defaults to the process-wide cache shared by all accounts.
+        if geocode_cache is not None:
+            self.api.geocode_cache = geocode_cache
+        self.api.response_cache = response_cache
+        self.trip_cache = trip_cache
 
         self.token: Token = token
         self.vehicles: dict = {}
         self.otp_request: OTPRequest = None
+        self._token_refresh_lock = threading.Lock()
+        self.token_store = token_store
+        if token_store is not None and self.token is None:
+            self.token = token_store.load(self.token_store_key)
+        # Listeners hear about in-place changes too, with or without a store.
+        self.api.token_updated = self._token_updated
+        self._roster_lock = threading.Lock()
+        if roster:
+            self.load_roster(roster)
 
     @DeprecationWarning
     def initialize(self) -> None:
@@ -102,6 +223,7 @@ class VehicleManager:
         )
         if isinstance(result, Token):
             self.token: Token = result
+            self._save_token()
             self.initialize_vehicles()
             return True
         if isinstance(result, OTPRequest):
@@ -119,31 +241,176 @@ class VehicleManager:
             otp_request=self.otp_request,
             pin=self.pin,
         )
+        self._save_token()
         self.initialize_vehicles()
 
     def initialize_vehicles(self):
+        if self._roster_stale:
+            # Vehicles come from a roster snapshot: keep them and check them
+            # against the server in the background.
+            revalidation = self.revalidate_roster()
+            if self.api.vehicle_keys_per_session:
+                # The roster's vehicle keys belong to an earlier session.
+                revalidation.result()
+            return
         if len(self.vehicles) > 0:
             _LOGGER.warning(
                 "Vehicles already initialized, this will re-initialize and cause data loss mapping errors"
             )
         vehicles = self.api.get_vehicles(self.token)
         for vehicle in vehicles:
-            vehicle.supports_window_control = self.api.supports_window_control
-            vehicle.supports_valet_mode = self.api.supports_valet_mode
-            self.vehicles[vehicle.id] = vehicle
+            self._add_vehicle(self.vehicles, vehicle)
+
+    def _add_vehicle(self, vehicles: dict, vehicle: Vehicle) -> None:
+        vehicle.supports_window_control = self.api.supports_window_control
+        vehicle.supports_valet_mode = self.api.supports_valet_mode
+        vehicle.raw_data_retention = self.raw_data_retention
+        vehicles[vehicle.id] = vehicle
+
+    def roster_snapshot(self) -> list[dict]:
+        """Return the vehicles of the account as JSON-serializable dicts.
+
+        Store it and pass it back as ``roster`` (or to ``load_roster``) after
+        a restart, so logging in does not have to list the vehicles again.
+        """
+        snapshot = []
+        for vehicle in self.vehicles.values():
+            entry = {name: getattr(vehicle, name) for name in ROSTER_FIELDS}
+            if isinstance(entry["engine_type"], ENGINE_TYPES):
+                entry["engine_type"] = entry["engine_type"].value
+            snapshot.append(entry)
+        return snapshot
+
+    def load_roster(self, roster: list[dict]) -> None:
+        """Create the vehicles from a ``roster_snapshot``.
+
+        The roster is used as is and checked against the server once the
+        manager has a token, see ``revalidate_roster``.
+        """
+        vehicles = {}
+        for entry in roster:
+            values = {name: entry[name] for name in ROSTER_FIELDS if name in entry}
+            if values.get("engine_type") is not None:
+                values["engine_type"] = ENGINE_TYPES(values["engine_type"])
+            vehicle = Vehicle(timezone=self.api.data_timezone, **values)
+            self._add_vehicle(vehicles, vehicle)
+        self.vehicles = vehicles
+        self._roster_stale = True
+
+    def revalidate_roster(self) -> Future:
+        """Check the roster against the server's vehicle list in the background.
+
+        Vehicles are matched by id: known ones take the listed keys and names
+        and keep their state, new ones are added and those no longer on the
+        account dropped. Returns a Future resolving once done; a failed check
+        is retried by the next ``check_and_refresh_token``.
+        """
+        with self._roster_lock:
+            if self.roster_revalidation is None or self.roster_revalidation.done():
+                self.roster_revalidation = Future()
+                threading.Thread(
+                    target=self._revalidate_roster,
+                    args=(self.roster_revalidation,),
+                    name=f"{DOMAIN}-roster",
+                    daemon=True,
+                ).start()
+            return self.roster_revalidation
+
+    def _revalidate_roster(self, future: Future) -> None:
+        try:
+            listed = self.api.get_vehicles(self.token)
+        except BaseException as err:
+            _LOGGER.warning(f"{DOMAIN} - Vehicle roster check failed: {err!r}")
+            future.set_exception(err)
+            return
+        vehicles = {}
+        for vehicle in listed:
+            known = self.vehicles.get(vehicle.id)
+            if known is None:
+                _LOGGER.debug(f"{DOMAIN} - New vehicle {vehicle.id} on the account")
+                self._add_vehicle(vehicles, vehicle)
+                continue
+            for name in ROSTER_FIELDS:
+                if name != "enabled":
+                    setattr(known, name, getattr(vehicle, name))
+            # Only the server can disable a vehicle here (Hyundai USA
+            # cancelled enrollments); one disabled locally stays disabled.
+            known.enabled = known.enabled and vehicle.enabled
+            vehicles[vehicle.id] = known
+        for vehicle_id in self.vehicles.keys() - vehicles.keys():
+            _LOGGER.debug(f"{DOMAIN} - Vehicle {vehicle_id} left the account")
+        # Swapped in whole so readers never see a half-merged roster.
+        self.vehicles = vehicles
+        self._roster_stale = False
+        future.set_result(None)
 
     def get_vehicle(self, vehicle_id: str) -> Vehicle:
         return self.vehicles[vehicle_id]
 
-    def update_all_vehicles_with_cached_state(self) -> None:
-        for vehicle_id in self.vehicles:
-            self.update_vehicle_with_cached_state(vehicle_id)
+    def _for_each_vehicle(
+        self, update: Callable[[Vehicle], tuple[bool | None, ChangeSet | None]]
+    ) -> VehicleUpdateResult:
+        """Run ``update(vehicle)`` for every vehicle of the account.
+
+        ``update`` returns the update's result and its ChangeSet. The roster
+        is read once up front: a background revalidation may swap
+        ``self.vehicles`` mid-batch, so workers are handed the vehicle itself
+        rather than an id to look up again.
+
+        With ``max_concurrent_updates`` > 1 the calls run on a bounded thread
+        pool and failures are collected per vehicle instead of aborting the
+        loop. Workers only read ``self.token``; refreshing it stays with the
+        caller (``check_and_refresh_token``) before the fan-out starts, so a
+        batch never races a token swap of its own making.
+        """
+        result = VehicleUpdateResult()
+        vehicles = list(self.vehicles.values())
+        if self.max_concurrent_updates <= 1 or len(vehicles) <= 1:
+            for vehicle in vehicles:
+                result.add(vehicle.id, *update(vehicle))
+            return result
 
-    def update_vehicle_with_cached_state(self, vehicle_id: str) -> None:
-        vehicle = self.get_vehicle(vehicle_id)
+        with ThreadPoolExecutor(
+            max_workers=min(self.max_concurrent_updates, len(vehicles)),
+            thread_name_prefix=f"{DOMAIN}-update",
+        ) as executor:
+            futures = {
+                vehicle.id: executor.submit(update, vehicle) for vehicle in vehicles
+            }
+            for vehicle_id, future in futures.items():
+                try:
+                    future.result()
+                except Exception as err:
+                    _LOGGER.warning(
+                        f"{DOMAIN} - Update of vehicle {vehicle_id} failed: {err!r}"
+                    )
+                    result.errors[vehicle_id] = err
+                else:
+                    result.add(vehicle_id, *future.result())
+        return result
+
+    def update_all_vehicles_with_cached_state(self) -> VehicleUpdateResult:
+        return self._for_each_vehicle(self._update_vehicle_with_cached_state)
+
+    def update_vehicle_with_cached_state(self, vehicle_id: str) -> bool:
+        """Update the vehicle from the server cache.
+
+        Returns False when the server returned the same state as on the
+        previous update, so the vehicle was left as it was, else True.
+        """
+        return self._update_vehicle_with_cached_state(self.get_vehicle(vehicle_id))[0]
+
+    def _update_vehicle_with_cached_state(
+        self, vehicle: Vehicle
+    ) -> tuple[bool, ChangeSet | None]:
+        changed = True
+        changes = None
         if vehicle.enabled:
+            before = vehicle_state(vehicle)
             vehicle.last_scanned_at = dt.datetime.now(dt.UTC)
+            fingerprint = vehicle._state_fingerprint
             self.api.update_vehicle_with_cached_state(self.token, vehicle)
+            changed = fingerprint is None or vehicle._state_fingerprint != fingerprint
             if self.geocode_api_enable is True:
                 self.api.update_geocoded_location(
                     token=self.token,
@@ -152,47 +419,275 @@ class VehicleManager:
                     provider=self.geocode_provider,
                     API_KEY=self.geocode_api_key,
                 )
+            changes = self._changed(vehicle, before)
         else:
             _LOGGER.debug(f"{DOMAIN} - Vehicle Disabled, skipping.")
-
-    def check_and_force_update_vehicles(self, force_refresh_interval: int) -> None:
-        for vehicle_id in self.vehicles:
-            self.check_and_force_update_vehicle(force_refresh_interval, vehicle_id)
+        return changed, changes
+
+    def check_and_force_update_vehicles(
+        self, force_refresh_interval: int
+    ) -> VehicleUpdateResult:
+        return self._for_each_vehicle(
+            lambda vehicle: self._check_and_force_update_vehicle(
+                force_refresh_interval, vehicle
+            )
+        )
 
     def check_and_force_update_vehicle(
         self, force_refresh_interval: int, vehicle_id: str
-    ) -> None:
+    ) -> bool:
         # Force refresh only if current data is older than the value bassed in seconds.
         # Otherwise runs a cached update.
+        if self._needs_force_refresh(
+            force_refresh_interval, self.get_vehicle(vehicle_id)
+        ):
+            self.force_refresh_vehicle_state(vehicle_id)
+            return True
+        return self.update_vehicle_with_cached_state(vehicle_id)
+
+    def _check_and_force_update_vehicle(
+        self, force_refresh_interval: int, vehicle: Vehicle
+    ) -> tuple[bool, ChangeSet | None]:
+        if self._needs_force_refresh(force_refresh_interval, vehicle):
+            return True, self._force_refresh_vehicle_state(vehicle)[1]
+        return self._update_vehicle_with_cached_state(vehicle)
+
+    def _needs_force_refresh(
+        self, force_refresh_interval: int, vehicle: Vehicle
+    ) -> bool:
         started_at_utc: dt.datetime = dt.datetime.now(dt.UTC)
-        vehicle = self.get_vehicle(vehicle_id)
-        if vehicle.last_updated_at is not None:
-            _LOGGER.debug(
-                f"{DOMAIN} - Time differential in seconds: {(started_at_utc - vehicle.last_updated_at).total_seconds()}"
-            )
-            if (
-                started_at_utc - vehicle.last_updated_at
-            ).total_seconds() > force_refresh_interval:
-                self.force_refresh_vehicle_state(vehicle_id)
-            else:
-                self.update_vehicle_with_cached_state(vehicle_id)
-        else:
-            self.update_vehicle_with_cached_state(vehicle_id)
+        if vehicle.last_updated_at is None:
+            return False
+        _LOGGER.debug(
+            f"{DOMAIN} - Time differential in seconds: {(started_at_utc - vehicle.last_updated_at).total_seconds()}"
+        )
+        return (
+            started_at_utc - vehicle.last_updated_at
+        ).total_seconds() > force_refresh_interval
 
-    def force_refresh_all_vehicles_states(self) -> None:
-        for vehicle_id in self.vehicles:
-            self.force_refresh_vehicle_state(vehicle_id)
+    def force_refresh_all_vehicles_states(self) -> VehicleUpdateResult:
+        return self._for_each_vehicle(self._force_refresh_vehicle_state)
 
     def force_refresh_vehicle_state(self, vehicle_id: str) -> None:
+        self._force_refresh_vehicle_state(self.get_vehicle(vehicle_id))
+
+    def _force_refresh_vehicle_state(
+        self, vehicle: Vehicle
+    ) -> tuple[None, ChangeSet | None]:
+        if not vehicle.enabled:
+            _LOGGER.debug(f"{DOMAIN} - Vehicle Disabled, skipping.")
+            return None, None
+        before = vehicle_state(vehicle)
+        vehicle.last_scanned_at = dt.datetime.now(dt.UTC)
+        self.api.force_refresh_vehicle_state(self.token, vehicle)
+        return None, self._changed(vehicle, before)
+
+    def start_force_refresh(
+        self, vehicle_id: str, polling: ForceRefreshPolling | None = None
+    ) -> Future:
+        """Start a force refresh without blocking the caller.
+
+        Returns a Future resolving to the Vehicle once fresh data has been
+        applied (or raising the region's error). Regions that wake the car and
+        wait poll the cached snapshot per ``polling`` instead of sleeping a
+        fixed time; all refreshes of this manager share one scheduler thread.
+        """
         vehicle = self.get_vehicle(vehicle_id)
-        if vehicle.enabled:
-            vehicle.last_scanned_at = dt.datetime.now(dt.UTC)
-            self.api.force_refresh_vehicle_state(self.token, vehicle)
-        else:
+        if not vehicle.enabled:
             _LOGGER.debug(f"{DOMAIN} - Vehicle Disabled, skipping.")
+            future = Future()
+            future.set_result(vehicle)
+            return future
+        if self.force_refresh_scheduler is None:
+            self.force_refresh_scheduler = ForceRefreshScheduler()
+        before = vehicle_state(vehicle)
+        vehicle.last_scanned_at = dt.datetime.now(dt.UTC)
+        steps = self.api.force_refresh_vehicle_state_steps(
+            self.token, vehicle, polling or ForceRefreshPolling()
+        )
+        future = self.force_refresh_scheduler.submit(steps, result=vehicle)
+
+        def report_changes(done: Future) -> None:
+            if not done.cancelled() and done.exception() is None:
+                self._changed(vehicle, before)
+
+        future.add_done_callback(report_changes)
+        return future
 
-    def check_and_refresh_token(self) -> bool:
+    def add_token_listener(
+        self, listener: Callable[[Token], None]
+    ) -> Callable[[], None]:
+        """Call ``listener`` with the token whenever it is replaced or renewed.
+
+        Use it to persist the token. Returns a function removing the listener.
+        """
+        self._token_listeners = (*self._token_listeners, listener)
+
+        def remove() -> None:
+            self._token_listeners = tuple(
+                registered
+                for registered in self._token_listeners
+                if registered is not listener
+            )
+
+        return remove
+
+    def add_change_listener(
+        self, listener: Callable[[ChangeSet], None]
+    ) -> Callable[[], None]:
+        """Call ``listener`` with the ChangeSet of every update changing a vehicle.
+
+        Listeners run on the thread that made the update, so they see the
+        changes of one vehicle in order. Returns a function removing the
+        listener.
+        """
+        self._change_listeners = (*self._change_listeners, listener)
+
+        def remove() -> None:
+            self._change_listeners = tuple(
+                registered
+                for registered in self._change_listeners
+                if registered is not listener
+            )
+
+        return remove
+
+    def _changed(self, vehicle: Vehicle, before: tuple) -> ChangeSet:
+        changes = ChangeSet.since(vehicle, before)
+        if changes:
+            for listener in self._change_listeners:
+                try:
+                    listener(changes)
+                except Exception as err:
+                    _LOGGER.warning(f"{DOMAIN} - Change listener failed: {err!r}")
+        return changes
+
+    @property
+    def token_store_key(self) -> str:
+        """Key of this account's token in the token store."""
+        return f"{self.region}:{self.brand}:{self.username}"
+
+    def _save_token(self) -> None:
+        if self.token_store is not None and self.token is not None:
+            self.token_store.save(self.token_store_key, self.token)
+
+    def _token_updated(self, token: Token) -> None:
+        if token is self.token:
+            self._save_token()
+            self._notify_token_listeners()
+
+    def _notify_token_listeners(self) -> None:
+        for listener in self._token_listeners:
+            try:
+                listener(self.token)
+            except Exception as err:
+                _LOGGER.warning(f"{DOMAIN} - Token listener failed: {err!r}")
+
+    def start_token_renewal(
+        self,
+        lead_time: float = 300,
+        jitter: float = 60,
+        control_lead_time: float = 30,
+        retry_interval: float = 60,
+    ) -> TokenRenewer:
+        """Renew the tokens in the background ahead of expiry (see TokenRenewer)."""
+        self.stop_token_renewal()
+        self.token_renewer = TokenRenewer(
+            self,
+            lead_time=lead_time,
+            jitter=jitter,
+            control_lead_time=control_lead_time,
+            retry_interval=retry_interval,
+        )
+        self.token_renewer.start()
+        return self.token_renewer
+
+    def stop_token_renewal(self) -> None:
+        if self.token_renewer is not None:
+            self.token_renewer.stop()
+            self.token_renewer = None
+
+    def close(self) -> None:
+        """Stop the manager's background work and release its threads.
+
+        Stops token renewal, cancels waiting force refreshes and tracked
+        actions, and shuts down the API's request thread pool.
+        """
+        self.stop_token_renewal()
+        if self.force_refresh_scheduler is not None:
+            self.force_refresh_scheduler.shutdown()
+            self.force_refresh_scheduler = None
+        if self.action_tracker is not None:
+            self.action_tracker.shutdown()
+            self.action_tracker = None
+        self.api.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def check_and_refresh_token(self, lead_time: float = 0) -> bool:
+        """Log in or refresh the token if needed; True if the token changed.
+
+        The access token is refreshed once it expires within ``lead_time``
+        seconds (at least 10). Token listeners are notified of a new token.
+
+        Single-flight: a caller arriving while another thread is already
+        checking waits for that check and shares its outcome (the new token,
+        or the exception) rather than starting a second refresh or login.
+        """
+        with self._token_refresh_lock:
+            waiting_on = self._token_refresh
+            if waiting_on is None:
+                in_flight = self._token_refresh = Future()
+            else:
+                self.token_refresh_coalesced += 1
+        if waiting_on is not None:
+            return waiting_on.result()
+        previous_token = self.token
+        try:
+            result = self._check_and_refresh_token(lead_time)
+        except BaseException as err:
+            in_flight.set_exception(err)
+            raise
+        else:
+            in_flight.set_result(result)
+            if self.token is not previous_token:
+                self._notify_token_listeners()
+            if self._roster_stale:
+                self.revalidate_roster()
+            return result
+        finally:
+            with self._token_refresh_lock:
+                self._token_refresh = None
+
+    def _check_and_refresh_token(self, lead_time: float = 0) -> bool:
+        if self.token_store is None:
+            return self._refresh_token_if_needed(lead_time)
+        # Hold off other managers of the account, in this or other processes,
+        # and start from the token they may have stored meanwhile.
+        with self.token_store.lock(self.token_store_key):
+            stored = self.token_store.load(self.token_store_key)
+            if stored is not None:
+                stored.pin = self.pin
+            adopted = stored is not None and stored != self.token
+            if adopted:
+                _LOGGER.debug(f"{DOMAIN} - Using token from token store")
+                self.token = stored
+            token = self.token
+            changed = self._refresh_token_if_needed(lead_time)
+            if self.token is not token:
+                self._save_token()
+            elif adopted and self.vehicles:
+                # Vehicle data can be tied to the session (Kia USA).
+                self.api.refresh_vehicles(self.token, self.vehicles)
+            return changed or adopted
+
+    def _refresh_token_if_needed(self, lead_time: float) -> bool:
         if self.token is None:
+            self.token_refresh_count += 1
             if self.login() is True:
                 if len(self.vehicles) == 0:
                     self.initialize_vehicles()
@@ -200,7 +695,7 @@ class VehicleManager:
             else:
                 raise AuthenticationOTPRequired("OTP required to refresh token")
         now_utc = dt.datetime.now(dt.UTC)
-        grace_period = timedelta(seconds=10)
+        grace_period = timedelta(seconds=max(10, lead_time))
         min_supported_datetime = dt.datetime.min.replace(tzinfo=dt.UTC)
         valid_until = self.token.valid_until
         token_expired = False
@@ -215,6 +710,7 @@ class VehicleManager:
                 token_expired = valid_until - grace_period <= now_utc
         if token_expired or self.api.test_token(self.token) is False:
             _LOGGER.debug(f"{DOMAIN} - Refresh token expired")
+            self.token_refresh_count += 1
             result = self.api.refresh_access_token(
                 self.token,
             )
@@ -266,9 +762,14 @@ class VehicleManager:
         )
 
     def set_charge_limits(self, vehicle_id: str, ac: int, dc: int) -> str:
-        return self.api.set_charge_limits(
+        result = self.api.set_charge_limits(
             self.token, self.get_vehicle(vehicle_id), ac, dc
         )
+        if self.api.response_cache is not None:
+            self.api.response_cache.invalidate(
+                "charge_limits", vehicle_id, settle=_WRITE_SETTLE_TIME
+            )
+        return result
 
     def set_charging_current(self, vehicle_id: str, level: int) -> str:
         return self.api.set_charging_current(
@@ -312,6 +813,30 @@ class VehicleManager:
             self.token, self.get_vehicle(vehicle_id), action_id, synchronous, timeout
         )
 
+    def check_action_statuses(
+        self, vehicle_id: str, action_ids: list[str]
+    ) -> dict[str, ORDER_STATUS]:
+        """Current status of several actions sent to one vehicle, without waiting."""
+        return self.api.check_action_statuses(
+            self.token, self.get_vehicle(vehicle_id), action_ids
+        )
+
+    def track_action(
+        self,
+        vehicle_id: str,
+        action_id: str,
+        callback: Callable[[ORDER_STATUS], None] | None = None,
+    ) -> Future:
+        """Wait for an action in the background; see ActionTracker.
+
+        Returns a Future resolving to the final ORDER_STATUS. All tracked
+        actions of a vehicle are resolved from a single status request per
+        poll, however many are pending.
+        """
+        if self.action_tracker is None:
+            self.action_tracker = ActionTracker(self)
+        return self.action_tracker.track(vehicle_id, action_id, callback)
+
     def open_charge_port(self, vehicle_id: str) -> str:
         return self.api.charge_port_action(
             self.token, self.get_vehicle(vehicle_id), CHARGE_PORT_ACTION.OPEN
@@ -332,7 +857,12 @@ class VehicleManager:
         month_trip_info: MonthTripInfo = None
         """
         vehicle = self.get_vehicle(vehicle_id)
-        self.api.update_month_trip_info(self.token, vehicle, yyyymm_string)
+
+        def fetch() -> MonthTripInfo | None:
+            self.api.update_month_trip_info(self.token, vehicle, yyyymm_string)
+            return vehicle.month_trip_info
+
+        vehicle.month_trip_info = self._cached_trip_info(vehicle, yyyymm_string, fetch)
 
     def update_day_trip_info(self, vehicle_id: str, yyyymmdd_string: str) -> None:
         """
@@ -344,7 +874,75 @@ class VehicleManager:
         day_trip_info: DayTripInfo = None
         """
         vehicle = self.get_vehicle(vehicle_id)
-        self.api.update_day_trip_info(self.token, vehicle, yyyymmdd_string)
+
+        def fetch() -> DayTripInfo | None:
+            self.api.update_day_trip_info(self.token, vehicle, yyyymmdd_string)
+            return vehicle.day_trip_info
+
+        vehicle.day_trip_info = self._cached_trip_info(vehicle, yyyymmdd_string, fetch)
+
+    def _cached_trip_info(
+        self,
+        vehicle: Vehicle,
+        period: str,
+        fetch: Callable[[], MonthTripInfo | DayTripInfo | None],
+    ) -> MonthTripInfo | DayTripInfo | None:
+        if self.trip_cache is None:
+            return fetch()
+        return self.trip_cache.get_or_fetch(vehicle.id, period, fetch, vehicle.timezone)
+
+    def fetch_trip_history(
+        self,
+        vehicle_id: str,
+        start: dt.date,
+        end: dt.date,
+        max_workers: int = 4,
+    ) -> Iterator[DayTripInfo]:
+        """
+        feature only available for some regions.
+        Yields the DayTripInfo of every day from start to end (inclusive) that
+        has trips, in date order.
+
+        The month summaries are read first so only days with trips are
+        requested; up to max_workers requests run concurrently. Unlike
+        update_day_trip_info, vehicle.day_trip_info is left untouched.
+        """
+        vehicle = self.get_vehicle(vehicle_id)
+        first_day, last_day = start.strftime("%Y%m%d"), end.strftime("%Y%m%d")
+        months = []
+        year, month = start.year, start.month
+        while (year, month) <= (end.year, end.month):
+            months.append(f"{year:04d}{month:02d}")
+            year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+
+        with ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix=f"{DOMAIN}-trips"
+        ) as executor:
+            month_infos = executor.map(
+                lambda yyyymm: self._cached_trip_info(
+                    vehicle,
+                    yyyymm,
+                    lambda: self.api.get_month_trip_info(self.token, vehicle, yyyymm),
+                ),
+                months,
+            )
+            days = sorted(
+                day.yyyymmdd
+                for month_info in month_infos
+                if month_info is not None
+                for day in month_info.day_list
+                if day.trip_count and first_day <= day.yyyymmdd <= last_day
+            )
+            for day_info in executor.map(
+                lambda yyyymmdd: self._cached_trip_info(
+                    vehicle,
+                    yyyymmdd,
+                    lambda: self.api.get_day_trip_info(self.token, vehicle, yyyymmdd),
+                ),
+                days,
+            ):
+                if day_info is not None:
+                    yield day_info
 
     def disable_vehicle(self, vehicle_id: str) -> None:
         self.get_vehicle(vehicle_id).enabled = False
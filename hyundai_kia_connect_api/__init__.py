@@ -7,10 +7,19 @@ from .ApiImpl import (
     ScheduleChargingClimateRequestOptions,
     POIInfo,
     POICoord,
+    ForceRefreshPolling,
 )
 
 from .Token import Token
 from .Vehicle import Vehicle
-from .VehicleManager import VehicleManager
+from .ChangeSet import ChangeSet
+from .VehicleManager import VehicleManager, VehicleUpdateResult
+from .AsyncVehicleManager import AsyncVehicleManager
+from .ForceRefreshScheduler import ForceRefreshScheduler
+from .TokenRenewer import TokenRenewer
+from .TokenStore import FileTokenStore, MemoryTokenStore, TokenStore
+from .ActionTracker import ActionTracker
+from .FleetManager import FleetManager, FleetStats
+from .cache import CacheStats, GeocodeCache, ResponseCache, TripHistoryCache
 
-from .const import WINDOW_STATE
+from .const import RAW_DATA_RETENTION, SNAPSHOT_ENCODING, WINDOW_STATE
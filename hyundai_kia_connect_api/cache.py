@@ -0,0 +1,359 @@
+"""cache.py"""
+
+# pylint:disable=invalid-name
+
+import datetime as dt
+import json
+import sqlite3
+import threading
+import time
+from collections import Counter, OrderedDict
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from typing import Any
+
+from .Vehicle import DayTripCounts, DayTripInfo, MonthTripInfo, TripInfo
+
+
+@dataclass
+class CacheStats:
+    """Hit/miss counters of a cache."""
+
+    hits: int = 0
+    misses: int = 0
+    size: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class GeocodeCache:
+    """Reverse-geocoding results keyed by grid-snapped coordinates.
+
+    Coordinates are snapped to ``precision`` decimal places (4 is roughly an
+    11 m grid), so a car parked in the same spot resolves to the same entry
+    however the GPS fix jitters. Entries are kept per provider, in an LRU
+    bounded to ``max_entries``, and shared by every vehicle and account using
+    the cache. With ``path`` the entries are also stored in an SQLite file
+    and survive restarts; evicted entries are reloaded from it on demand.
+    Only JSON serializable results (such as the OpenStreetMap tuples) are
+    persisted, other results are cached in memory only.
+    """
+
+    def __init__(
+        self,
+        precision: int = 4,
+        max_entries: int = 1024,
+        path: str | None = None,
+    ) -> None:
+        self.precision = precision
+        self.max_entries = max_entries
+        self._entries: OrderedDict[tuple[int, int, int], Any] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._db: sqlite3.Connection | None = None
+        if path is not None:
+            self._db = sqlite3.connect(path, check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS geocode ("
+                "provider INTEGER, lat INTEGER, lon INTEGER, value TEXT, "
+                "PRIMARY KEY (provider, lat, lon))"
+            )
+            self._db.commit()
+
+    def key(
+        self, provider: int, latitude: float, longitude: float
+    ) -> tuple[int, int, int]:
+        scale = 10**self.precision
+        return provider, round(latitude * scale), round(longitude * scale)
+
+    def get(self, provider: int, latitude: float, longitude: float) -> Any | None:
+        key = self.key(provider, latitude, longitude)
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None and self._db is not None:
+                row = self._db.execute(
+                    "SELECT value FROM geocode WHERE provider=? AND lat=? AND lon=?",
+                    key,
+                ).fetchone()
+                if row is not None:
+                    value = json.loads(row[0])
+                    if isinstance(value, list):
+                        value = tuple(value)
+                    self._store(key, value)
+            if value is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def put(self, provider: int, latitude: float, longitude: float, value) -> None:
+        key = self.key(provider, latitude, longitude)
+        with self._lock:
+            self._store(key, value)
+            if self._db is None:
+                return
+            try:
+                encoded = json.dumps(value)
+            except TypeError:
+                return
+            self._db.execute(
+                "INSERT OR REPLACE INTO geocode VALUES (?, ?, ?, ?)", (*key, encoded)
+            )
+            self._db.commit()
+
+    def _store(self, key: tuple[int, int, int], value) -> None:
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    @property
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(self._hits, self._misses, len(self._entries))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            if self._db is not None:
+                self._db.execute("DELETE FROM geocode")
+                self._db.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+
+# Seconds responses of each ResponseCache endpoint are reused for by default.
+DEFAULT_RESPONSE_TTLS: dict[str, float] = {
+    "next_service": 3600,
+    "charge_limits": 900,
+    "driving_history_total": 1800,
+}
+
+
+class ResponseCache:
+    """Per-endpoint TTL cache for API reads whose data rarely changes.
+
+    Responses are keyed by endpoint name and vehicle id and reused until
+    their endpoint's TTL (from ``ttls``, else ``default_ttl``) expires; a TTL
+    of 0 disables caching for that endpoint. Failed fetches are not cached.
+    VehicleManager invalidates the entries a control command makes stale,
+    e.g. ``set_charge_limits`` drops ``charge_limits`` and keeps it uncached
+    until the car has had time to apply the new limits.
+    """
+
+    def __init__(
+        self, ttls: dict[str, float] | None = None, default_ttl: float = 300
+    ) -> None:
+        self.ttls = {**DEFAULT_RESPONSE_TTLS, **(ttls or {})}
+        self.default_ttl = default_ttl
+        self._entries: dict[tuple[str, str], tuple[float, Any]] = {}
+        self._settling: dict[tuple[str, str], float] = {}
+        self._lock = threading.Lock()
+        self._hits: Counter = Counter()
+        self._misses: Counter = Counter()
+
+    def get_or_fetch(
+        self,
+        endpoint: str,
+        key: str,
+        fetch: Callable[[], Any],
+        max_age: float | None = None,
+    ) -> Any:
+        """Return the cached response, or ``fetch()`` and cache it.
+
+        ``max_age`` further limits the age of a usable entry, for callers
+        that know the data may have changed since a point in time.
+        """
+        ttl = self.ttls.get(endpoint, self.default_ttl)
+        with self._lock:
+            entry = self._entries.get((endpoint, key))
+            if entry is not None:
+                age = time.monotonic() - entry[0]
+                if age < ttl and (max_age is None or age <= max_age):
+                    self._hits[endpoint] += 1
+                    return entry[1]
+            self._misses[endpoint] += 1
+        fetched_at = time.monotonic()
+        value = fetch()
+        if ttl > 0:
+            with self._lock:
+                settled_at = self._settling.get((endpoint, key))
+                if settled_at is None or fetched_at >= settled_at:
+                    self._settling.pop((endpoint, key), None)
+                    self._entries[(endpoint, key)] = (fetched_at, value)
+        return value
+
+    def invalidate(
+        self, endpoint: str | None = None, key: str | None = None, settle: float = 0
+    ) -> None:
+        """Drop the entries matching ``endpoint`` and ``key`` (None matches all).
+
+        With ``settle``, reads of that one entry fetched within the next
+        ``settle`` seconds are not cached, for a write the server may still
+        answer with the old value until the car has applied it.
+        """
+        if settle and (endpoint is None or key is None):
+            raise ValueError("settle needs both an endpoint and a key")
+        with self._lock:
+            if settle:
+                self._settling[(endpoint, key)] = time.monotonic() + settle
+            self._entries = {
+                (entry_endpoint, entry_key): entry
+                for (entry_endpoint, entry_key), entry in self._entries.items()
+                if endpoint not in (None, entry_endpoint)
+                or key not in (None, entry_key)
+            }
+
+    @property
+    def stats(self) -> dict[str, CacheStats]:
+        """Hit/miss counters and current size per endpoint."""
+        with self._lock:
+            sizes = Counter(endpoint for endpoint, _ in self._entries)
+            return {
+                endpoint: CacheStats(
+                    self._hits[endpoint], self._misses[endpoint], sizes[endpoint]
+                )
+                for endpoint in self._hits.keys() | self._misses.keys()
+            }
+
+
+def _trip_info_to_json(info: MonthTripInfo | DayTripInfo) -> str:
+    return json.dumps(asdict(info))
+
+
+def _trip_info_from_json(period: str, encoded: str) -> MonthTripInfo | DayTripInfo:
+    data = json.loads(encoded)
+    summary = TripInfo(**data["summary"]) if data["summary"] else None
+    if len(period) == 6:
+        return MonthTripInfo(
+            yyyymm=data["yyyymm"],
+            summary=summary,
+            day_list=[DayTripCounts(**day) for day in data["day_list"]],
+        )
+    return DayTripInfo(
+        yyyymmdd=data["yyyymmdd"],
+        summary=summary,
+        trip_list=[TripInfo(**trip) for trip in data["trip_list"]],
+    )
+
+
+class TripHistoryCache:
+    """Month and day trip info keyed by vehicle id and ``yyyymm``/``yyyymmdd``.
+
+    Trips of a closed period (a month or day before the current one in the
+    vehicle's timezone, allowing ``grace`` seconds for late uploads after
+    midnight) can no longer change, so they are cached for good. The current
+    month and day, and periods the API returned nothing for (which may be
+    transient, e.g. Hyundai USA before its first update), are reused for
+    ``open_ttl`` seconds only. Entries live in an LRU bounded to
+    ``max_entries``; with ``path`` closed periods are also stored in an
+    SQLite file and survive restarts.
+    """
+
+    def __init__(
+        self,
+        open_ttl: float = 300,
+        grace: float = 3600,
+        max_entries: int = 512,
+        path: str | None = None,
+    ) -> None:
+        self.open_ttl = open_ttl
+        self.grace = grace
+        self.max_entries = max_entries
+        # (vehicle id, period) -> (expiry in time.monotonic() terms or None, info)
+        self._entries: OrderedDict[tuple[str, str], tuple[float | None, Any]] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._db: sqlite3.Connection | None = None
+        if path is not None:
+            self._db = sqlite3.connect(path, check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS trips ("
+                "vehicle_id TEXT, period TEXT, value TEXT, "
+                "PRIMARY KEY (vehicle_id, period))"
+            )
+            self._db.commit()
+
+    def is_closed(self, period: str, timezone: dt.tzinfo | None = None) -> bool:
+        """Whether no more trips can be added to a ``yyyymm``/``yyyymmdd`` period."""
+        current = dt.datetime.now(timezone) - dt.timedelta(seconds=self.grace)
+        return period < current.strftime("%Y%m%d")[: len(period)]
+
+    def get_or_fetch(
+        self,
+        vehicle_id: str,
+        period: str,
+        fetch: Callable[[], MonthTripInfo | DayTripInfo | None],
+        timezone: dt.tzinfo | None = None,
+    ) -> MonthTripInfo | DayTripInfo | None:
+        key = (vehicle_id, period)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None and self._db is not None:
+                row = self._db.execute(
+                    "SELECT value FROM trips WHERE vehicle_id=? AND period=?", key
+                ).fetchone()
+                # Files written by earlier versions may hold empty results.
+                if row is not None and row[0] != "null":
+                    entry = (None, _trip_info_from_json(period, row[0]))
+                    self._store(key, entry)
+            if entry is not None and (entry[0] is None or entry[0] > time.monotonic()):
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return entry[1]
+            self._misses += 1
+        info = fetch()
+        closed = info is not None and self.is_closed(period, timezone)
+        with self._lock:
+            self._store(
+                key, (None if closed else time.monotonic() + self.open_ttl, info)
+            )
+            if closed and self._db is not None:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO trips VALUES (?, ?, ?)",
+                    (*key, _trip_info_to_json(info)),
+                )
+                self._db.commit()
+        return info
+
+    def _store(self, key: tuple[str, str], entry: tuple[float | None, Any]) -> None:
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, vehicle_id: str, period: str | None = None) -> None:
+        """Drop a vehicle's cached period, or all of its periods."""
+        with self._lock:
+            for key in list(self._entries):
+                if key[0] == vehicle_id and period in (None, key[1]):
+                    del self._entries[key]
+            if self._db is not None:
+                self._db.execute(
+                    "DELETE FROM trips WHERE vehicle_id=? AND (? IS NULL OR period=?)",
+                    (vehicle_id, period, period),
+                )
+                self._db.commit()
+
+    @property
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(self._hits, self._misses, len(self._entries))
+
+    def close(self) -> None:
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
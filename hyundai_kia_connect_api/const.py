@@ -152,6 +152,25 @@ class VALET_MODE_ACTION(Enum):
     DEACTIVATE = "deactivate"
 
 
+class RAW_DATA_RETENTION(Enum):
+    """What a Vehicle keeps of the raw API payload in ``Vehicle.data``."""
+
+    KEEP = "keep"
+    # zlib-compressed JSON, decoded into a new copy on every read of
+    # Vehicle.data.
+    COMPRESS = "compress"
+    # Not kept: Vehicle.data is always None.
+    DROP = "drop"
+
+
+class SNAPSHOT_ENCODING(Enum):
+    """Encodings of Vehicle.to_snapshot."""
+
+    JSON = "json"
+    # zlib-compressed JSON behind a version header.
+    BINARY = "binary"
+
+
 class OTP_NOTIFY_TYPE(Enum):
     EMAIL = "EMAIL"
     SMS = "SMS"
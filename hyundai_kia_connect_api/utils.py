@@ -2,10 +2,12 @@
 """utils.py"""
 
 import datetime
+import functools
 import logging
 import re
+from collections.abc import Callable
 from enum import IntEnum
-from typing import Any
+from typing import Any, NamedTuple
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -31,16 +33,121 @@ def to_int_enum[T: IntEnum](
 
 
 def get_child_value(data, key):
-    value = data
-    for x in key.split("."):
+    return compile_path(key)(data)
+
+
+_MISSING = object()
+
+
+def _get_item(value, name: str, index: int | None):
+    # Any container other than a plain dict or list: mappings with integer
+    # keys, strings, ...
+    try:
+        return value[name]
+    except Exception:
         try:
-            value = value[x]
+            return value[index if index is not None else int(name)]
         except Exception:
-            try:
-                value = value[int(x)]
-            except Exception:
-                value = None
-    return value
+            return None
+
+
+@functools.lru_cache(maxsize=4096)
+def compile_path(key: str) -> Callable[[Any], Any]:
+    """Return an accessor reading the dotted ``key`` from a payload.
+
+    ``compile_path("Cabin.Door.Row1.Driver.Lock")(state)`` equals
+    ``get_child_value(state, "Cabin.Door.Row1.Driver.Lock")``: each part is a
+    dict key, or a list index when it is a number, and a missing part gives
+    None. The path is split once, and neither hits nor misses in dicts and
+    lists raise exceptions on the way.
+    """
+    names = tuple(key.split("."))
+    steps = []
+    for name in names:
+        try:
+            index = int(name)
+        except ValueError:
+            index = None
+        steps.append((name, index))
+    steps = tuple(steps)
+
+    def walk(data):
+        value = data
+        for name, index in steps:
+            if type(value) is dict:
+                found = value.get(name, _MISSING)
+                if found is _MISSING:
+                    if index is None:
+                        return None
+                    found = value.get(index)
+                value = found
+            elif type(value) is list:
+                if index is None or not -len(value) <= index < len(value):
+                    return None
+                value = value[index]
+            elif value is None:
+                return None
+            else:
+                value = _get_item(value, name, index)
+        return value
+
+    def get(data):
+        # Nested dicts all the way down: the common case.
+        value = data
+        for name in names:
+            if type(value) is not dict:
+                return walk(data)
+            value = value.get(name, _MISSING)
+            if value is _MISSING:
+                return walk(data)
+        return value
+
+    return get
+
+
+# Returned by a FieldMapping converter to leave the attribute as it is.
+UNCHANGED = object()
+
+
+class FieldMapping(NamedTuple):
+    """One row of a declarative payload -> Vehicle mapping table.
+
+    The value at ``path`` is passed through ``convert`` (if any) and stored in
+    the Vehicle ``attribute``, as ``(value, unit)`` when a unit is given. A
+    converter returning UNCHANGED, or with ``keep_previous`` a converted value
+    of None, leaves the attribute untouched.
+    """
+
+    path: str
+    attribute: str
+    convert: Callable[[Any], Any] | None = None
+    unit: Any = None
+    keep_previous: bool = False
+
+
+def compile_field_mappings(mappings) -> tuple:
+    """Compile FieldMapping rows once into flat extraction ops for apply_fields."""
+    return tuple(
+        (
+            compile_path(mapping.path),
+            mapping.attribute,
+            mapping.convert,
+            mapping.unit,
+            mapping.keep_previous,
+        )
+        for mapping in mappings
+    )
+
+
+def apply_fields(target, data, ops) -> None:
+    """Run ops from compile_field_mappings against ``data``, in table order."""
+    for get, attribute, convert, unit, keep_previous in ops:
+        value = get(data)
+        if convert is not None:
+            value = convert(value)
+        if value is UNCHANGED or (value is None and keep_previous):
+            continue
+        setattr(target, attribute, value if unit is None else (value, unit))
 
 
 def window_is_open(
@@ -179,41 +286,55 @@ def get_index_into_hex_temp(value):
         return None
 
 
+# "Tue, 24 Jun 2025 16:18:10 GMT" (newer endpoints).
+_HTTP_DATE_FORMAT = "%a, %d %b %Y %H:%M:%S GMT"
+# Compact "20250624161810[.000]" and ISO "2025-06-24T16:18:10Z" once the
+# separators are dropped.
+_DATETIME_DIGITS = re.compile(r"(\d{4})(\d{2})(\d{2})(\d{2})(\d{2})(\d{2})")
+_DATETIME_SEPARATORS = str.maketrans("", "", "-T:Z")
+
+
 def parse_datetime(value, timezone) -> datetime.datetime | None:
     # Missing timestamp must surface as None (HA renders "unknown") rather than
     # a 2000-01-01 sentinel that renders as "27 years ago". See kia_uvo #1771.
     if value is None:
         return None
+    if not isinstance(value, str):
+        raise TypeError(f"Unable to parse datetime value: {value!r}")
+    # The same timestamps recur across fields and polls; datetimes are
+    # immutable, so the parsed value can be shared.
+    return _parse_datetime(value, timezone)
 
-    # Try parsing the new format: Tue, 24 Jun 2025 16:18:10 GMT
-    try:
-        dt_object = datetime.datetime.strptime(value, "%a, %d %b %Y %H:%M:%S GMT")
 
-        if timezone:
-            # First, make it aware of UTC since 'GMT' implies UTC
-            utc_dt = dt_object.replace(tzinfo=datetime.UTC)
-            # Then convert to the target timezone
-            return utc_dt.astimezone(timezone)
+@functools.lru_cache(maxsize=1024)
+def _parse_datetime(value: str, timezone) -> datetime.datetime:
+    # Pick the format by shape rather than by a failed strptime.
+    if value.endswith(" GMT"):
+        try:
+            dt_object = datetime.datetime.strptime(value, _HTTP_DATE_FORMAT)
+        except ValueError:
+            pass
         else:
+            if timezone:
+                # First, make it aware of UTC since 'GMT' implies UTC
+                utc_dt = dt_object.replace(tzinfo=datetime.UTC)
+                # Then convert to the target timezone
+                return utc_dt.astimezone(timezone)
             return dt_object
-    except ValueError:
-        # If the new format parsing fails, try the old format
-        value = (
-            value.replace("-", "").replace("T", "").replace(":", "").replace("Z", "")
+
+    value = value.translate(_DATETIME_SEPARATORS)
+    m = _DATETIME_DIGITS.match(value)
+    if m:
+        return datetime.datetime(
+            year=int(m.group(1)),
+            month=int(m.group(2)),
+            day=int(m.group(3)),
+            hour=int(m.group(4)),
+            minute=int(m.group(5)),
+            second=int(m.group(6)),
+            tzinfo=timezone,
         )
-        m = re.match(r"(\d{4})(\d{2})(\d{2})(\d{2})(\d{2})(\d{2})", value)
-        if m:
-            return datetime.datetime(
-                year=int(m.group(1)),
-                month=int(m.group(2)),
-                day=int(m.group(3)),
-                hour=int(m.group(4)),
-                minute=int(m.group(5)),
-                second=int(m.group(6)),
-                tzinfo=timezone,
-            )
-        else:
-            raise ValueError(f"Unable to parse datetime value: {value}")
+    raise ValueError(f"Unable to parse datetime value: {value}")
 
 
 def get_safe_local_datetime(date: datetime) -> datetime:
@@ -1,9 +1,13 @@
 """Shared pytest fixtures for hyundai_kia_connect_api tests."""
 
+import asyncio
 import pathlib
 
 import pytest
 
+from hyundai_kia_connect_api.AsyncVehicleManager import AsyncVehicleManager
+from hyundai_kia_connect_api.VehicleManager import VehicleManager
+
 FIXTURES_DIR = pathlib.Path(__file__).parent / "fixtures"
 
 
@@ -11,3 +15,42 @@ FIXTURES_DIR = pathlib.Path(__file__).parent / "fixtures"
 def fixtures_dir() -> pathlib.Path:
     """Return the path to the fixtures directory."""
     return FIXTURES_DIR
+
+
+@pytest.fixture
+def make_manager(monkeypatch):
+    """Return a factory building a VehicleManager around a given API object.
+
+    Managers go through their constructor, so they start with all of its
+    state. ``vehicles`` seeds the roster, ``manager_class`` may be
+    AsyncVehicleManager; other keyword arguments go to the constructor. The
+    managers are closed after the test.
+    """
+    managers = []
+
+    def make(api, vehicles=(), manager_class=VehicleManager, **kwargs):
+        monkeypatch.setattr(
+            VehicleManager,
+            "get_implementation_by_region_brand",
+            lambda *args, **kw: api,
+        )
+        manager = manager_class(
+            **{
+                "region": 1,
+                "brand": 1,
+                "username": "user",
+                "password": "pass",
+                "pin": "1234",
+                **kwargs,
+            }
+        )
+        manager.vehicles.update((vehicle.id, vehicle) for vehicle in vehicles)
+        managers.append(manager)
+        return manager
+
+    yield make
+    for manager in managers:
+        if isinstance(manager, AsyncVehicleManager):
+            asyncio.run(manager.close())
+        else:
+            manager.close()
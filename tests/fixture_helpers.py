@@ -6,6 +6,15 @@ directly by test modules at module level for use with ``pytest.mark.parametrize`
 
 import json
 import pathlib
+from collections.abc import Callable
+
+from hyundai_kia_connect_api.ApiImplType1 import ApiImplType1
+from hyundai_kia_connect_api.HyundaiBlueLinkApiUSA import HyundaiBlueLinkApiUSA
+from hyundai_kia_connect_api.KiaUvoApiAU import KiaUvoApiAU
+from hyundai_kia_connect_api.KiaUvoApiCN import KiaUvoApiCN
+from hyundai_kia_connect_api.KiaUvoApiEU import KiaUvoApiEU
+from hyundai_kia_connect_api.KiaUvoApiUSA import KiaUvoApiUSA
+from hyundai_kia_connect_api.Vehicle import Vehicle
 
 FIXTURES_DIR = pathlib.Path(__file__).parent / "fixtures"
 
@@ -36,3 +45,44 @@ def get_fixture_expected(fixture_data: dict) -> dict:
 def get_fixture_meta(fixture_data: dict) -> dict:
     """Return the ``_fixture_meta`` block from a fixture."""
     return fixture_data.get("_fixture_meta", {})
+
+
+def fixture_parsers() -> list[tuple[Callable[[Vehicle, dict], None], str]]:
+    """(parse, fixture file name) for every fixture with a vehicle status parser.
+
+    ``parse(vehicle, payload)`` is the region's status parser, on an API
+    instance created without logging in.
+    """
+
+    def api(cls, **attributes):
+        instance = cls.__new__(cls)
+        instance.data_timezone = None
+        for name, value in attributes.items():
+            setattr(instance, name, value)
+        return instance
+
+    ccs2 = api(ApiImplType1, temperature_range=[x * 0.5 for x in range(28, 60)])
+    eu = api(KiaUvoApiEU, temperature_range=KiaUvoApiEU.temperature_range)
+    au = api(KiaUvoApiAU, temperature_range=KiaUvoApiAU.temperature_range)
+    cn = api(KiaUvoApiCN, temperature_range=KiaUvoApiCN.temperature_range)
+    usa = api(KiaUvoApiUSA, temperature_range=range(62, 83))
+    bluelink = api(HyundaiBlueLinkApiUSA, temperature_range=range(62, 82))
+    return [
+        *(
+            (ccs2._update_vehicle_properties_ccs2, name)
+            for name in discover_fixtures("eu_kia_")
+            if "ccs2" in name
+        ),
+        *(
+            (eu._update_vehicle_properties, name)
+            for name in discover_fixtures("eu_kia_ev6_")
+            if "ccs2" not in name
+        ),
+        *((au._update_vehicle_properties, n) for n in discover_fixtures("au_")),
+        *((cn._update_vehicle_properties, n) for n in discover_fixtures("cn_")),
+        *((usa._update_vehicle_properties, n) for n in discover_fixtures("us_kia_")),
+        *(
+            (bluelink._update_vehicle_properties, name)
+            for name in discover_fixtures("us_hyundai_")
+        ),
+    ]
@@ -0,0 +1,140 @@
+"""Batched action status: check_action_statuses and the ActionTracker."""
+
+import datetime as dt
+from types import SimpleNamespace
+
+from hyundai_kia_connect_api.ActionTracker import ActionTracker
+from hyundai_kia_connect_api.ApiImpl import ApiImpl
+from hyundai_kia_connect_api.ApiImplType1 import ApiImplType1
+from hyundai_kia_connect_api.const import ORDER_STATUS
+from hyundai_kia_connect_api.Token import Token
+from hyundai_kia_connect_api.Vehicle import Vehicle
+
+
+def test_type1_resolves_all_actions_from_one_request():
+    api = ApiImplType1()
+    api.SPA_API_URL = "https://example.test/"
+    api._get_authenticated_headers = lambda token, ccu: {}
+    urls = []
+
+    def get(url, headers=None):
+        urls.append(url)
+        return SimpleNamespace(
+            json=lambda: {
+                "retCode": "S",
+                "resCode": "0000",
+                "resMsg": [
+                    {"recordId": "lock", "result": "success"},
+                    {"recordId": "climate", "result": None},
+                    {"recordId": "charge", "result": "fail"},
+                ],
+            }
+        )
+
+    api.session.get = get
+    vehicle = SimpleNamespace(id="vid", ccu_ccs2_protocol_support=0)
+
+    statuses = api.check_action_statuses(
+        Token(), vehicle, ["lock", "climate", "charge", "missing"]
+    )
+
+    assert statuses == {
+        "lock": ORDER_STATUS.SUCCESS,
+        "climate": ORDER_STATUS.PENDING,
+        "charge": ORDER_STATUS.FAILED,
+        "missing": ORDER_STATUS.UNKNOWN,
+    }
+    assert urls == ["https://example.test/notifications/vid/records"]
+
+
+class RecordsApi(ApiImpl):
+    def __init__(self):
+        super().__init__()
+        self.records = {}
+        self.requests = []
+
+    def check_action_statuses(self, token, vehicle, action_ids):
+        self.requests.append((vehicle.id, sorted(action_ids)))
+        return {
+            action_id: self.records.get(action_id, ORDER_STATUS.PENDING)
+            for action_id in action_ids
+        }
+
+
+def _manager(make_manager, api):
+    return make_manager(
+        api,
+        vehicles=[Vehicle(id="v1"), Vehicle(id="v2")],
+        token=Token(valid_until=dt.datetime.now(dt.UTC) + dt.timedelta(hours=1)),
+    )
+
+
+def test_tracker_polls_each_vehicle_once_per_tick(make_manager):
+    api = RecordsApi()
+    manager = _manager(make_manager, api)
+    tracker = ActionTracker(manager, poll_interval=3600)
+    notified = []
+    try:
+        lock = tracker.track("v1", "lock", callback=notified.append)
+        climate = tracker.track("v1", "climate")
+        other = tracker.track("v2", "charge")
+
+        tracker.poll()
+        assert sorted(api.requests) == [
+            ("v1", ["climate", "lock"]),
+            ("v2", ["charge"]),
+        ]
+        assert tracker.pending == 3
+
+        api.records = {"lock": ORDER_STATUS.SUCCESS, "charge": ORDER_STATUS.FAILED}
+        tracker.poll()
+        assert lock.result(timeout=0) == ORDER_STATUS.SUCCESS
+        assert other.result(timeout=0) == ORDER_STATUS.FAILED
+        assert notified == [ORDER_STATUS.SUCCESS]
+        assert not climate.done()
+        assert tracker.pending == 1
+    finally:
+        tracker.shutdown()
+    assert climate.cancelled()
+
+
+def test_tracker_times_out_pending_actions(make_manager):
+    api = RecordsApi()
+    manager = _manager(make_manager, api)
+    tracker = ActionTracker(manager, poll_interval=3600, timeout=0)
+    try:
+        future = tracker.track("v1", "lock")
+        tracker.poll()
+        assert future.result(timeout=0) == ORDER_STATUS.TIMEOUT
+    finally:
+        tracker.shutdown()
+
+
+def test_tracking_a_pending_action_again_keeps_both_callbacks(make_manager):
+    api = RecordsApi()
+    manager = _manager(make_manager, api)
+    tracker = ActionTracker(manager, poll_interval=3600)
+    first, second = [], []
+    try:
+        future = tracker.track("v1", "lock", callback=first.append)
+        assert tracker.track("v1", "lock", callback=second.append) is future
+        assert tracker.pending == 1
+
+        api.records = {"lock": ORDER_STATUS.SUCCESS}
+        tracker.poll()
+        assert future.result(timeout=0) == ORDER_STATUS.SUCCESS
+        assert first == second == [ORDER_STATUS.SUCCESS]
+    finally:
+        tracker.shutdown()
+
+
+def test_track_action_resolves_in_background(make_manager):
+    api = RecordsApi()
+    api.action_status_poll_interval = 0.01
+    api.records = {"lock": ORDER_STATUS.SUCCESS}
+    manager = _manager(make_manager, api)
+    try:
+        future = manager.track_action("v1", "lock")
+        assert future.result(timeout=5) == ORDER_STATUS.SUCCESS
+    finally:
+        manager.action_tracker.shutdown()
@@ -0,0 +1,174 @@
+"""AsyncVehicleManager: awaitable API over the blocking region implementations."""
+
+import asyncio
+import datetime as dt
+import threading
+import time
+
+import pytest
+
+from hyundai_kia_connect_api.ApiImpl import ApiImpl
+from hyundai_kia_connect_api.AsyncVehicleManager import AsyncVehicleManager
+from hyundai_kia_connect_api.const import ORDER_STATUS
+from hyundai_kia_connect_api.exceptions import APIError
+from hyundai_kia_connect_api.Token import Token
+from hyundai_kia_connect_api.Vehicle import Vehicle
+from hyundai_kia_connect_api.VehicleManager import VehicleManager
+
+
+class StepApi(ApiImpl):
+    """Fake region whose force refresh waits between wake and read."""
+
+    action_status_poll_interval = 0.01
+
+    def __init__(self, wait=0.3):
+        super().__init__()
+        self.wait = wait
+        self.events = []
+        self.statuses = []
+
+    def login(self, username, password, pin=None):
+        return Token(
+            username=username,
+            valid_until=dt.datetime.now(dt.UTC) + dt.timedelta(hours=1),
+        )
+
+    def get_vehicles(self, token):
+        return [Vehicle(id="v1"), Vehicle(id="v2")]
+
+    def update_vehicle_with_cached_state(self, token, vehicle):
+        if vehicle.id == "v2":
+            raise APIError("cached read failed")
+        self.events.append(("cached", vehicle.id))
+
+    def force_refresh_vehicle_state_steps(self, token, vehicle, polling=None):
+        self.events.append(("wake", vehicle.id))
+        try:
+            yield self.wait
+        except GeneratorExit:
+            self.events.append(("closed", vehicle.id))
+            raise
+        self.events.append(("read", vehicle.id))
+
+    def check_action_status(
+        self, token, vehicle, action_id, synchronous=False, timeout=0
+    ):
+        assert synchronous is False
+        return self.statuses.pop(0)
+
+    def lock_action(self, token, vehicle, action):
+        return f"lock-{vehicle.id}"
+
+
+@pytest.fixture
+def api(monkeypatch):
+    api = StepApi()
+    monkeypatch.setattr(
+        VehicleManager,
+        "get_implementation_by_region_brand",
+        lambda *args, **kwargs: api,
+    )
+    return api
+
+
+def _manager(**kwargs):
+    return AsyncVehicleManager(
+        region=1, brand=1, username="user", password="pass", pin="1234", **kwargs
+    )
+
+
+def test_login_and_control_commands(api):
+    async def scenario():
+        async with _manager() as manager:
+            assert await manager.login() is True
+            assert sorted(manager.vehicles) == ["v1", "v2"]
+            return await manager.lock("v1")
+
+    assert asyncio.run(scenario()) == "lock-v1"
+
+
+def test_force_refresh_waits_do_not_hold_worker_threads(api):
+    async def scenario():
+        async with _manager(max_workers=1) as manager:
+            await manager.login()
+            started = time.monotonic()
+            result = await manager.force_refresh_all_vehicles_states()
+            return result, time.monotonic() - started
+
+    result, elapsed = asyncio.run(scenario())
+
+    assert result.ok
+    # Both wakes are issued before either wait ends, on a single worker thread.
+    assert api.events[:2] == [("wake", "v1"), ("wake", "v2")]
+    assert elapsed < 2 * api.wait
+
+
+def test_update_all_collects_per_vehicle_errors(api):
+    async def scenario():
+        async with _manager() as manager:
+            await manager.login()
+            return await manager.update_all_vehicles_with_cached_state()
+
+    result = asyncio.run(scenario())
+
+    assert result.updated == ["v1"]
+    assert isinstance(result.errors["v2"], APIError)
+
+
+def test_synchronous_action_status_polls_until_final(api):
+    api.statuses = [ORDER_STATUS.PENDING, ORDER_STATUS.PENDING, ORDER_STATUS.SUCCESS]
+
+    async def scenario():
+        async with _manager() as manager:
+            await manager.login()
+            return await manager.check_action_status(
+                "v1", "action-1", synchronous=True, timeout=5
+            )
+
+    assert asyncio.run(scenario()) == ORDER_STATUS.SUCCESS
+    assert api.statuses == []
+
+
+def test_synchronous_action_status_times_out(api):
+    api.statuses = [ORDER_STATUS.PENDING] * 10
+    api.action_status_poll_interval = 0.3
+
+    async def scenario():
+        async with _manager() as manager:
+            await manager.login()
+            return await manager.check_action_status(
+                "v1", "action-1", synchronous=True, timeout=1
+            )
+
+    assert asyncio.run(scenario()) == ORDER_STATUS.TIMEOUT
+    assert 3 <= 10 - len(api.statuses) <= 5
+
+
+def test_cancelled_force_refresh_closes_its_steps(api):
+    async def scenario():
+        async with _manager() as manager:
+            await manager.login()
+            task = asyncio.create_task(manager.force_refresh_vehicle_state("v1"))
+            while ("wake", "v1") not in api.events:
+                await asyncio.sleep(0.01)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+            return list(api.events)
+
+    assert asyncio.run(scenario()) == [("wake", "v1"), ("closed", "v1")]
+
+
+def test_close_runs_off_the_event_loop(api, monkeypatch):
+    threads = []
+    monkeypatch.setattr(
+        VehicleManager, "close", lambda self: threads.append(threading.current_thread())
+    )
+
+    async def scenario():
+        async with _manager():
+            pass
+
+    asyncio.run(scenario())
+
+    assert threads and threads[0] is not threading.main_thread()
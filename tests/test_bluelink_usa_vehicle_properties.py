@@ -7,6 +7,7 @@ the ``vehicleStatus.*`` path structure (different from KiaUvoApiUSA which uses
 
 import pytest
 
+from hyundai_kia_connect_api.const import RAW_DATA_RETENTION
 from hyundai_kia_connect_api.HyundaiBlueLinkApiUSA import HyundaiBlueLinkApiUSA
 from hyundai_kia_connect_api.Vehicle import Vehicle
 from tests.fixture_helpers import (
@@ -198,3 +199,30 @@ def test_bluelink_odometer_uses_highest_valid_value(
     bluelink_api._update_vehicle_properties(vehicle, state)
 
     assert vehicle.odometer == expected
+
+
+@pytest.mark.parametrize("retention", list(RAW_DATA_RETENTION))
+def test_bluelink_trip_info_does_not_need_raw_data(bluelink_api, retention):
+    """Trip info is filled from the vehicle, not from vehicle.data."""
+    trip = {
+        "startdate": "2025-01-02 08:15:00.0",
+        "mileagetime": {"value": 600},
+        "duration": {"value": 720},
+        "distance": 5,
+        "avgspeed": {"value": 30},
+        "maxspeed": {"value": 50},
+    }
+    state = {"evTripDetails": {"tripdetails": [trip]}}
+    vehicle = Vehicle(raw_data_retention=retention)
+
+    bluelink_api._update_vehicle_properties(vehicle, state)
+    bluelink_api.update_month_trip_info(None, vehicle, "202501")
+    bluelink_api.update_day_trip_info(None, vehicle, "20250102")
+
+    assert vehicle.month_trip_info.summary.distance == 5.0
+    assert [day.yyyymmdd for day in vehicle.month_trip_info.day_list] == ["20250102"]
+    assert vehicle.day_trip_info.trip_list[0].drive_time == 10
+
+    bluelink_api._update_vehicle_properties(vehicle, {})
+    bluelink_api.update_day_trip_info(None, vehicle, "20250102")
+    assert vehicle.day_trip_info is None
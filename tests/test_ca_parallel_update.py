@@ -0,0 +1,144 @@
+"""Dependency-aware request fan-out in the CA cached and forced updates."""
+
+import threading
+import zlib
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from hyundai_kia_connect_api.const import ENGINE_TYPES, RAW_DATA_RETENTION
+from hyundai_kia_connect_api.KiaUvoApiCA import KiaUvoApiCA
+from hyundai_kia_connect_api.Vehicle import Vehicle
+from tests.fixture_helpers import load_fixture
+
+FIRST_ROUND = {"lstvhclsts", "rltmvhclsts", "nxtsvc", "evc/selsoc", "evTripDetails"}
+OK = {"responseHeader": {"responseCode": 0}}
+
+
+def _response(payload):
+    resp = MagicMock()
+    resp.ok = True
+    resp.json.return_value = payload
+    return resp
+
+
+class _Sessions:
+    """Fake RetrySession; first-round endpoints wait until ``expected`` arrive."""
+
+    def __init__(self, status, odometer=1200, expected=0):
+        self.status = status
+        self.odometer = odometer
+        self.calls = []
+        self.lock = threading.Lock()
+        self.barrier = threading.Barrier(expected, timeout=5) if expected else None
+
+    def post(self, url, headers=None, json=None):
+        endpoint = url.split("/tods/api/")[1].replace("alerts/maintenance/", "")
+        with self.lock:
+            self.calls.append(endpoint)
+        if self.barrier is not None and endpoint in FIRST_ROUND:
+            self.barrier.wait()
+        if endpoint in ("lstvhclsts", "rltmvhclsts"):
+            return _response({**OK, "result": {"status": self.status}})
+        if endpoint == "nxtsvc":
+            maintenance = {"currentOdometer": self.odometer, "currentOdometerUnit": 1}
+            return _response({**OK, "result": {"maintenanceInfo": maintenance}})
+        if endpoint == "evc/selsoc":
+            levels = [{"plugType": 0, "level": 80}, {"plugType": 1, "level": 90}]
+            return _response({**OK, "result": levels})
+        if endpoint == "evTripDetails":
+            return _response({**OK, "result": {"tripdetails": []}})
+        if endpoint == "vrfypin":
+            return _response({**OK, "result": {"pAuth": "p-auth"}})
+        if endpoint == "fndmcr":
+            location = {"coord": {"lat": 45.5, "lon": -73.6}, "time": "20240101120000"}
+            return _response({**OK, "result": location})
+        raise AssertionError(endpoint)
+
+
+@pytest.fixture
+def ca_api() -> KiaUvoApiCA:
+    return KiaUvoApiCA(2, 1, "en")
+
+
+@pytest.fixture
+def ev() -> Vehicle:
+    vehicle = Vehicle(id="vid-1", year=2022)
+    vehicle.engine_type = ENGINE_TYPES.EV
+    return vehicle
+
+
+def _token():
+    return SimpleNamespace(access_token="t", pin="1234")
+
+
+def _status():
+    return load_fixture("ca_kia_niro_ev_2022_cached.json")["status"]
+
+
+def test_parallel_first_round_then_location(ca_api, ev):
+    ca_api._sessions = _Sessions(_status(), expected=4)
+    ca_api.max_parallel_requests = 4
+
+    ca_api.update_vehicle_with_cached_state(_token(), ev)
+
+    calls = ca_api._sessions.calls
+    assert set(calls[:4]) == {"lstvhclsts", "nxtsvc", "evc/selsoc", "evTripDetails"}
+    assert calls[4:] == ["vrfypin", "fndmcr"]
+    assert ev.location_latitude == 45.5
+    assert ev.odometer == 1200
+    assert ev.ev_charge_limits_ac == 90
+    assert ev.ev_charge_limits_dc == 80
+    assert ev.daily_stats == []
+
+
+def test_location_skipped_when_odometer_unchanged(ca_api, ev):
+    ca_api._sessions = _Sessions(_status(), expected=4)
+    ca_api.max_parallel_requests = 4
+    ev.odometer = (1200, "km")
+
+    ca_api.update_vehicle_with_cached_state(_token(), ev)
+
+    assert "fndmcr" not in ca_api._sessions.calls
+    assert "vrfypin" not in ca_api._sessions.calls
+
+
+def test_sequential_order_is_unchanged(ca_api, ev):
+    ca_api._sessions = _Sessions(_status())
+
+    ca_api.update_vehicle_with_cached_state(_token(), ev)
+
+    assert ca_api._sessions.calls == [
+        "lstvhclsts",
+        "nxtsvc",
+        "vrfypin",
+        "fndmcr",
+        "evc/selsoc",
+        "evTripDetails",
+    ]
+
+
+def test_forced_refresh_fans_out_with_realtime_status(ca_api, ev):
+    ca_api._sessions = _Sessions(_status(), expected=4)
+    ca_api.max_parallel_requests = 4
+
+    ca_api.force_refresh_vehicle_state(_token(), ev)
+
+    calls = ca_api._sessions.calls
+    assert set(calls[:4]) == {"rltmvhclsts", "nxtsvc", "evc/selsoc", "evTripDetails"}
+    assert calls[4:] == ["vrfypin", "fndmcr"]
+    assert ev.odometer == 1200
+
+
+def test_raw_payload_is_written_once_per_update(ca_api, ev, monkeypatch):
+    ca_api._sessions = _Sessions(_status())
+    ev.raw_data_retention = RAW_DATA_RETENTION.COMPRESS
+    ev.data = {"earlier": {}}
+    compress = MagicMock(side_effect=zlib.compress)
+    monkeypatch.setattr(zlib, "compress", compress)
+
+    ca_api.update_vehicle_with_cached_state(_token(), ev)
+
+    assert compress.call_count == 1
+    assert ev.data.keys() == {"earlier", "status", "service", "vehicleLocation"}
@@ -0,0 +1,139 @@
+"""Reuse of the CA PIN authorization (pAuth) across requests."""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from hyundai_kia_connect_api.const import ORDER_STATUS, VEHICLE_LOCK_ACTION
+from hyundai_kia_connect_api.KiaUvoApiCA import KiaUvoApiCA
+from hyundai_kia_connect_api.Vehicle import Vehicle
+
+OK = {"responseHeader": {"responseCode": 0}}
+FAILED = {
+    "responseHeader": {"responseCode": 1},
+    "error": {"errorCode": "7403", "errorDesc": "Authentication expired"},
+}
+
+
+class _Sessions:
+    def __init__(self):
+        self.calls = []
+        self.p_auths = []
+        self.status = OK
+
+    def post(self, url, headers=None, json=None, data=None):
+        endpoint = url.split("/tods/api/")[1]
+        self.calls.append(endpoint)
+        self.p_auths.append(headers.get("pAuth"))
+        response = MagicMock()
+        response.headers = {"transactionId": "tx"}
+        if endpoint == "vrfypin":
+            payload = {
+                **OK,
+                "result": {"pAuth": f"p-auth-{self.calls.count(endpoint)}"},
+            }
+        elif endpoint == "rmtsts":
+            transaction = {"apiStatusCode": "null", "apiResult": "C"}
+            payload = {**self.status, "result": {"transaction": transaction}}
+        else:
+            payload = {**OK, "result": {"coord": {"lat": 45.5, "lon": -73.6}}}
+        response.json.return_value = payload
+        return response
+
+
+@pytest.fixture
+def api() -> KiaUvoApiCA:
+    api = KiaUvoApiCA(2, 1, "en")
+    api._sessions = _Sessions()
+    return api
+
+
+def _token(access_token="t"):
+    return SimpleNamespace(access_token=access_token, pin="1234")
+
+
+def test_pin_token_is_reused_across_requests(api):
+    vehicle = Vehicle(id="vid-1")
+    token = _token()
+
+    api.lock_action(token, vehicle, VEHICLE_LOCK_ACTION.LOCK)
+    api.get_location(token, vehicle)
+    api.check_action_status(token, vehicle, "tx")
+
+    assert api._sessions.calls == ["vrfypin", "drlck", "fndmcr", "rmtsts"]
+    assert api._sessions.p_auths[1:] == ["p-auth-1"] * 3
+
+
+def test_pin_token_is_kept_per_vehicle(api):
+    token = _token()
+
+    api.get_location(token, Vehicle(id="vid-1"))
+    api.get_location(token, Vehicle(id="vid-2"))
+    api.get_location(token, Vehicle(id="vid-1"))
+
+    assert api._sessions.calls.count("vrfypin") == 2
+
+
+def test_expired_pin_token_is_refetched(api):
+    api.pin_token_lifetime = 0
+    vehicle = Vehicle(id="vid-1")
+
+    api.get_location(_token(), vehicle)
+    api.get_location(_token(), vehicle)
+
+    assert api._sessions.calls.count("vrfypin") == 2
+
+
+def test_new_access_token_refetches_pin_token(api):
+    vehicle = Vehicle(id="vid-1")
+
+    api.get_location(_token("old"), vehicle)
+    api.get_location(_token("new"), vehicle)
+
+    assert api._sessions.calls.count("vrfypin") == 2
+
+
+def test_error_response_drops_pin_token(api):
+    vehicle = Vehicle(id="vid-1")
+    api._sessions.status = FAILED
+
+    assert api.check_action_status(_token(), vehicle, "tx") == ORDER_STATUS.FAILED
+    api._sessions.status = OK
+    assert api.check_action_status(_token(), vehicle, "tx") == ORDER_STATUS.SUCCESS
+
+    assert api._sessions.calls.count("vrfypin") == 2
+    assert api._sessions.p_auths[-1] == "p-auth-2"
+
+
+@pytest.mark.parametrize(
+    "error",
+    [
+        {"errorCode": "7403", "errorDesc": "Authentication expired"},
+        {"errorCode": "7999", "errorDesc": "Invalid PIN"},
+        {"errorCode": "7999", "errorDesc": "pAuth is not valid"},
+    ],
+)
+def test_auth_and_pin_errors_drop_pin_token(api, error):
+    vehicle = Vehicle(id="vid-1")
+    api.get_location(_token(), vehicle)
+
+    api._forget_pin_token_on_error(
+        vehicle, {"responseHeader": {"responseCode": 1}, "error": error}
+    )
+
+    assert vehicle.id not in api._pin_tokens
+
+
+def test_other_errors_keep_pin_token(api):
+    vehicle = Vehicle(id="vid-1")
+    api._sessions.status = {
+        "responseHeader": {"responseCode": 1},
+        "error": {"errorCode": "7445", "errorDesc": "Request could not be processed"},
+    }
+
+    api.check_action_status(_token(), vehicle, "tx")
+    api._sessions.status = OK
+    api.check_action_status(_token(), vehicle, "tx")
+
+    assert api._sessions.calls.count("vrfypin") == 1
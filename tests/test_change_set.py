@@ -0,0 +1,121 @@
+"""Field-level change sets of vehicle updates (ChangeSet)."""
+
+import asyncio
+import copy
+
+from hyundai_kia_connect_api.AsyncVehicleManager import AsyncVehicleManager
+from hyundai_kia_connect_api.ChangeSet import TRACKED_FIELDS, ChangeSet, vehicle_state
+from hyundai_kia_connect_api.const import DISTANCE_UNITS
+from hyundai_kia_connect_api.Vehicle import Vehicle
+from tests.test_unchanged_state import STATE, CachedStateApi
+
+
+class ParsingApi(CachedStateApi):
+    def _parse(self, vehicle, state):
+        super()._parse(vehicle, state)
+        vehicle.odometer = (state["Drivetrain"]["Odometer"], DISTANCE_UNITS[1])
+        vehicle.ev_battery_percentage = state["Green"]["BatteryManagement"][
+            "BatteryRemain"
+        ]["Ratio"]
+
+
+def _moved(odometer):
+    state = copy.deepcopy(STATE)
+    state["Drivetrain"]["Odometer"] = odometer
+    return state
+
+
+def test_change_set_lists_old_and_new_values():
+    vehicle = Vehicle(id="v1", fuel_level=40)
+    before = vehicle_state(vehicle)
+    vehicle.fuel_level = 35
+    vehicle.odometer = (100, "km")
+
+    changes = ChangeSet.since(vehicle, before)
+
+    assert changes.vehicle_id == "v1"
+    assert changes.changes == {
+        "fuel_level": (40, 35),
+        "odometer": (None, 100),
+        "odometer_unit": (None, "km"),
+    }
+    assert "fuel_level" in changes
+    assert changes.old("fuel_level") == 40
+    assert changes.new("fuel_level") == 35
+
+
+def test_untouched_vehicle_has_no_changes():
+    vehicle = Vehicle(id="v1")
+    before = vehicle_state(vehicle)
+    vehicle.data = {"raw": 1}
+
+    assert not ChangeSet.since(vehicle, before)
+
+
+def test_tracked_fields_are_public():
+    assert "odometer" in TRACKED_FIELDS
+    assert "fuel_level" in TRACKED_FIELDS
+    assert not any(name.startswith("_") for name in TRACKED_FIELDS)
+    assert "data" not in TRACKED_FIELDS
+    assert "last_scanned_at" not in TRACKED_FIELDS
+
+
+def test_listeners_get_changes_of_each_update(make_manager):
+    manager = make_manager(
+        ParsingApi([STATE, copy.deepcopy(STATE), _moved(12400.0)]),
+        vehicles=[Vehicle(id="v1")],
+    )
+    received = []
+    manager.add_change_listener(received.append)
+
+    manager.update_vehicle_with_cached_state("v1")
+    manager.update_vehicle_with_cached_state("v1")
+    manager.update_vehicle_with_cached_state("v1")
+
+    assert len(received) == 2
+    assert received[0].new("ev_battery_percentage") == 80
+    assert received[1].changes == {"odometer": (12345.6, 12400.0)}
+
+
+def test_removed_and_failing_listeners(make_manager):
+    manager = make_manager(
+        ParsingApi([STATE, _moved(12400.0)]), vehicles=[Vehicle(id="v1")]
+    )
+    received = []
+
+    def broken(changes):
+        raise RuntimeError("listener bug")
+
+    manager.add_change_listener(broken)
+    remove = manager.add_change_listener(received.append)
+    manager.update_vehicle_with_cached_state("v1")
+    remove()
+    manager.update_vehicle_with_cached_state("v1")
+
+    assert len(received) == 1
+
+
+def test_update_result_carries_change_sets(make_manager):
+    manager = make_manager(
+        ParsingApi([STATE, STATE, copy.deepcopy(STATE), _moved(1.0)]),
+        vehicles=[Vehicle(id="v1")],
+    )
+    manager.vehicles["v2"] = Vehicle(id="v2")
+    manager.update_all_vehicles_with_cached_state()
+
+    result = manager.update_all_vehicles_with_cached_state()
+
+    assert not result.changes["v1"]
+    assert result.changes["v2"].changes == {"odometer": (12345.6, 1.0)}
+
+
+def test_async_update_result_carries_change_sets(make_manager):
+    async_manager = make_manager(
+        ParsingApi([STATE]),
+        vehicles=[Vehicle(id="v1")],
+        manager_class=AsyncVehicleManager,
+    )
+
+    result = asyncio.run(async_manager.update_all_vehicles_with_cached_state())
+
+    assert result.changes["v1"].new("odometer") == 12345.6
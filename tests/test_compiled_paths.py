@@ -0,0 +1,121 @@
+"""Compiled path accessors (utils.compile_path) and their lookup cost.
+
+Run with ``pytest -s`` to see the benchmark timings. They are reported, not
+asserted: wall-clock comparisons are flaky on loaded machines.
+"""
+
+import sys
+import timeit
+from collections import OrderedDict
+
+import pytest
+
+from hyundai_kia_connect_api import utils
+from hyundai_kia_connect_api.utils import compile_path, get_child_value
+from hyundai_kia_connect_api.Vehicle import Vehicle
+from tests.fixture_helpers import fixture_parsers, load_fixture
+
+PARSES = 20
+
+
+def _previous_get_child_value(data, key):
+    """get_child_value before compiled paths."""
+    value = data
+    for x in key.split("."):
+        try:
+            value = value[x]
+        except Exception:
+            try:
+                value = value[int(x)]
+            except Exception:
+                value = None
+    return value
+
+
+PAYLOAD = {
+    "Cabin": {"Door": {"Row1": {"Driver": {"Lock": 0}}}},
+    "list": [{"a": 1}, {"a": 2}],
+    "ints": {3: "three"},
+    "text": "abc",
+    "none": None,
+    "ordered": OrderedDict(x=1),
+}
+
+
+@pytest.mark.parametrize(
+    "key",
+    [
+        "Cabin.Door.Row1.Driver.Lock",
+        "Cabin.Door.Row1.Passenger.Lock",
+        "Cabin.Door",
+        "list.1.a",
+        "list.-1.a",
+        "list.2.a",
+        "list.a",
+        "ints.3",
+        "text.1",
+        "none.x",
+        "ordered.x",
+        "missing",
+        "",
+    ],
+)
+def test_compiled_path_matches_previous_lookup(key):
+    assert compile_path(key)(PAYLOAD) == _previous_get_child_value(PAYLOAD, key)
+    assert get_child_value(PAYLOAD, key) == _previous_get_child_value(PAYLOAD, key)
+
+
+def test_paths_are_compiled_once():
+    assert compile_path("Cabin.Door.Row1.Driver.Lock") is compile_path(
+        "Cabin.Door.Row1.Driver.Lock"
+    )
+
+
+def _recorded_lookups(parsers):
+    """The get_child_value calls made while parsing, as (data, key) pairs.
+
+    The CCS2 fields go through a precompiled table (_CCS2_FIELDS) instead,
+    so timing whole parses would no longer isolate the lookups.
+    """
+    calls = []
+    compiled = utils.get_child_value
+
+    def recording(data, key):
+        calls.append((data, key))
+        return compiled(data, key)
+
+    with pytest.MonkeyPatch.context() as patch:
+        for module in list(sys.modules.values()):
+            if getattr(module, "get_child_value", None) is compiled:
+                patch.setattr(module, "get_child_value", recording)
+        for parse, payload in parsers:
+            parse(Vehicle(), payload)
+    return calls
+
+
+def test_fixture_lookup_cost():
+    calls = _recorded_lookups(
+        [(parse, load_fixture(name)) for parse, name in fixture_parsers()]
+    )
+    assert len(calls) > 100
+    assert [get_child_value(data, key) for data, key in calls] == [
+        _previous_get_child_value(data, key) for data, key in calls
+    ]
+
+    def timed(lookup):
+        def run():
+            for data, key in calls:
+                lookup(data, key)
+
+        return min(timeit.repeat(run, number=PARSES, repeat=3))
+
+    previous = timed(_previous_get_child_value)
+    current = timed(get_child_value)
+
+    per_lookup = 1e9 / (PARSES * len(calls))
+    print(
+        f"\nfixture lookups: {len(calls)} per parse of every fixture, "
+        f"previous {previous * per_lookup:.0f} ns, "
+        f"compiled paths {current * per_lookup:.0f} ns per lookup "
+        f"({previous / current:.2f}x)"
+    )
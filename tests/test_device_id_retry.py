@@ -31,6 +31,7 @@ class TestRetryOnDeviceIdError:
             {
                 "_get_device_id": lambda s, stamp: "new-device-id",
                 "_get_stamp": lambda s: "stamp",
+                "token_updated": None,
             },
         )()
         result = mock_method(mock_self, token)
@@ -58,6 +59,7 @@ class TestRetryOnDeviceIdError:
             {
                 "_get_device_id": lambda s, stamp: "new-device-id",
                 "_get_stamp": lambda s: "stamp",
+                "token_updated": None,
             },
         )()
         result = mock_method(mock_self, token)
@@ -83,6 +85,7 @@ class TestRetryOnDeviceIdError:
             {
                 "_get_device_id": lambda s, stamp: "new-device-id",
                 "_get_stamp": lambda s: "stamp",
+                "token_updated": None,
             },
         )()
         with pytest.raises(DeviceIDError, match="Still invalid"):
@@ -106,6 +109,7 @@ class TestRetryOnDeviceIdError:
             {
                 "_get_device_id": lambda s, stamp: "new-device-id",
                 "_get_stamp": lambda s: "stamp",
+                "token_updated": None,
             },
         )()
         with pytest.raises(ValueError, match="some other error"):
@@ -0,0 +1,121 @@
+"""Skipping drive-history reads that cannot have changed (_driving_info_due)."""
+
+import datetime as dt
+from unittest.mock import MagicMock
+
+import pytest
+
+from hyundai_kia_connect_api.const import DISTANCE_UNITS, ENGINE_TYPES
+from hyundai_kia_connect_api.KiaUvoApiEU import KiaUvoApiEU
+from hyundai_kia_connect_api.KiaUvoApiIN import KiaUvoApiIN
+from hyundai_kia_connect_api.Vehicle import Vehicle
+from tests.test_eu_parallel_cached_update import STATUS, _response, _Session, _token
+
+
+class _PollSession(_Session):
+    """Returns a status with a new timestamp on every poll."""
+
+    def get(self, url, headers=None):
+        if url.endswith("/location/park"):
+            return super().get(url, headers)
+        self._enter("status")
+        polls = self.calls.count("status")
+        state = {"Date": f"20260724{polls:06d}.000"}
+        return _response({**STATUS, "resMsg": {"state": {"Vehicle": state}}})
+
+
+@pytest.fixture
+def eu_api() -> KiaUvoApiEU:
+    api = KiaUvoApiEU.__new__(KiaUvoApiEU)
+    api.SPA_API_URL = "https://test.invalid/api/v1/spa/"
+    api._get_authenticated_headers = MagicMock(return_value={})
+    api.session = _PollSession()
+    return api
+
+
+@pytest.fixture
+def ev() -> Vehicle:
+    vehicle = Vehicle(id="vid-1", ccu_ccs2_protocol_support=1)
+    vehicle.engine_type = ENGINE_TYPES.EV
+    return vehicle
+
+
+def _drive_to(eu_api, *odometers):
+    """Apply the given odometer readings on successive status updates."""
+    readings = iter(odometers)
+
+    def update(vehicle, state):
+        vehicle.odometer = (next(readings), DISTANCE_UNITS[1])
+
+    eu_api._update_vehicle_properties_ccs2 = MagicMock(side_effect=update)
+
+
+def test_parked_car_keeps_drive_history(eu_api, ev):
+    _drive_to(eu_api, 1000, 1000)
+
+    eu_api.update_vehicle_with_cached_state(_token(), ev)
+    eu_api.update_vehicle_with_cached_state(_token(), ev)
+
+    assert eu_api.session.calls == ["status", "park", "drv1", "drv0", "status", "park"]
+    assert ev.total_power_consumed == 1000
+    assert len(ev.daily_stats) == 1
+
+
+def test_odometer_change_reads_drive_history_on_the_same_poll(eu_api, ev):
+    _drive_to(eu_api, 1000, 1012)
+
+    eu_api.update_vehicle_with_cached_state(_token(), ev)
+    eu_api.update_vehicle_with_cached_state(_token(), ev)
+
+    assert eu_api.session.calls[4:] == ["status", "park", "drv1", "drv0"]
+
+
+def test_new_day_reads_drive_history(eu_api, ev):
+    _drive_to(eu_api, 1000, 1000)
+    eu_api.update_vehicle_with_cached_state(_token(), ev)
+    odometer, day, read_at = ev._driving_info_stamp
+    ev._driving_info_stamp = (odometer, day - dt.timedelta(days=1), read_at)
+
+    eu_api.update_vehicle_with_cached_state(_token(), ev)
+
+    assert eu_api.session.calls.count("drv0") == 2
+
+
+def test_drive_history_is_reread_after_max_age(eu_api, ev):
+    _drive_to(eu_api, 1000, 1000)
+    eu_api.driving_info_max_age = 0
+    eu_api.update_vehicle_with_cached_state(_token(), ev)
+
+    eu_api.update_vehicle_with_cached_state(_token(), ev)
+
+    assert eu_api.session.calls.count("drv0") == 2
+
+
+def test_failed_read_is_retried(eu_api, ev):
+    _drive_to(eu_api, 1000, 1000)
+    eu_api.session.post = MagicMock(side_effect=ValueError("outage"))
+    eu_api.update_vehicle_with_cached_state(_token(), ev)
+
+    eu_api.update_vehicle_with_cached_state(_token(), ev)
+
+    # Sequential mode: the failed all-time read ends each attempt.
+    assert eu_api.session.post.call_count == 2
+    assert ev._driving_info_stamp is None
+
+
+def test_in_force_refresh_records_drive_history_read():
+    api = KiaUvoApiIN.__new__(KiaUvoApiIN)
+    api._get_forced_vehicle_state = MagicMock(return_value={})
+    api._get_location = MagicMock(return_value={})
+    api._update_vehicle_properties = MagicMock()
+    api._get_charge_limits = MagicMock(return_value={})
+    api._update_vehicle_properties_charge = MagicMock()
+    api._get_driving_info = MagicMock(return_value={})
+    api._update_vehicle_drive_info = MagicMock()
+    vehicle = Vehicle(id="vid-1", ccu_ccs2_protocol_support=0)
+    vehicle.engine_type = ENGINE_TYPES.EV
+
+    api.force_refresh_vehicle_state(_token(), vehicle)
+
+    assert vehicle._driving_info_stamp is not None
+    assert not api._driving_info_due(vehicle)
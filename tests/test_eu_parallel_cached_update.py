@@ -0,0 +1,187 @@
+"""Concurrent status / park / drive-history fan-out in the EU cached update."""
+
+import threading
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from hyundai_kia_connect_api.const import ENGINE_TYPES
+from hyundai_kia_connect_api.KiaUvoApiEU import KiaUvoApiEU
+from hyundai_kia_connect_api.Vehicle import Vehicle
+
+STATUS = {
+    "retCode": "S",
+    "resCode": "0000",
+    "resMsg": {"state": {"Vehicle": {"Date": "20260724120000.000"}}},
+}
+PARK = {
+    "retCode": "S",
+    "resCode": "0000",
+    "resMsg": {"coord": {"lat": 52.1, "lon": 5.1}, "time": "20260724115500"},
+}
+ALLTIME = {
+    "retCode": "S",
+    "resCode": "0000",
+    "resMsg": {"drivingInfo": [{"totalPwrCsp": 1000, "regenPwr": 200}]},
+}
+LAST_30D = {
+    "retCode": "S",
+    "resCode": "0000",
+    "resMsg": {
+        "drivingInfo": [
+            {"drivingPeriod": 0, "totalPwrCsp": 3000, "calculativeOdo": 20}
+        ],
+        "drivingInfoDetail": [
+            {"drivingDate": "20260723", "totalPwrCsp": 100, "calculativeOdo": 10}
+        ],
+    },
+}
+
+
+def _response(payload):
+    resp = MagicMock()
+    resp.json.return_value = payload
+    return resp
+
+
+class _Session:
+    """Records requests; optionally holds every call until ``expected`` arrive."""
+
+    def __init__(self, expected=0):
+        self.calls = []
+        self.barrier = threading.Barrier(expected, timeout=5) if expected else None
+        self.lock = threading.Lock()
+
+    def _enter(self, name):
+        with self.lock:
+            self.calls.append(name)
+        if self.barrier is not None:
+            self.barrier.wait()
+
+    def get(self, url, headers=None):
+        if url.endswith("/location/park"):
+            self._enter("park")
+            return _response(PARK)
+        self._enter("status")
+        return _response(STATUS)
+
+    def post(self, url, json=None, headers=None):
+        self._enter(f"drv{json['periodTarget']}")
+        return _response(ALLTIME if json["periodTarget"] == 1 else LAST_30D)
+
+
+@pytest.fixture
+def eu_api() -> KiaUvoApiEU:
+    api = KiaUvoApiEU.__new__(KiaUvoApiEU)
+    api.SPA_API_URL = "https://test.invalid/api/v1/spa/"
+    api._get_authenticated_headers = MagicMock(return_value={})
+    api._update_vehicle_properties_ccs2 = MagicMock()
+    return api
+
+
+@pytest.fixture
+def ev() -> Vehicle:
+    vehicle = Vehicle(id="vid-1", ccu_ccs2_protocol_support=1)
+    vehicle.engine_type = ENGINE_TYPES.EV
+    return vehicle
+
+
+def _token():
+    return SimpleNamespace(access_token="t", device_id="d")
+
+
+def test_parallel_mode_issues_all_requests_together(eu_api, ev):
+    # The barrier only releases once all four requests are in flight at once.
+    eu_api.session = _Session(expected=4)
+    eu_api.max_parallel_requests = 4
+
+    eu_api.update_vehicle_with_cached_state(_token(), ev)
+
+    assert sorted(eu_api.session.calls) == ["drv0", "drv1", "park", "status"]
+    eu_api._update_vehicle_properties_ccs2.assert_called_once_with(
+        ev, STATUS["resMsg"]["state"]["Vehicle"]
+    )
+    assert ev.location_latitude == 52.1
+    assert ev.total_power_consumed == 1000
+    assert ev.power_consumption_30d == 150
+    assert len(ev.daily_stats) == 1
+
+
+def test_sequential_mode_keeps_request_order(eu_api, ev):
+    eu_api.session = _Session()
+
+    eu_api.update_vehicle_with_cached_state(_token(), ev)
+
+    assert eu_api.session.calls == ["status", "park", "drv1", "drv0"]
+    assert ev.total_power_regenerated == 200
+
+
+def test_status_failure_skips_later_requests_in_sequential_mode(eu_api, ev):
+    eu_api.session = _Session()
+    eu_api.session.get = MagicMock(side_effect=ValueError("not JSON"))
+
+    with pytest.raises(ValueError):
+        eu_api.update_vehicle_with_cached_state(_token(), ev)
+
+    eu_api.session.get.assert_called_once()
+    assert eu_api.session.calls == []
+
+
+def test_drive_history_failure_keeps_status_and_location(eu_api, ev):
+    eu_api.session = _Session()
+    eu_api.session.post = MagicMock(side_effect=ValueError("outage"))
+    eu_api.max_parallel_requests = 4
+
+    eu_api.update_vehicle_with_cached_state(_token(), ev)
+
+    eu_api._update_vehicle_properties_ccs2.assert_called_once()
+    assert ev.location_latitude == 52.1
+    assert ev.total_power_consumed is None
+
+
+def test_ice_vehicle_does_not_request_drive_history(eu_api):
+    eu_api.session = _Session()
+    eu_api.max_parallel_requests = 4
+    vehicle = Vehicle(id="vid-2", ccu_ccs2_protocol_support=1)
+    vehicle.engine_type = ENGINE_TYPES.ICE
+
+    eu_api.update_vehicle_with_cached_state(_token(), vehicle)
+
+    assert sorted(eu_api.session.calls) == ["park", "status"]
+
+
+def test_failed_block_cancels_requests_not_started(eu_api):
+    eu_api.max_parallel_requests = 2
+    release = threading.Event()
+    sent = []
+
+    def blocked():
+        release.wait(5)
+
+    try:
+        with (
+            pytest.raises(ValueError),
+            eu_api._parallel_requests(
+                blocked, blocked, lambda: sent.append("drv")
+            ) as futures,
+        ):
+            raise ValueError("status failed")
+        assert futures[2].cancelled()
+    finally:
+        release.set()
+        eu_api.close()
+    assert sent == []
+
+
+def test_close_stops_the_request_pool(eu_api, ev):
+    eu_api.session = _Session()
+    eu_api.max_parallel_requests = 4
+    eu_api.update_vehicle_with_cached_state(_token(), ev)
+    executor = eu_api._executor
+
+    eu_api.close()
+
+    assert eu_api._executor is None
+    with pytest.raises(RuntimeError):
+        executor.submit(print)
@@ -0,0 +1,109 @@
+"""Declarative payload -> Vehicle mapping tables (utils.FieldMapping)."""
+
+import datetime as dt
+
+from hyundai_kia_connect_api.ApiImplType1 import _CCS2_FIELDS, _CCS2_TIRE_PRESSURES
+from hyundai_kia_connect_api.const import PressureUnit
+from hyundai_kia_connect_api.utils import (
+    FieldMapping,
+    apply_fields,
+    bool_or_none,
+    compile_field_mappings,
+)
+from hyundai_kia_connect_api.Vehicle import Vehicle
+
+FIELDS = compile_field_mappings(
+    (
+        FieldMapping("Drivetrain.Odometer", "odometer", unit="km"),
+        FieldMapping("Body.Hood.Open", "hood_is_open", bool),
+        FieldMapping(
+            "Green.HeatingState", "ev_battery_heating_state", bool_or_none, None, True
+        ),
+        FieldMapping("Seats.1.Level", "front_right_seat_status"),
+    )
+)
+
+
+def test_fields_are_copied_converted_and_paired_with_units():
+    vehicle = Vehicle()
+    state = {
+        "Drivetrain": {"Odometer": 1234},
+        "Body": {"Hood": {"Open": 1}},
+        "Green": {"HeatingState": 0},
+        "Seats": [{"Level": 1}, {"Level": 3}],
+    }
+
+    apply_fields(vehicle, state, FIELDS)
+
+    assert vehicle.odometer == 1234
+    assert vehicle.odometer_unit == "km"
+    assert vehicle.hood_is_open is True
+    assert vehicle.ev_battery_heating_state is False
+    assert vehicle.front_right_seat_status == 3
+
+
+def test_missing_fields():
+    vehicle = Vehicle(ev_battery_heating_state=True, front_right_seat_status=2)
+
+    apply_fields(vehicle, {}, FIELDS)
+
+    assert vehicle.odometer is None
+    assert vehicle.hood_is_open is False
+    assert vehicle.front_right_seat_status is None
+    # keep_previous: an unreported value does not clear the last known one.
+    assert vehicle.ev_battery_heating_state is True
+
+
+def test_ccs2_table_sets_each_attribute_once():
+    attributes = [attribute for _, attribute, *_ in _CCS2_FIELDS]
+    assert len(attributes) == len(set(attributes))
+
+
+def test_ccs2_sentinels_are_converted():
+    vehicle = Vehicle(
+        ev_first_departure_time=dt.time(7, 30),
+        ev_off_peak_start_time=dt.time(22, 0),
+    )
+    state = {
+        "Chassis": {
+            "Axle": {
+                "Tire": {"PressureUnit": 2},
+                "Row1": {"Left": {"Tire": {"Pressure": 27}}},
+                "Row2": {"Left": {"Tire": {"Pressure": 255}}},
+            }
+        },
+        "Green": {
+            "Reservation": {
+                "Departure": {"Schedule1": {"Hour": 31, "Min": 70, "Mon": 1}},
+                "OffPeakTime": {"StartHour": 31, "StartMin": 70, "Mode": 0},
+            }
+        },
+    }
+
+    apply_fields(vehicle, state, _CCS2_FIELDS)
+    apply_fields(vehicle, state, _CCS2_TIRE_PRESSURES[vehicle.tire_pressure_unit])
+
+    assert vehicle.tire_pressure_unit is PressureUnit.BAR
+    assert vehicle.tire_pressure_front_left == 2.7
+    # 255: the TPMS "no reading" sentinel.
+    assert vehicle.tire_pressure_rear_left is None
+    # 31:70: the "unconfigured" reservation sentinel.
+    assert vehicle.ev_first_departure_time is None
+    assert vehicle.ev_first_departure_days == [1]
+    assert vehicle.ev_off_peak_start_time is None
+    assert vehicle.ev_schedule_charge_enabled is False
+
+
+def test_ccs2_missing_reservations_are_left_unchanged():
+    vehicle = Vehicle(
+        ev_first_departure_time=dt.time(7, 30),
+        ev_off_peak_start_time=dt.time(22, 0),
+        ev_schedule_charge_enabled=True,
+    )
+    state = {"Green": {"Reservation": {"Departure": {"Schedule1": {"Enable": 0}}}}}
+
+    apply_fields(vehicle, state, _CCS2_FIELDS)
+
+    assert vehicle.ev_first_departure_time == dt.time(7, 30)
+    assert vehicle.ev_off_peak_start_time == dt.time(22, 0)
+    assert vehicle.ev_schedule_charge_enabled is True
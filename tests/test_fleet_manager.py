@@ -0,0 +1,158 @@
+"""FleetManager: shared connection pools, concurrency caps and stats."""
+
+import threading
+import time
+
+import pytest
+
+from hyundai_kia_connect_api.exceptions import APIError
+from hyundai_kia_connect_api.FleetManager import FleetManager
+
+
+def _add(fleet, account_id, region=1, brand=1):
+    return fleet.add_account(account_id, region, brand, "user", "pass", "1234")
+
+
+def test_accounts_of_a_region_share_connection_pools():
+    fleet = FleetManager()
+    try:
+        first = _add(fleet, "a")
+        second = _add(fleet, "b")
+        other_region = _add(fleet, "c", region=2)
+        usa_first = _add(fleet, "d", region=3, brand=2)
+        usa_second = _add(fleet, "e", region=3, brand=2)
+    finally:
+        fleet.shutdown()
+
+    https = "https://"
+    assert first.api.session.adapters[https] is second.api.session.adapters[https]
+    assert (
+        first.api.session.adapters[https]
+        is not (other_region.api.sessions.adapters[https])
+    )
+    assert first.api.session.adapters[https]._pool_maxsize == 8
+    hyundai_usa = "https://api.telematics.hyundaiusa.com"
+    cipher = usa_first.api.session.adapters[hyundai_usa]
+    assert type(cipher).__name__ == "cipherAdapter"
+    assert usa_second.api.session.adapters[hyundai_usa] is cipher
+
+
+class _Gauge:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.current = 0
+        self.peak = 0
+
+    def __call__(self, manager):
+        with self.lock:
+            self.current += 1
+            self.peak = max(self.peak, self.current)
+        time.sleep(0.02)
+        with self.lock:
+            self.current -= 1
+        return manager
+
+
+def test_per_host_and_per_account_caps():
+    fleet = FleetManager(max_workers=8, max_concurrent_per_host=2)
+    try:
+        for index in range(5):
+            _add(fleet, f"eu{index}")
+        _add(fleet, "ca", region=2)
+        host_gauge = _Gauge()
+        ca_gauge = _Gauge()
+        futures = [fleet.submit(f"eu{index}", host_gauge) for index in range(5)]
+        futures += [fleet.submit("ca", ca_gauge) for _ in range(3)]
+        for future in futures:
+            future.result(timeout=5)
+    finally:
+        fleet.shutdown()
+
+    assert host_gauge.peak == 2
+    assert ca_gauge.peak == 1
+    stats = fleet.stats
+    assert stats.completed == 8
+    assert stats.failed == 0
+    assert stats.running == stats.queued == 0
+    assert stats.throughput > 0
+
+
+def test_failures_are_counted_and_propagated():
+    fleet = FleetManager()
+    try:
+        _add(fleet, "a")
+
+        def fail(manager):
+            raise APIError("boom")
+
+        future = fleet.submit("a", fail)
+        with pytest.raises(APIError):
+            future.result(timeout=5)
+    finally:
+        fleet.shutdown()
+    assert fleet.stats.failed == 1
+    with pytest.raises(RuntimeError):
+        fleet.submit("a", fail)
+
+
+def test_update_all_accounts_refreshes_token_then_state(monkeypatch):
+    fleet = FleetManager()
+    calls = []
+    try:
+        manager = _add(fleet, "a")
+        monkeypatch.setattr(
+            manager, "check_and_refresh_token", lambda: calls.append("token")
+        )
+        monkeypatch.setattr(
+            manager,
+            "update_all_vehicles_with_cached_state",
+            lambda: calls.append("update") or "result",
+        )
+        futures = fleet.update_all_accounts()
+        assert futures["a"].result(timeout=5) == "result"
+    finally:
+        fleet.shutdown()
+    assert calls == ["token", "update"]
+
+
+def test_task_raising_base_exception_settles_its_future():
+    fleet = FleetManager()
+    try:
+        _add(fleet, "a")
+
+        def exit_(manager):
+            raise SystemExit(1)
+
+        future = fleet.submit("a", exit_)
+        with pytest.raises(SystemExit):
+            future.result(timeout=5)
+    finally:
+        fleet.shutdown()
+    assert fleet.stats.failed == 1
+
+
+def test_remove_account_closes_its_manager(monkeypatch):
+    fleet = FleetManager(max_workers=1)
+    try:
+        manager = _add(fleet, "a")
+        closed = []
+        monkeypatch.setattr(manager, "close", lambda: closed.append(True))
+        started = threading.Event()
+        release = threading.Event()
+
+        def block(manager):
+            started.set()
+            release.wait(5)
+
+        running = fleet.submit("a", block)
+        started.wait(5)
+        queued = fleet.submit("a", block)
+
+        assert fleet.remove_account("a") is manager
+        release.set()
+        running.result(timeout=5)
+    finally:
+        fleet.shutdown()
+    assert closed == [True]
+    assert queued.cancelled()
+    assert "a" not in fleet.accounts
@@ -0,0 +1,174 @@
+"""Polling force refresh (ForceRefreshPolling) and the ForceRefreshScheduler."""
+
+import threading
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from hyundai_kia_connect_api.ApiImpl import ForceRefreshPolling
+from hyundai_kia_connect_api.exceptions import APIError
+from hyundai_kia_connect_api.ForceRefreshScheduler import ForceRefreshScheduler
+from hyundai_kia_connect_api.KiaUvoApiEU import KiaUvoApiEU
+from hyundai_kia_connect_api.Vehicle import Vehicle
+
+TOKEN = SimpleNamespace(access_token="t", device_id="d")
+
+
+def _response(payload):
+    resp = MagicMock()
+    resp.json.return_value = payload
+    return resp
+
+
+@pytest.fixture
+def eu_api() -> KiaUvoApiEU:
+    api = KiaUvoApiEU.__new__(KiaUvoApiEU)
+    api.SPA_API_URL = "https://test.invalid/api/v1/spa/"
+    api.session = MagicMock()
+    api._get_authenticated_headers = MagicMock(return_value={})
+    api._update_vehicle_properties_ccs2 = MagicMock()
+    api._set_cached_location_park = MagicMock()
+    return api
+
+
+@pytest.fixture
+def ccs2_vehicle() -> Vehicle:
+    vehicle = Vehicle()
+    vehicle.id = "vid-123"
+    vehicle.ccu_ccs2_protocol_support = 1
+    return vehicle
+
+
+def _eu_session(api, dates):
+    """Serve the wake ack and successive /latest snapshots dated ``dates``."""
+    calls = []
+    dates = iter(dates)
+
+    def get(url, headers=None):
+        calls.append(url)
+        if url.endswith("/latest"):
+            date = next(dates)
+            return _response(
+                {"retCode": "S", "resMsg": {"state": {"Vehicle": {"Date": date}}}}
+            )
+        return _response({"retCode": "S", "msgId": "m1"})
+
+    api.session.get.side_effect = get
+    return calls
+
+
+def test_eu_polling_backs_off_until_snapshot_moves(eu_api, ccs2_vehicle):
+    calls = _eu_session(eu_api, ["old", "old", "old", "new"])
+    polling = ForceRefreshPolling(initial_delay=4, backoff=2, max_delay=10)
+
+    delays = list(
+        eu_api._force_refresh_vehicle_state_ccs2_steps(TOKEN, ccs2_vehicle, polling)
+    )
+
+    assert delays == [4, 8, 10]
+    # baseline read, wake, then one /latest read per delay
+    assert [url.endswith("/latest") for url in calls] == [
+        True,
+        False,
+        True,
+        True,
+        True,
+    ]
+    applied = eu_api._update_vehicle_properties_ccs2.call_args[0][1]
+    assert applied == {"Date": "new"}
+    eu_api._set_cached_location_park.assert_called_once_with(TOKEN, ccs2_vehicle)
+
+
+def test_eu_polling_applies_latest_snapshot_at_deadline(eu_api, ccs2_vehicle):
+    _eu_session(eu_api, ["old", "old"])
+    polling = ForceRefreshPolling(initial_delay=1, timeout=0)
+
+    delays = list(
+        eu_api._force_refresh_vehicle_state_ccs2_steps(TOKEN, ccs2_vehicle, polling)
+    )
+
+    assert delays == [1]
+    eu_api._update_vehicle_properties_ccs2.assert_called_once()
+
+
+def test_scheduler_drives_refreshes_without_blocking_caller():
+    scheduler = ForceRefreshScheduler()
+    threads = set()
+
+    def steps(delays):
+        for delay in delays:
+            threads.add(threading.current_thread().name)
+            yield delay
+
+    try:
+        slow = scheduler.submit(steps([0.05, 0.05]), result="slow")
+        fast = scheduler.submit(steps([0.01]), result="fast")
+        assert fast.result(timeout=5) == "fast"
+        assert slow.result(timeout=5) == "slow"
+    finally:
+        scheduler.shutdown()
+    assert len(threads) == 1
+    assert scheduler.pending == 0
+
+
+def test_scheduler_propagates_step_errors():
+    scheduler = ForceRefreshScheduler()
+
+    def steps():
+        yield 0
+        raise APIError("did not return fresh data")
+
+    try:
+        future = scheduler.submit(steps())
+        with pytest.raises(APIError):
+            future.result(timeout=5)
+    finally:
+        scheduler.shutdown()
+
+
+def test_scheduler_shutdown_cancels_waiting_refreshes():
+    scheduler = ForceRefreshScheduler()
+    future = scheduler.submit(iter([60, 60]))
+    scheduler.shutdown()
+    assert future.cancelled()
+    with pytest.raises(RuntimeError):
+        scheduler.submit(iter([]))
+
+
+def test_start_force_refresh_returns_future_with_vehicle(make_manager):
+    vehicle = Vehicle(id="v1")
+    mgr = make_manager(MagicMock(), vehicles=[vehicle], token=TOKEN)
+    mgr.api.force_refresh_vehicle_state_steps.return_value = iter([0])
+
+    future = mgr.start_force_refresh("v1")
+    assert future.result(timeout=5) is vehicle
+
+    _, _, polling = mgr.api.force_refresh_vehicle_state_steps.call_args[0]
+    assert polling == ForceRefreshPolling()
+    assert vehicle.last_scanned_at is not None
+
+
+def test_cancelled_force_refresh_reports_no_changes(caplog, make_manager):
+    mgr = make_manager(MagicMock(), vehicles=[Vehicle(id="v1")], token=TOKEN)
+    mgr.api.force_refresh_vehicle_state_steps.return_value = iter([60])
+    listener = MagicMock()
+    mgr.add_change_listener(listener)
+
+    future = mgr.start_force_refresh("v1")
+    mgr.force_refresh_scheduler.shutdown()
+
+    assert future.cancelled()
+    listener.assert_not_called()
+    # concurrent.futures logs exceptions raised by done-callbacks.
+    assert not caplog.records
+
+
+def test_start_force_refresh_skips_disabled_vehicle(make_manager):
+    vehicle = Vehicle(id="v1")
+    vehicle.enabled = False
+    mgr = make_manager(MagicMock(), vehicles=[vehicle])
+
+    assert mgr.start_force_refresh("v1").result(timeout=0) is vehicle
+    mgr.api.force_refresh_vehicle_state_steps.assert_not_called()
+    assert mgr.force_refresh_scheduler is None
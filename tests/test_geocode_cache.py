@@ -0,0 +1,111 @@
+"""Reverse-geocode caching (GeocodeCache) in ApiImpl.update_geocoded_location."""
+
+from unittest.mock import MagicMock, patch
+
+from hyundai_kia_connect_api.ApiImpl import ApiImpl
+from hyundai_kia_connect_api.cache import GeocodeCache
+from hyundai_kia_connect_api.Vehicle import Vehicle
+
+OSM = 1
+
+
+def _vehicle(latitude, longitude):
+    vehicle = Vehicle(id="id", name="car")
+    vehicle.location = (latitude, longitude, None)
+    return vehicle
+
+
+def _nominatim(url, **kwargs):
+    response = MagicMock()
+    response.json.return_value = {"display_name": url, "address": {}}
+    return response
+
+
+def _api(cache=None):
+    api = ApiImpl()
+    api.geocode_cache = cache or GeocodeCache()
+    return api
+
+
+def test_alternating_vehicles_request_each_location_once():
+    api = _api()
+    home = _vehicle(52.37021, 4.89517)
+    work = _vehicle(51.92250, 4.47917)
+
+    with patch(
+        "hyundai_kia_connect_api.ApiImpl.requests.get", side_effect=_nominatim
+    ) as get:
+        for _ in range(3):
+            api.update_geocoded_location(None, home, use_email=False, provider=OSM)
+            api.update_geocoded_location(None, work, use_email=False, provider=OSM)
+
+    assert get.call_count == 2
+    assert home.geocode != work.geocode
+    assert api.geocode_cache.stats.hits == 4
+
+
+def test_gps_jitter_within_grid_is_a_hit():
+    api = _api()
+    first = _vehicle(52.370210, 4.895170)
+    jittered = _vehicle(52.370240, 4.895190)
+
+    with patch(
+        "hyundai_kia_connect_api.ApiImpl.requests.get", side_effect=_nominatim
+    ) as get:
+        api.update_geocoded_location(None, first, use_email=False, provider=OSM)
+        api.update_geocoded_location(None, jittered, use_email=False, provider=OSM)
+
+    get.assert_called_once()
+    assert jittered.geocode == first.geocode
+
+
+def test_failed_lookup_is_not_cached():
+    api = _api()
+    vehicle = _vehicle(52.37021, 4.89517)
+    failed = MagicMock()
+    failed.json.return_value = {"error": "Unable to geocode"}
+
+    with patch(
+        "hyundai_kia_connect_api.ApiImpl.requests.get", return_value=failed
+    ) as get:
+        api.update_geocoded_location(None, vehicle, use_email=False, provider=OSM)
+        api.update_geocoded_location(None, vehicle, use_email=False, provider=OSM)
+
+    assert get.call_count == 2
+    assert api.geocode_cache.stats.size == 0
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = GeocodeCache(max_entries=2)
+    cache.put(OSM, 1.0, 1.0, "a")
+    cache.put(OSM, 2.0, 2.0, "b")
+    assert cache.get(OSM, 1.0, 1.0) == "a"
+    cache.put(OSM, 3.0, 3.0, "c")
+
+    assert cache.get(OSM, 2.0, 2.0) is None
+    assert cache.get(OSM, 1.0, 1.0) == "a"
+    assert cache.stats.size == 2
+
+
+def test_entries_are_kept_per_provider():
+    cache = GeocodeCache()
+    cache.put(1, 52.0, 4.0, "osm")
+
+    assert cache.get(2, 52.0, 4.0) is None
+    assert cache.get(1, 52.0, 4.0) == "osm"
+
+
+def test_persisted_entries_survive_a_new_cache(tmp_path):
+    path = str(tmp_path / "geocode.sqlite")
+    cache = GeocodeCache(path=path)
+    cache.put(OSM, 52.37021, 4.89517, ("Dam, Amsterdam", {"city": "Amsterdam"}))
+    cache.close()
+
+    reopened = GeocodeCache(path=path)
+    try:
+        assert reopened.get(OSM, 52.37021, 4.89517) == (
+            "Dam, Amsterdam",
+            {"city": "Amsterdam"},
+        )
+    finally:
+        reopened.close()
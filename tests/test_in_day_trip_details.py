@@ -0,0 +1,49 @@
+"""Concurrent /tripinfo/detail requests of the Indian day trip info."""
+
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from hyundai_kia_connect_api.KiaUvoApiIN import KiaUvoApiIN
+from hyundai_kia_connect_api.Vehicle import Vehicle
+
+SUMMARY = {
+    "tripDrvTime": 30,
+    "tripIdleTime": 2,
+    "tripDist": 12,
+    "tripAvgSpeed": 24,
+    "tripMaxSpeed": 80,
+}
+
+
+def _api(trips):
+    api = KiaUvoApiIN.__new__(KiaUvoApiIN)
+    api._get_trip_info = lambda *args: {
+        "resMsg": {"dayTripList": [{**SUMMARY, "tripList": trips}]}
+    }
+    return api
+
+
+def test_failed_day_cancels_detail_requests_not_started():
+    # The summarised trip lacks its details and fails to parse while two
+    # detail requests are in flight and a third waits for a worker.
+    trips = [{"tripTime": "081500"}, {"id": 1}, {"id": 2}, {"id": 3}]
+    api = _api(trips)
+    api.max_parallel_requests = 2
+    release = threading.Event()
+    sent = []
+
+    def detail(token, vehicle, date_string, trip):
+        sent.append(trip["id"])
+        release.wait(5)
+
+    api._get_detailed_trip_info = detail
+    try:
+        with pytest.raises(KeyError):
+            api.get_day_trip_info(SimpleNamespace(), Vehicle(id="v1"), "20260724")
+    finally:
+        release.set()
+        # Let whatever is still queued run before looking.
+        api._executor.shutdown(wait=True)
+    assert 3 not in sent
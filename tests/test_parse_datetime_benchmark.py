@@ -0,0 +1,83 @@
+"""Micro-benchmark of utils.parse_datetime on the timestamps of the fixtures.
+
+Run with ``pytest -s`` to see the timings. They are reported, not asserted:
+wall-clock comparisons are flaky on loaded machines.
+"""
+
+import datetime
+import json
+import re
+import timeit
+from pathlib import Path
+
+from hyundai_kia_connect_api.utils import _parse_datetime, parse_datetime
+
+FIXTURES = Path(__file__).parent / "fixtures"
+TIMESTAMP = re.compile(r"^(\d{14}(\.\d+)?|\d{4}-\d{2}-\d{2}T[\d:]+Z?|\w{3}, .+ GMT)$")
+# Polls parse the same snapshot over and over.
+POLLS = 200
+
+
+def _fixture_timestamps() -> list[str]:
+    found = []
+
+    def walk(node):
+        if isinstance(node, dict):
+            node = list(node.values())
+        if isinstance(node, list):
+            for child in node:
+                walk(child)
+        elif isinstance(node, str) and TIMESTAMP.match(node):
+            found.append(node)
+
+    for path in sorted(FIXTURES.glob("*.json")):
+        walk(json.loads(path.read_text()))
+    return [*found, "Tue, 24 Jun 2025 16:18:10 GMT"]
+
+
+def _previous_parse_datetime(value, timezone):
+    """parse_datetime before shape detection and memoization."""
+    try:
+        dt_object = datetime.datetime.strptime(value, "%a, %d %b %Y %H:%M:%S GMT")
+        if timezone:
+            return dt_object.replace(tzinfo=datetime.UTC).astimezone(timezone)
+        return dt_object
+    except ValueError:
+        value = (
+            value.replace("-", "").replace("T", "").replace(":", "").replace("Z", "")
+        )
+        m = re.match(r"(\d{4})(\d{2})(\d{2})(\d{2})(\d{2})(\d{2})", value)
+        return datetime.datetime(*map(int, m.groups()), tzinfo=timezone)
+
+
+def test_parse_datetime_matches_previous_parser():
+    timestamps = _fixture_timestamps()
+    assert len(timestamps) > 10
+    for value in timestamps:
+        assert parse_datetime(value, datetime.UTC) == _previous_parse_datetime(
+            value, datetime.UTC
+        )
+
+
+def test_parse_datetime_timings():
+    timestamps = _fixture_timestamps()
+    _parse_datetime.cache_clear()
+
+    def run(parse):
+        for value in timestamps:
+            parse(value, datetime.UTC)
+
+    previous = min(
+        timeit.repeat(lambda: run(_previous_parse_datetime), number=POLLS, repeat=3)
+    )
+    current = min(timeit.repeat(lambda: run(parse_datetime), number=POLLS, repeat=3))
+
+    print(
+        f"\nparse_datetime: {len(timestamps) * POLLS} timestamps, "
+        f"previous {previous * 1000:.1f} ms, current {current * 1000:.1f} ms "
+        f"({previous / current:.1f}x)"
+    )
+    # Repeated polls are answered from the memo.
+    info = _parse_datetime.cache_info()
+    assert info.misses <= len(set(timestamps))
+    assert info.hits > info.misses
@@ -0,0 +1,187 @@
+"""TTL caching of slow-changing reads (ResponseCache)."""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from hyundai_kia_connect_api import cache as cache_module
+from hyundai_kia_connect_api.cache import ResponseCache
+from hyundai_kia_connect_api.const import ENGINE_TYPES
+from hyundai_kia_connect_api.KiaUvoApiCA import KiaUvoApiCA
+from hyundai_kia_connect_api.Vehicle import Vehicle
+from tests.fixture_helpers import load_fixture
+from tests.test_ca_parallel_update import _Sessions
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = _Clock()
+    monkeypatch.setattr(cache_module.time, "monotonic", clock)
+    return clock
+
+
+def test_entry_is_reused_until_its_ttl_expires(clock):
+    cache = ResponseCache(ttls={"next_service": 60})
+    fetch = MagicMock(side_effect=[{"odometer": 1}, {"odometer": 2}])
+
+    assert cache.get_or_fetch("next_service", "vid", fetch) == {"odometer": 1}
+    clock.now += 59
+    assert cache.get_or_fetch("next_service", "vid", fetch) == {"odometer": 1}
+    clock.now += 1
+    assert cache.get_or_fetch("next_service", "vid", fetch) == {"odometer": 2}
+
+    stats = cache.stats["next_service"]
+    assert (stats.hits, stats.misses, stats.size) == (1, 2, 1)
+
+
+def test_entries_are_kept_per_vehicle_and_endpoint():
+    cache = ResponseCache()
+    cache.get_or_fetch("charge_limits", "a", lambda: "a-limits")
+    cache.get_or_fetch("next_service", "a", lambda: "a-service")
+
+    assert cache.get_or_fetch("charge_limits", "b", lambda: "b-limits") == "b-limits"
+    assert cache.get_or_fetch("charge_limits", "a", lambda: None) == "a-limits"
+
+
+def test_zero_ttl_disables_caching():
+    cache = ResponseCache(ttls={"charge_limits": 0})
+    fetch = MagicMock(return_value="limits")
+
+    cache.get_or_fetch("charge_limits", "vid", fetch)
+    cache.get_or_fetch("charge_limits", "vid", fetch)
+
+    assert fetch.call_count == 2
+
+
+def test_failed_fetch_is_not_cached():
+    cache = ResponseCache()
+    with pytest.raises(RuntimeError):
+        cache.get_or_fetch("charge_limits", "vid", MagicMock(side_effect=RuntimeError))
+
+    assert cache.get_or_fetch("charge_limits", "vid", lambda: "limits") == "limits"
+
+
+def test_max_age_refetches_older_entries(clock):
+    cache = ResponseCache()
+    cache.get_or_fetch("next_service", "vid", lambda: "old")
+    clock.now += 10
+
+    assert cache.get_or_fetch("next_service", "vid", lambda: "new", 5) == "new"
+    assert cache.get_or_fetch("next_service", "vid", lambda: "newer", 5) == "new"
+
+
+def test_invalidate_by_endpoint_and_vehicle():
+    cache = ResponseCache()
+    for endpoint in ("charge_limits", "next_service"):
+        for key in ("a", "b"):
+            cache.get_or_fetch(endpoint, key, lambda: "cached")
+
+    cache.invalidate("charge_limits", "a")
+    assert cache.stats["charge_limits"].size == 1
+    cache.invalidate(key="b")
+    assert cache.stats["charge_limits"].size == 0
+    assert cache.stats["next_service"].size == 1
+    cache.invalidate()
+    assert cache.stats["next_service"].size == 0
+
+
+def test_invalidate_with_settle_skips_caching_until_settled(clock):
+    cache = ResponseCache()
+    cache.get_or_fetch("charge_limits", "a", lambda: "old")
+
+    cache.invalidate("charge_limits", "a", settle=120)
+    clock.now += 60
+    assert cache.get_or_fetch("charge_limits", "a", lambda: "old") == "old"
+    assert cache.get_or_fetch("charge_limits", "a", lambda: "new") == "new"
+    assert cache.stats["charge_limits"].size == 0
+
+    clock.now += 60
+    assert cache.get_or_fetch("charge_limits", "a", lambda: "new") == "new"
+    assert cache.get_or_fetch("charge_limits", "a", lambda: "newer") == "new"
+    with pytest.raises(ValueError):
+        cache.invalidate("charge_limits", settle=120)
+
+
+def _ca_api(cache):
+    api = KiaUvoApiCA(2, 1, "en")
+    api.response_cache = cache
+    return api
+
+
+def _ev():
+    vehicle = Vehicle(id="vid-1", year=2022)
+    vehicle.engine_type = ENGINE_TYPES.EV
+    return vehicle
+
+
+def _status():
+    return load_fixture("ca_kia_niro_ev_2022_cached.json")["status"]
+
+
+def _token():
+    return SimpleNamespace(access_token="t", pin="1234")
+
+
+def test_ca_repeat_poll_reuses_service_and_charge_limits():
+    api = _ca_api(ResponseCache())
+    api._sessions = _Sessions(_status())
+    vehicle = _ev()
+
+    api.update_vehicle_with_cached_state(_token(), vehicle)
+    api._sessions = _Sessions(_status())
+    api.update_vehicle_with_cached_state(_token(), vehicle)
+
+    assert api._sessions.calls == ["lstvhclsts", "evTripDetails"]
+    assert vehicle.ev_charge_limits_ac == 90
+
+
+def test_ca_new_status_refetches_service_for_odometer():
+    api = _ca_api(ResponseCache())
+    api._sessions = _Sessions(_status())
+    vehicle = _ev()
+    api.update_vehicle_with_cached_state(_token(), vehicle)
+
+    moved = _status()
+    moved["lastStatusDate"] = "20300101120000"
+    api._sessions = _Sessions(moved, odometer=1250)
+    api.update_vehicle_with_cached_state(_token(), vehicle)
+
+    assert api._sessions.calls.count("nxtsvc") == 1
+    assert "fndmcr" in api._sessions.calls
+    assert vehicle.odometer == 1250
+
+
+def test_ca_first_update_fetches_service_once():
+    api = _ca_api(ResponseCache())
+    api._sessions = _Sessions(_status())
+
+    api.update_vehicle_with_cached_state(_token(), _ev())
+
+    assert api._sessions.calls.count("nxtsvc") == 1
+
+
+def test_set_charge_limits_invalidates_charge_limits(make_manager):
+    cache = ResponseCache()
+    api = MagicMock()
+    api.set_charge_limits.return_value = "transaction"
+    manager = make_manager(api, vehicles=[Vehicle(id="vid")], response_cache=cache)
+    cache.get_or_fetch("charge_limits", "vid", lambda: "old limits")
+    cache.get_or_fetch("next_service", "vid", lambda: "service")
+
+    assert manager.set_charge_limits("vid", 80, 90) == "transaction"
+
+    # The car has yet to apply the limits: a read now is not kept.
+    assert cache.get_or_fetch("charge_limits", "vid", lambda: "old limits") == (
+        "old limits"
+    )
+    assert cache.get_or_fetch("charge_limits", "vid", lambda: "new") == "new"
+    assert cache.stats["next_service"].size == 1
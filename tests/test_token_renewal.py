@@ -0,0 +1,132 @@
+"""Background token renewal (TokenRenewer) and token listeners."""
+
+import datetime as dt
+import time
+from unittest.mock import MagicMock
+
+from hyundai_kia_connect_api.ApiImpl import ApiImpl
+from hyundai_kia_connect_api.ApiImplType1 import ApiImplType1
+from hyundai_kia_connect_api.exceptions import AuthenticationOTPRequired
+from hyundai_kia_connect_api.Token import Token
+
+
+class RenewingApi(ApiImpl):
+    def __init__(self):
+        super().__init__()
+        self.refresh_calls = 0
+        self.control_calls = 0
+
+    def get_vehicles(self, token):
+        return []
+
+    def refresh_access_token(self, token):
+        self.refresh_calls += 1
+        return Token(
+            pin=token.pin,
+            valid_until=dt.datetime.now(dt.UTC) + dt.timedelta(hours=1),
+        )
+
+    def refresh_control_token(self, token):
+        self.control_calls += 1
+        token.control_token = "Bearer renewed"
+        token.control_token_expiry = time.time() + 600
+        return True
+
+
+def _manager(make_manager, api, valid_for):
+    return make_manager(
+        api, token=Token(pin="1234", valid_until=dt.datetime.now(dt.UTC) + valid_for)
+    )
+
+
+def _wait_for(condition, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline
+        time.sleep(0.005)
+
+
+def test_renews_access_token_ahead_of_expiry(make_manager):
+    api = RenewingApi()
+    manager = _manager(make_manager, api, dt.timedelta(minutes=4))
+    persisted = []
+    manager.add_token_listener(persisted.append)
+
+    renewer = manager.start_token_renewal(lead_time=300, jitter=0)
+    try:
+        _wait_for(lambda: persisted)
+    finally:
+        manager.stop_token_renewal()
+
+    assert not renewer.running
+    assert api.refresh_calls == 1
+    assert persisted == [manager.token]
+    assert manager.token.valid_until > dt.datetime.now(dt.UTC) + dt.timedelta(
+        minutes=50
+    )
+
+
+def test_does_not_renew_token_outside_lead_time(make_manager):
+    api = RenewingApi()
+    manager = _manager(make_manager, api, dt.timedelta(hours=1))
+
+    manager.start_token_renewal(lead_time=300, jitter=60, retry_interval=0.01)
+    time.sleep(0.05)
+    manager.stop_token_renewal()
+
+    assert api.refresh_calls == 0
+
+
+def test_renews_control_token_before_it_expires(make_manager):
+    api = RenewingApi()
+    manager = _manager(make_manager, api, dt.timedelta(hours=1))
+    manager.token.control_token = "Bearer old"
+    manager.token.control_token_expiry = time.time() + 10
+    persisted = []
+    manager.add_token_listener(persisted.append)
+
+    manager.start_token_renewal(control_lead_time=30)
+    try:
+        _wait_for(lambda: persisted)
+    finally:
+        manager.stop_token_renewal()
+
+    assert api.refresh_calls == 0
+    assert api.control_calls == 1
+    assert manager.token.control_token == "Bearer renewed"
+
+
+def test_otp_required_stops_renewer(make_manager):
+    api = RenewingApi()
+    api.refresh_access_token = MagicMock(
+        side_effect=AuthenticationOTPRequired("OTP required to refresh token")
+    )
+    manager = _manager(make_manager, api, dt.timedelta(seconds=0))
+
+    renewer = manager.start_token_renewal(jitter=0)
+    _wait_for(lambda: not renewer.running)
+    manager.stop_token_renewal()
+
+    api.refresh_access_token.assert_called_once()
+
+
+def test_removed_listener_is_not_called(make_manager):
+    api = RenewingApi()
+    manager = _manager(make_manager, api, dt.timedelta(seconds=0))
+    calls = []
+    remove = manager.add_token_listener(calls.append)
+    remove()
+
+    assert manager.check_and_refresh_token() is True
+    assert calls == []
+
+
+def test_type1_refresh_control_token_requests_new_token():
+    api = ApiImplType1.__new__(ApiImplType1)
+    api._get_control_token = MagicMock(return_value=("Bearer new", 1234))
+    token = Token(pin="1234", control_token="Bearer old", control_token_expiry=9e9)
+
+    assert api.refresh_control_token(token) is True
+    assert token.control_token_expiry == 1234
+    assert token.control_token == "Bearer new"
+    assert api.refresh_control_token(Token()) is False
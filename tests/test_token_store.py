@@ -0,0 +1,215 @@
+"""Shared token persistence (TokenStore) in VehicleManager."""
+
+import datetime as dt
+import errno
+import importlib
+import os
+import stat
+import threading
+import time
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from hyundai_kia_connect_api.ApiImpl import ApiImpl
+from hyundai_kia_connect_api.ApiImplType1 import _retry_on_device_id_error
+from hyundai_kia_connect_api.exceptions import DeviceIDError
+from hyundai_kia_connect_api.Token import Token
+from hyundai_kia_connect_api.TokenStore import (
+    FileTokenStore,
+    MemoryTokenStore,
+    TokenStore,
+)
+
+# The package re-exports the TokenStore class under the module's name.
+token_store_module = importlib.import_module("hyundai_kia_connect_api.TokenStore")
+
+
+def _token(access_token, valid_for=dt.timedelta(hours=1)):
+    return Token(
+        username="user",
+        access_token=access_token,
+        refresh_token="refresh",
+        device_id="device",
+        valid_until=dt.datetime.now(dt.UTC) + valid_for,
+        pin="1234",
+    )
+
+
+class StoreApi(ApiImpl):
+    def __init__(self):
+        super().__init__()
+        self.logins = 0
+        self.refreshes = 0
+
+    def login(self, username, password, pin=None):
+        self.logins += 1
+        return _token("logged-in")
+
+    def get_vehicles(self, token):
+        return []
+
+    def refresh_access_token(self, token):
+        self.refreshes += 1
+        time.sleep(0.01)
+        return _token(f"refreshed-{self.refreshes}")
+
+
+def _manager(make_manager, store, token=None):
+    return make_manager(StoreApi(), token=token, token_store=store)
+
+
+def test_memory_store_round_trip():
+    store = MemoryTokenStore()
+    token = _token("access")
+
+    assert store.load("key") is None
+    store.save("key", token)
+
+    assert store.load("key") == token
+    assert store.load("key") is not token
+
+
+def test_file_store_writes_private_file_atomically(tmp_path):
+    store = FileTokenStore(str(tmp_path / "tokens"))
+    token = _token("access")
+
+    store.save("1:1:user", token)
+    store.save("1:1:user", _token("newer"))
+
+    files = os.listdir(tmp_path / "tokens")
+    assert len(files) == 1
+    assert files[0].endswith(".json")
+    mode = os.stat(tmp_path / "tokens" / files[0]).st_mode
+    assert stat.S_IMODE(mode) == 0o600
+    assert FileTokenStore(str(tmp_path / "tokens")).load("1:1:user").access_token == (
+        "newer"
+    )
+
+
+def test_file_store_ignores_unreadable_token(tmp_path):
+    store = FileTokenStore(str(tmp_path))
+    store.save("key", _token("access"))
+    (path,) = tmp_path.glob("*.json")
+    path.write_text("{not json")
+
+    assert store.load("key") is None
+    assert store.load("other") is None
+
+
+def test_file_store_locks_with_msvcrt_without_fcntl(tmp_path, monkeypatch):
+    calls = []
+
+    def locking(fd, mode, nbytes):
+        calls.append(mode)
+        if len(calls) == 1:
+            # LK_LOCK timing out while another process holds the lock.
+            raise OSError(errno.EDEADLOCK, "deadlock")
+
+    msvcrt = SimpleNamespace(LK_LOCK="lock", LK_UNLCK="unlock", locking=locking)
+    monkeypatch.setattr(token_store_module, "fcntl", None)
+    monkeypatch.setattr(token_store_module, "msvcrt", msvcrt, raising=False)
+
+    with FileTokenStore(str(tmp_path)).lock("user"):
+        assert calls == ["lock", "lock"]
+    assert calls == ["lock", "lock", "unlock"]
+
+
+def test_manager_starts_from_stored_token(make_manager):
+    store = MemoryTokenStore()
+    store.save("1:1:user", _token("stored"))
+
+    manager = _manager(make_manager, store)
+
+    assert manager.token.access_token == "stored"
+    assert manager.check_and_refresh_token() is False
+    assert manager.api.logins == 0
+
+
+def test_login_and_refresh_are_stored(make_manager):
+    store = MemoryTokenStore()
+    manager = _manager(make_manager, store)
+
+    manager.check_and_refresh_token()
+    assert store.load(manager.token_store_key).access_token == "logged-in"
+
+    manager.token.valid_until = dt.datetime.now(dt.UTC)
+    store.save(manager.token_store_key, manager.token)
+    manager.check_and_refresh_token()
+    assert store.load(manager.token_store_key).access_token == "refreshed-1"
+
+
+def test_manager_adopts_token_refreshed_by_another(make_manager):
+    store = MemoryTokenStore()
+    first = _manager(make_manager, store, token=_token("old", dt.timedelta(0)))
+    second = _manager(make_manager, store, token=_token("old", dt.timedelta(0)))
+    persisted = []
+    second.add_token_listener(persisted.append)
+
+    assert first.check_and_refresh_token() is True
+    assert second.check_and_refresh_token() is True
+
+    assert first.api.refreshes == 1
+    assert second.api.refreshes == 0
+    assert second.token.access_token == "refreshed-1"
+    assert persisted == [second.token]
+
+
+def test_concurrent_managers_refresh_once(make_manager, tmp_path):
+    store = FileTokenStore(str(tmp_path))
+    managers = [
+        _manager(make_manager, store, token=_token("old", dt.timedelta(0)))
+        for _ in range(4)
+    ]
+
+    threads = [
+        threading.Thread(target=manager.check_and_refresh_token) for manager in managers
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sum(manager.api.refreshes for manager in managers) == 1
+    assert {manager.token.access_token for manager in managers} == {"refreshed-1"}
+
+
+def test_reregistered_device_id_is_stored(make_manager):
+    store = MemoryTokenStore()
+    manager = _manager(make_manager, store, token=_token("access"))
+    api = manager.api
+    api._get_stamp = MagicMock(return_value="stamp")
+    api._get_device_id = MagicMock(return_value="new-device")
+    command = MagicMock(side_effect=[DeviceIDError("invalid device id"), "ok"])
+    persisted = []
+    manager.add_token_listener(persisted.append)
+
+    assert _retry_on_device_id_error(command)(api, manager.token) == "ok"
+
+    assert store.load(manager.token_store_key).device_id == "new-device"
+    assert persisted == [manager.token]
+
+
+def test_reregistered_device_id_reaches_listeners_without_store(make_manager):
+    manager = _manager(make_manager, None, token=_token("access"))
+    api = manager.api
+    api._get_stamp = MagicMock(return_value="stamp")
+    api._get_device_id = MagicMock(return_value="new-device")
+    command = MagicMock(side_effect=[DeviceIDError("invalid device id"), "ok"])
+    persisted = []
+    manager.add_token_listener(persisted.append)
+
+    assert _retry_on_device_id_error(command)(api, manager.token) == "ok"
+
+    assert persisted == [manager.token]
+    assert manager.token.device_id == "new-device"
+
+
+def test_incomplete_store_fails_on_creation():
+    class LoadOnlyStore(TokenStore):
+        def load(self, key):
+            return None
+
+    with pytest.raises(TypeError):
+        LoadOnlyStore()
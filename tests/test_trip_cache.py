@@ -0,0 +1,158 @@
+"""Trip history caching (TripHistoryCache) in VehicleManager."""
+
+import datetime as dt
+from unittest.mock import MagicMock
+
+from hyundai_kia_connect_api import cache as cache_module
+from hyundai_kia_connect_api.ApiImpl import ApiImpl
+from hyundai_kia_connect_api.cache import TripHistoryCache
+from hyundai_kia_connect_api.Vehicle import (
+    DayTripCounts,
+    DayTripInfo,
+    MonthTripInfo,
+    TripInfo,
+    Vehicle,
+)
+
+CLOSED_MONTH = "202401"
+CLOSED_DAY = "20240115"
+
+
+def _month(yyyymm):
+    return MonthTripInfo(
+        yyyymm=yyyymm,
+        summary=TripInfo(drive_time=90, distance=42.5),
+        day_list=[DayTripCounts(yyyymmdd=CLOSED_DAY, trip_count=2)],
+    )
+
+
+def _day(yyyymmdd):
+    trip = TripInfo(hhmmss="081500", drive_time=20, distance=12.0, max_speed=90)
+    return DayTripInfo(yyyymmdd=yyyymmdd, summary=trip, trip_list=[trip])
+
+
+def _manager(make_manager, cache):
+    api = ApiImpl()
+    api.get_month_trip_info = MagicMock(side_effect=lambda t, v, p: _month(p))
+    api.get_day_trip_info = MagicMock(side_effect=lambda t, v, p: _day(p))
+    return make_manager(
+        api,
+        vehicles=[Vehicle(id="v1"), Vehicle(id="v2")],
+        trip_cache=cache,
+    )
+
+
+def test_closed_month_is_served_from_cache(make_manager):
+    manager = _manager(make_manager, TripHistoryCache())
+    vehicle = manager.vehicles["v1"]
+
+    manager.update_month_trip_info("v1", CLOSED_MONTH)
+    first = vehicle.month_trip_info
+    vehicle.month_trip_info = None
+    manager.update_month_trip_info("v1", CLOSED_MONTH)
+
+    manager.api.get_month_trip_info.assert_called_once()
+    assert vehicle.month_trip_info == first == _month(CLOSED_MONTH)
+    assert manager.trip_cache.stats.hits == 1
+
+
+def test_periods_are_cached_per_vehicle(make_manager):
+    manager = _manager(make_manager, TripHistoryCache())
+
+    manager.update_day_trip_info("v1", CLOSED_DAY)
+    manager.update_day_trip_info("v2", CLOSED_DAY)
+
+    assert manager.api.get_day_trip_info.call_count == 2
+
+
+def test_current_day_is_revalidated_after_open_ttl(monkeypatch, make_manager):
+    now = [1000.0]
+    monkeypatch.setattr(cache_module.time, "monotonic", lambda: now[0])
+    manager = _manager(make_manager, TripHistoryCache(open_ttl=60, grace=0))
+    today = dt.datetime.now(dt.UTC).strftime("%Y%m%d")
+
+    manager.update_day_trip_info("v1", today)
+    now[0] += 59
+    manager.update_day_trip_info("v1", today)
+    assert manager.api.get_day_trip_info.call_count == 1
+    now[0] += 1
+    manager.update_day_trip_info("v1", today)
+    assert manager.api.get_day_trip_info.call_count == 2
+
+
+def test_is_closed():
+    cache = TripHistoryCache(grace=0)
+    now = dt.datetime.now(dt.UTC)
+    yesterday = now - dt.timedelta(days=1)
+
+    assert cache.is_closed(CLOSED_MONTH, dt.UTC)
+    assert cache.is_closed(yesterday.strftime("%Y%m%d"), dt.UTC)
+    assert not cache.is_closed(now.strftime("%Y%m%d"), dt.UTC)
+    assert not cache.is_closed(now.strftime("%Y%m"), dt.UTC)
+    assert not TripHistoryCache(grace=2 * 86400).is_closed(
+        yesterday.strftime("%Y%m%d"), dt.UTC
+    )
+
+
+def test_fetch_trip_history_is_free_once_loaded(make_manager):
+    manager = _manager(make_manager, TripHistoryCache())
+
+    for _ in range(2):
+        history = manager.fetch_trip_history(
+            "v1", dt.date(2024, 1, 1), dt.date(2024, 1, 31)
+        )
+        assert [day.yyyymmdd for day in history] == [CLOSED_DAY]
+
+    manager.api.get_month_trip_info.assert_called_once()
+    manager.api.get_day_trip_info.assert_called_once()
+
+
+def test_closed_periods_persist_across_restarts(tmp_path):
+    path = str(tmp_path / "trips.sqlite")
+    cache = TripHistoryCache(path=path)
+    cache.get_or_fetch("v1", CLOSED_MONTH, lambda: _month(CLOSED_MONTH))
+    cache.get_or_fetch("v1", CLOSED_DAY, lambda: _day(CLOSED_DAY))
+    cache.close()
+
+    reopened = TripHistoryCache(path=path)
+    fetch = MagicMock()
+    try:
+        assert reopened.get_or_fetch("v1", CLOSED_MONTH, fetch) == _month(CLOSED_MONTH)
+        assert reopened.get_or_fetch("v1", CLOSED_DAY, fetch) == _day(CLOSED_DAY)
+        fetch.assert_not_called()
+    finally:
+        reopened.close()
+
+
+def test_empty_closed_periods_are_not_kept(tmp_path, monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(cache_module.time, "monotonic", lambda: now[0])
+    path = str(tmp_path / "trips.sqlite")
+    cache = TripHistoryCache(open_ttl=60, path=path)
+    fetch = MagicMock(side_effect=[None, None, _month(CLOSED_MONTH)])
+
+    assert cache.get_or_fetch("v1", CLOSED_MONTH, fetch) is None
+    assert cache.get_or_fetch("v1", CLOSED_MONTH, fetch) is None
+    assert fetch.call_count == 1
+    cache.close()
+
+    reopened = TripHistoryCache(open_ttl=60, path=path)
+    assert reopened.get_or_fetch("v1", CLOSED_MONTH, fetch) is None
+    now[0] += 61
+    assert reopened.get_or_fetch("v1", CLOSED_MONTH, fetch) == _month(CLOSED_MONTH)
+    assert fetch.call_count == 3
+    reopened.close()
+
+
+def test_invalidate_drops_vehicle_periods(tmp_path):
+    cache = TripHistoryCache(path=str(tmp_path / "trips.sqlite"))
+    cache.get_or_fetch("v1", CLOSED_DAY, lambda: _day(CLOSED_DAY))
+    cache.get_or_fetch("v2", CLOSED_DAY, lambda: _day(CLOSED_DAY))
+
+    cache.invalidate("v1")
+    fetch = MagicMock(return_value=None)
+
+    assert cache.get_or_fetch("v1", CLOSED_DAY, fetch) is None
+    assert cache.get_or_fetch("v2", CLOSED_DAY, fetch) == _day(CLOSED_DAY)
+    fetch.assert_called_once()
+    cache.close()
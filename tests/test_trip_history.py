@@ -0,0 +1,84 @@
+"""Bulk trip history: get_*_trip_info and VehicleManager.fetch_trip_history."""
+
+import datetime as dt
+import threading
+import time
+from unittest.mock import MagicMock
+
+from hyundai_kia_connect_api.ApiImpl import ApiImpl
+from hyundai_kia_connect_api.KiaUvoApiEU import KiaUvoApiEU
+from hyundai_kia_connect_api.Vehicle import (
+    DayTripCounts,
+    DayTripInfo,
+    MonthTripInfo,
+    Vehicle,
+)
+
+
+class TripApi(ApiImpl):
+    def __init__(self, trip_days):
+        super().__init__()
+        self.trip_days = trip_days
+        self.day_requests = []
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def get_month_trip_info(self, token, vehicle, yyyymm_string):
+        days = [day for day in self.trip_days if day.startswith(yyyymm_string)]
+        if not days:
+            return None
+        return MonthTripInfo(
+            yyyymm=yyyymm_string,
+            day_list=[DayTripCounts(yyyymmdd=day, trip_count=1) for day in days],
+        )
+
+    def get_day_trip_info(self, token, vehicle, yyyymmdd_string):
+        with self.lock:
+            self.day_requests.append(yyyymmdd_string)
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(0.01)
+        with self.lock:
+            self.in_flight -= 1
+        return DayTripInfo(yyyymmdd=yyyymmdd_string)
+
+
+def test_fetches_only_days_with_trips_concurrently(make_manager):
+    api = TripApi(["20241130", "20241215", "20241216", "20250102", "20250120"])
+    manager = make_manager(api, vehicles=[Vehicle(id="v1")])
+
+    history = manager.fetch_trip_history(
+        "v1", dt.date(2024, 12, 1), dt.date(2025, 1, 10), max_workers=2
+    )
+
+    assert [day.yyyymmdd for day in history] == ["20241215", "20241216", "20250102"]
+    assert sorted(api.day_requests) == ["20241215", "20241216", "20250102"]
+    assert api.max_in_flight == 2
+    assert manager.vehicles["v1"].day_trip_info is None
+
+
+def test_eu_day_trip_info_does_not_touch_vehicle():
+    api = KiaUvoApiEU.__new__(KiaUvoApiEU)
+    trip = {
+        "tripDrvTime": 10,
+        "tripIdleTime": 1,
+        "tripDist": 5,
+        "tripAvgSpeed": 30,
+        "tripMaxSpeed": 50,
+    }
+    api._get_trip_info = MagicMock(
+        return_value={
+            "resMsg": {
+                "dayTripList": [{**trip, "tripList": [{**trip, "tripTime": "0815"}]}]
+            }
+        }
+    )
+    vehicle = Vehicle(id="v1")
+
+    day = api.get_day_trip_info(None, vehicle, "20250102")
+
+    assert day.trip_list[0].hhmmss == "0815"
+    assert vehicle.day_trip_info is None
+    api.update_day_trip_info(None, vehicle, "20250102")
+    assert vehicle.day_trip_info == day
@@ -0,0 +1,100 @@
+"""Skipping unchanged cached states (ApiImpl._apply_state)."""
+
+import copy
+from unittest.mock import MagicMock
+
+import pytest
+
+from hyundai_kia_connect_api.ApiImpl import ApiImpl
+from hyundai_kia_connect_api.HyundaiBlueLinkApiBR import HyundaiBlueLinkApiBR
+from hyundai_kia_connect_api.Vehicle import Vehicle
+
+STATE = {
+    "Date": "20250102103000",
+    "Green": {"BatteryManagement": {"BatteryRemain": {"Ratio": 80}}},
+    "Drivetrain": {"Odometer": 12345.6},
+}
+
+
+class CachedStateApi(ApiImpl):
+    def __init__(self, states):
+        super().__init__()
+        self.states = states
+        self.parsed = []
+
+    def update_vehicle_with_cached_state(self, token, vehicle):
+        self._apply_state(vehicle, self.states.pop(0), self._parse)
+
+    def _parse(self, vehicle, state):
+        self.parsed.append(state)
+        vehicle.data = state
+
+
+def test_same_state_is_parsed_once(make_manager):
+    moved = copy.deepcopy(STATE)
+    moved["Drivetrain"]["Odometer"] = 12400.0
+    api = CachedStateApi([STATE, copy.deepcopy(STATE), moved])
+    manager = make_manager(api, vehicles=[Vehicle(id="v1")])
+
+    assert manager.update_vehicle_with_cached_state("v1") is True
+    assert manager.update_vehicle_with_cached_state("v1") is False
+    assert manager.update_vehicle_with_cached_state("v1") is True
+
+    assert api.parsed == [STATE, moved]
+
+
+def test_key_order_does_not_change_the_fingerprint(make_manager):
+    reordered = dict(reversed(list(STATE.items())))
+    api = CachedStateApi([STATE, reordered])
+    manager = make_manager(api, vehicles=[Vehicle(id="v1")])
+
+    manager.update_vehicle_with_cached_state("v1")
+
+    assert manager.update_vehicle_with_cached_state("v1") is False
+
+
+def test_update_result_lists_unchanged_vehicles(make_manager):
+    api = CachedStateApi([STATE, STATE, STATE, copy.deepcopy(STATE)])
+    manager = make_manager(api, vehicles=[Vehicle(id="v1")])
+    manager.vehicles["v2"] = Vehicle(id="v2")
+    manager.update_all_vehicles_with_cached_state()
+    manager.vehicles["v2"]._state_fingerprint = None
+
+    result = manager.update_all_vehicles_with_cached_state()
+
+    assert result.updated == ["v1", "v2"]
+    assert result.unchanged == ["v1"]
+
+
+def test_failed_parse_is_retried_on_next_poll(make_manager):
+    api = CachedStateApi([STATE, STATE])
+    api._parse = MagicMock(side_effect=[ValueError("bad state"), None])
+    manager = make_manager(api, vehicles=[Vehicle(id="v1")])
+
+    with pytest.raises(ValueError):
+        manager.update_vehicle_with_cached_state("v1")
+
+    assert manager.update_vehicle_with_cached_state("v1") is True
+    assert api._parse.call_count == 2
+
+
+def test_regions_without_fingerprints_report_changed(make_manager):
+    api = MagicMock()
+    manager = make_manager(api, vehicles=[Vehicle(id="v1")])
+
+    assert manager.update_vehicle_with_cached_state("v1") is True
+    assert manager.update_vehicle_with_cached_state("v1") is True
+
+
+def test_br_cached_update_skips_unchanged_state():
+    api = HyundaiBlueLinkApiBR.__new__(HyundaiBlueLinkApiBR)
+    api._get_cached_vehicle_state = MagicMock(
+        side_effect=lambda token, vehicle: copy.deepcopy(STATE)
+    )
+    api._update_vehicle_properties_ccs2 = MagicMock()
+    vehicle = Vehicle(id="v1")
+
+    api.update_vehicle_with_cached_state(None, vehicle)
+    api.update_vehicle_with_cached_state(None, vehicle)
+
+    api._update_vehicle_properties_ccs2.assert_called_once()
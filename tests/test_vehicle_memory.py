@@ -0,0 +1,110 @@
+"""Memory held per Vehicle, and the raw payload retention modes.
+
+Run with ``pytest -s`` to see bytes per vehicle.
+"""
+
+import dataclasses
+import json
+import pickle
+import tracemalloc
+
+import pytest
+
+from hyundai_kia_connect_api.ApiImplType1 import ApiImplType1
+from hyundai_kia_connect_api.const import RAW_DATA_RETENTION
+from hyundai_kia_connect_api.Vehicle import Vehicle
+from tests.fixture_helpers import load_fixture
+
+FLEET = 200
+FIXTURE = "eu_kia_ev9_2024_ccs2.json"
+
+
+def _parse(retention: RAW_DATA_RETENTION, payload: str) -> Vehicle:
+    api = ApiImplType1.__new__(ApiImplType1)
+    api.data_timezone = None
+    vehicle = Vehicle(raw_data_retention=retention)
+    # Every vehicle gets its own decoded response, as it would from the API.
+    api._update_vehicle_properties_ccs2(vehicle, json.loads(payload))
+    return vehicle
+
+
+def _bytes_per_vehicle(retention: RAW_DATA_RETENTION, payload: str) -> float:
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        fleet = [_parse(retention, payload) for _ in range(FLEET)]
+        size = tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+    assert len(fleet) == FLEET
+    return size / FLEET
+
+
+def test_vehicle_has_no_instance_dict():
+    vehicle = Vehicle()
+    assert not hasattr(vehicle, "__dict__")
+    with pytest.raises(AttributeError):
+        vehicle.not_a_field = 1
+
+
+def test_bytes_per_vehicle():
+    payload = json.dumps(load_fixture(FIXTURE))
+    sizes = {
+        retention: _bytes_per_vehicle(retention, payload)
+        for retention in RAW_DATA_RETENTION
+    }
+    print(
+        "\nbytes per vehicle: "
+        + ", ".join(f"{r.value} {size:.0f}" for r, size in sizes.items())
+    )
+    assert (
+        sizes[RAW_DATA_RETENTION.DROP]
+        < sizes[RAW_DATA_RETENTION.COMPRESS]
+        < sizes[RAW_DATA_RETENTION.KEEP]
+    )
+
+
+@pytest.mark.parametrize("retention", list(RAW_DATA_RETENTION))
+def test_retention_keeps_parsed_fields(retention):
+    payload = json.dumps(load_fixture(FIXTURE))
+    kept = _parse(RAW_DATA_RETENTION.KEEP, payload)
+
+    vehicle = _parse(retention, payload)
+
+    assert vehicle.odometer == kept.odometer
+    assert vehicle.ev_battery_percentage == kept.ev_battery_percentage
+    if retention is RAW_DATA_RETENTION.DROP:
+        assert vehicle.data is None
+    else:
+        assert vehicle.data == json.loads(payload)
+
+
+def test_vehicle_pickles_with_compressed_payload():
+    vehicle = _parse(RAW_DATA_RETENTION.COMPRESS, json.dumps(load_fixture(FIXTURE)))
+
+    copy = pickle.loads(pickle.dumps(vehicle))
+
+    assert copy == vehicle
+    assert copy.data == vehicle.data
+
+
+def test_compressed_payload_is_decoded_copy():
+    vehicle = Vehicle(raw_data_retention=RAW_DATA_RETENTION.COMPRESS)
+    vehicle.data = {"status": {"odometer": 1}}
+
+    vehicle.data["status"]["odometer"] = 2
+
+    assert vehicle.data == {"status": {"odometer": 1}}
+    assert vehicle.data is not vehicle.data
+
+
+@pytest.mark.parametrize("retention", list(RAW_DATA_RETENTION))
+def test_constructor_accepts_data(retention):
+    payload = {"status": {"odometer": 1}}
+
+    vehicle = Vehicle(data=payload, raw_data_retention=retention)
+
+    expected = None if retention is RAW_DATA_RETENTION.DROP else payload
+    assert vehicle.data == expected
+    assert dataclasses.asdict(vehicle)["data"] == expected
+    assert "data" in {f.name for f in dataclasses.fields(Vehicle)}
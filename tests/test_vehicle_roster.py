@@ -0,0 +1,148 @@
+"""Warm start from a vehicle roster snapshot in VehicleManager."""
+
+import datetime as dt
+import json
+
+import pytest
+
+from hyundai_kia_connect_api.ApiImpl import ApiImpl
+from hyundai_kia_connect_api.const import ENGINE_TYPES
+from hyundai_kia_connect_api.Token import Token
+from hyundai_kia_connect_api.Vehicle import Vehicle
+
+
+def _token(access_token="access"):
+    return Token(
+        username="user",
+        access_token=access_token,
+        refresh_token="refresh",
+        device_id="device",
+        valid_until=dt.datetime.now(dt.UTC) + dt.timedelta(hours=1),
+        pin="1234",
+    )
+
+
+class RosterApi(ApiImpl):
+    supports_window_control = True
+
+    def __init__(self, listed):
+        super().__init__()
+        self.listed = listed
+        self.listings = 0
+        self.error = None
+
+    def login(self, username, password, pin=None):
+        return _token()
+
+    def get_vehicles(self, token):
+        self.listings += 1
+        if self.error is not None:
+            raise self.error
+        return [Vehicle(**fields) for fields in self.listed]
+
+
+EV = {
+    "id": "v1",
+    "name": "EV6",
+    "VIN": "KNA1",
+    "key": "key-1",
+    "engine_type": ENGINE_TYPES.EV,
+    "ccu_ccs2_protocol_support": 1,
+}
+
+
+def _snapshot(make_manager):
+    manager = make_manager(RosterApi([EV]))
+    manager.login()
+    return json.loads(json.dumps(manager.roster_snapshot()))
+
+
+def test_snapshot_round_trip(monkeypatch, make_manager):
+    roster = _snapshot(make_manager)
+    api = RosterApi([EV])
+
+    manager = make_manager(api, roster=roster)
+
+    vehicle = manager.get_vehicle("v1")
+    assert vehicle.VIN == "KNA1"
+    assert vehicle.key == "key-1"
+    assert vehicle.engine_type is ENGINE_TYPES.EV
+    assert vehicle.ccu_ccs2_protocol_support == 1
+    assert vehicle.supports_window_control is True
+    assert api.listings == 0
+
+
+def test_login_revalidates_in_background(monkeypatch, make_manager):
+    listed = [{**EV, "key": "key-2"}, {"id": "v2", "name": "Niro"}]
+    api = RosterApi(listed)
+    manager = make_manager(api, roster=_snapshot(make_manager))
+    vehicle = manager.get_vehicle("v1")
+    vehicle.enabled = False
+
+    assert manager.login() is True
+    manager.roster_revalidation.result(timeout=5)
+
+    assert api.listings == 1
+    assert manager.get_vehicle("v1") is vehicle
+    assert vehicle.key == "key-2"
+    assert vehicle.enabled is False
+    assert sorted(manager.vehicles) == ["v1", "v2"]
+    manager.check_and_refresh_token()
+    assert api.listings == 1
+
+
+def test_stored_token_revalidates_on_first_check(monkeypatch, make_manager):
+    api = RosterApi([])
+    manager = make_manager(api, roster=_snapshot(make_manager), token=_token())
+
+    assert manager.check_and_refresh_token() is False
+    manager.roster_revalidation.result(timeout=5)
+
+    assert manager.vehicles == {}
+
+
+def test_failed_revalidation_keeps_roster_and_retries(monkeypatch, make_manager):
+    api = RosterApi([EV])
+    api.error = ConnectionError("offline")
+    manager = make_manager(api, roster=_snapshot(make_manager))
+
+    manager.login()
+    with pytest.raises(ConnectionError):
+        manager.roster_revalidation.result(timeout=5)
+    assert list(manager.vehicles) == ["v1"]
+
+    api.error = None
+    manager.check_and_refresh_token()
+    manager.roster_revalidation.result(timeout=5)
+    assert api.listings == 2
+
+
+def test_session_bound_keys_are_relisted_before_login_returns(
+    monkeypatch, make_manager
+):
+    api = RosterApi([{**EV, "key": "session-2"}])
+    api.vehicle_keys_per_session = True
+    manager = make_manager(api, roster=_snapshot(make_manager))
+
+    manager.login()
+
+    assert manager.get_vehicle("v1").key == "session-2"
+
+
+def test_update_fan_out_survives_roster_swap(make_manager):
+    api = RosterApi([EV, {"id": "v2", "name": "Niro"}])
+    manager = make_manager(api)
+    manager.login()
+    updated = []
+
+    def update(token, vehicle):
+        # A background revalidation lands while the batch is running.
+        manager.vehicles = {}
+        updated.append(vehicle.id)
+
+    api.update_vehicle_with_cached_state = update
+
+    result = manager.update_all_vehicles_with_cached_state()
+
+    assert updated == ["v1", "v2"]
+    assert not result.errors
@@ -0,0 +1,172 @@
+"""Vehicle.to_snapshot / Vehicle.from_snapshot round trips.
+
+Run with ``pytest -s`` to see the timings. They are reported, not asserted:
+wall-clock comparisons are flaky on loaded machines.
+"""
+
+import datetime as dt
+import json
+import timeit
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from hyundai_kia_connect_api.ApiImplType1 import ApiImplType1
+from hyundai_kia_connect_api.const import (
+    ENGINE_TYPES,
+    RAW_DATA_RETENTION,
+    SNAPSHOT_ENCODING,
+    PressureUnit,
+)
+from hyundai_kia_connect_api.Vehicle import (
+    SNAPSHOT_VERSION,
+    DailyDrivingStats,
+    DayTripInfo,
+    TripInfo,
+    Vehicle,
+)
+from tests.fixture_helpers import fixture_parsers, load_fixture
+from tests.vehicle_snapshot_serializer import vehicle_to_dict
+
+PARSERS = fixture_parsers()
+
+
+def _parsed(parse, name) -> Vehicle:
+    vehicle = Vehicle()
+    parse(vehicle, load_fixture(name))
+    return vehicle
+
+
+def _without_data(vehicle: Vehicle) -> Vehicle:
+    vehicle.data = None
+    return vehicle
+
+
+@pytest.mark.parametrize("encoding", list(SNAPSHOT_ENCODING))
+@pytest.mark.parametrize(("parse", "name"), PARSERS, ids=[n for _, n in PARSERS])
+def test_fixture_vehicles_round_trip(parse, name, encoding):
+    vehicle = _parsed(parse, name)
+
+    restored = Vehicle.from_snapshot(vehicle.to_snapshot(encoding))
+
+    # The same view the fixture snapshots (test_vehicle_snapshots) assert on.
+    assert vehicle_to_dict(restored) == vehicle_to_dict(vehicle)
+    assert restored == _without_data(vehicle)
+
+
+def test_other_field_types_round_trip():
+    berlin = ZoneInfo("Europe/Berlin")
+    vehicle = Vehicle(
+        id="v1",
+        engine_type=ENGINE_TYPES.PHEV,
+        timezone=berlin,
+        tire_pressure_unit=PressureUnit.BAR,
+        raw_data_retention=RAW_DATA_RETENTION.COMPRESS,
+        ev_first_departure_time=dt.time(7, 30),
+        ev_first_departure_days=[1, 2, 3],
+    )
+    # The property setter converts to local time; keep the zone as given.
+    vehicle._last_updated_at = dt.datetime(2026, 3, 29, 1, 30, tzinfo=berlin)
+    vehicle.location = (52.5, 13.4, dt.datetime(2026, 3, 29, 3, 30))
+    vehicle.daily_stats = [
+        DailyDrivingStats(date=dt.datetime(2026, 3, 28), total_consumed=4200)
+    ]
+    vehicle.day_trip_info = DayTripInfo(
+        yyyymmdd="20260328", trip_list=[TripInfo(hhmmss="081500", distance=12.5)]
+    )
+    vehicle.dtc_descriptions = {"$dt": "not a date", "P0A80": {"$tuple": 1}}
+    vehicle._state_fingerprint = b"\x00\xff fingerprint"
+
+    for encoding in SNAPSHOT_ENCODING:
+        restored = Vehicle.from_snapshot(vehicle.to_snapshot(encoding))
+
+        assert restored == vehicle
+        assert restored.timezone is berlin
+        assert restored.last_updated_at.tzinfo is berlin
+        assert restored.location_last_updated_at.tzinfo is None
+        assert restored.raw_data_retention is RAW_DATA_RETENTION.COMPRESS
+        assert restored.dtc_descriptions == vehicle.dtc_descriptions
+        # Tied to the raw payload, which is not restored either.
+        assert restored._state_fingerprint is None
+
+
+def test_snapshot_leaves_out_defaults_and_raw_data():
+    vehicle = Vehicle(id="v1", fuel_level=40)
+    vehicle.data = {"raw": "payload"}
+
+    document = json.loads(vehicle.to_snapshot())
+
+    assert document == {
+        "version": SNAPSHOT_VERSION,
+        "fields": {"id": "v1", "fuel_level": 40},
+    }
+    assert Vehicle.from_snapshot(json.dumps(document)).data is None
+
+
+def test_unknown_fields_are_ignored():
+    document = {"version": 1, "fields": {"id": "v1", "added_later": 1}}
+
+    assert Vehicle.from_snapshot(json.dumps(document)) == Vehicle(id="v1")
+
+
+def test_newer_versions_are_rejected():
+    binary = Vehicle(id="v1").to_snapshot(SNAPSHOT_ENCODING.BINARY)
+    newer = binary[:4] + bytes((SNAPSHOT_VERSION + 1,)) + binary[5:]
+
+    with pytest.raises(ValueError):
+        Vehicle.from_snapshot(newer)
+    with pytest.raises(ValueError):
+        Vehicle.from_snapshot(json.dumps({"version": 2, "fields": {}}))
+    with pytest.raises(ValueError):
+        Vehicle.from_snapshot(b"not a snapshot")
+
+
+@pytest.mark.parametrize(
+    "snapshot",
+    [
+        b"HKVS",
+        b"HKVS\x01corrupt",
+        "{}",
+        "[]",
+        '{"version": 1}',
+        '{"version": 1, "fields": {"fuel_level": {"$unknown": 1}}}',
+        '{"version": 1, "fields": {"fuel_level": {}}}',
+    ],
+)
+def test_malformed_snapshots_are_rejected(snapshot):
+    with pytest.raises(ValueError):
+        Vehicle.from_snapshot(snapshot)
+
+
+def test_restored_vehicle_applies_the_same_state_again():
+    api = ApiImplType1.__new__(ApiImplType1)
+    api.data_timezone = None
+    state = load_fixture("eu_kia_ev9_2024_ccs2.json")
+    vehicle = Vehicle()
+    api._apply_state(vehicle, state, api._update_vehicle_properties_ccs2)
+
+    restored = Vehicle.from_snapshot(vehicle.to_snapshot())
+
+    assert api._apply_state(restored, state, api._update_vehicle_properties_ccs2)
+    assert restored.data == vehicle.data
+
+
+def test_snapshot_timings():
+    vehicles = [_parsed(parse, name) for parse, name in PARSERS]
+
+    def per_vehicle(run):
+        return min(timeit.repeat(run, number=20, repeat=3)) / 20 / len(vehicles)
+
+    reflection = per_vehicle(
+        lambda: [json.dumps(vehicle_to_dict(vehicle)) for vehicle in vehicles]
+    )
+    to_json = per_vehicle(lambda: [vehicle.to_snapshot() for vehicle in vehicles])
+    snapshots = [vehicle.to_snapshot(SNAPSHOT_ENCODING.BINARY) for vehicle in vehicles]
+    restore = per_vehicle(lambda: [Vehicle.from_snapshot(s) for s in snapshots])
+
+    print(
+        f"\nper vehicle: reflection {reflection * 1e6:.0f} us, "
+        f"to_snapshot {to_json * 1e6:.0f} us, "
+        f"from_snapshot (binary) {restore * 1e6:.0f} us, "
+        f"binary size {sum(map(len, snapshots)) / len(snapshots):.0f} bytes"
+    )
@@ -9,6 +9,7 @@ vehicle list can change).
 
 import datetime as dt
 import json
+import threading
 from unittest.mock import MagicMock, patch
 
 from hyundai_kia_connect_api.HyundaiBlueLinkApiUSA import HyundaiBlueLinkApiUSA
@@ -46,6 +47,7 @@ def _make_api(response_text=None):
     api = object.__new__(HyundaiBlueLinkApiUSA)
     api.API_URL = "https://api.telematics.hyundaiusa.com/ac/v2/"
     api.session = MagicMock()
+    api._enrollment_lock = threading.Lock()
     api.data_timezone = dt.UTC
     if response_text is not None:
         api.session.get = MagicMock(return_value=_FakeResponse(text=response_text))
@@ -103,3 +105,81 @@ class TestEnrollmentCache:
         # Only one session.get call (from get_vehicles); _get_vehicle_details
         # was a cache hit
         assert api.session.get.call_count == 1
+
+    def test_stale_cache_is_served_and_refreshed_in_background(self):
+        """Past the TTL a poll returns the cached copy and refreshes it."""
+        api = _make_api()
+        api.session.get = MagicMock(
+            side_effect=[
+                _FakeResponse(text=json.dumps(_enrollment_body(nick="Old"))),
+                _FakeResponse(text=json.dumps(_enrollment_body(nick="New"))),
+            ]
+        )
+        token = MagicMock()
+        with patch.object(api, "_get_authenticated_headers", return_value={}):
+            api._get_vehicle_details(token, _make_vehicle())
+            api._enrollment_fetched_at -= api.enrollment_ttl + 1
+            details = api._get_vehicle_details(token, _make_vehicle())
+            api._enrollment_refresh.join(timeout=5)
+            refreshed = api._get_vehicle_details(token, _make_vehicle())
+        assert details["nickName"] == "Old"
+        assert refreshed["nickName"] == "New"
+        assert api.session.get.call_count == 2
+
+    def test_failed_background_refresh_keeps_cache(self):
+        api = _make_api()
+        api.session.get = MagicMock(
+            side_effect=[
+                _FakeResponse(text=json.dumps(_enrollment_body())),
+                ConnectionError("offline"),
+            ]
+        )
+        token = MagicMock()
+        with patch.object(api, "_get_authenticated_headers", return_value={}):
+            api._get_vehicle_details(token, _make_vehicle())
+            api._enrollment_fetched_at -= api.enrollment_ttl + 1
+            api._get_vehicle_details(token, _make_vehicle())
+            api._enrollment_refresh.join(timeout=5)
+            details = api._get_vehicle_details(token, _make_vehicle())
+        assert details["regid"] == "rid1"
+
+    def test_invalidate_drops_cache_and_in_flight_fetch(self):
+        """A fetch that started before an auth change is not stored."""
+        body = json.dumps(_enrollment_body())
+        api = _make_api()
+
+        def get(*args, **kwargs):
+            api.invalidate_enrollment_details()
+            return _FakeResponse(text=body)
+
+        api.session.get = MagicMock(side_effect=get)
+        with patch.object(api, "_get_authenticated_headers", return_value={}):
+            api._get_vehicle_details(MagicMock(), _make_vehicle())
+        assert api._enrollment_details_cache is None
+
+    def test_each_instance_has_its_own_lock(self):
+        first = HyundaiBlueLinkApiUSA(region=3, brand=2, language="en")
+        second = HyundaiBlueLinkApiUSA(region=3, brand=2, language="en")
+        assert first._enrollment_lock is not second._enrollment_lock
+
+    def test_successful_refresh_keeps_cache(self):
+        api = _make_api(response_text=json.dumps(_enrollment_body()))
+        api.LOGIN_API = "https://api.telematics.hyundaiusa.com/v2/ac/"
+        api.API_HEADERS = {}
+        api.session.post = MagicMock(
+            return_value=_FakeResponse(
+                text=json.dumps(
+                    {
+                        "access_token": "new",
+                        "refresh_token": "rotated",
+                        "expires_in": "1800",
+                    }
+                )
+            )
+        )
+        token = MagicMock(refresh_token="refresh")
+        with patch.object(api, "_get_authenticated_headers", return_value={}):
+            api._get_vehicle_details(token, _make_vehicle())
+            refreshed = api.refresh_access_token(token)
+        assert refreshed.access_token == "new"
+        assert api._enrollment_details_cache is not None
@@ -7,6 +7,7 @@ misclassifying PHEVs as unknown/ICE).
 
 import datetime as dt
 import json
+import threading
 from unittest.mock import MagicMock, patch
 
 from hyundai_kia_connect_api.const import ENGINE_TYPES
@@ -25,6 +26,7 @@ def _make_api():
     api = object.__new__(HyundaiBlueLinkApiUSA)
     api.API_URL = "https://api.telematics.hyundaiusa.com/ac/v2/"
     api.session = MagicMock()
+    api._enrollment_lock = threading.Lock()
     api.data_timezone = dt.UTC
     return api
 
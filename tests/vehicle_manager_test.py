@@ -1,8 +1,15 @@
 import datetime as dt
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
 
 from hyundai_kia_connect_api.ApiImpl import ApiImpl
+from hyundai_kia_connect_api.exceptions import APIError
 from hyundai_kia_connect_api.Token import Token
-from hyundai_kia_connect_api.VehicleManager import VehicleManager
+from hyundai_kia_connect_api.Vehicle import Vehicle
+from hyundai_kia_connect_api.VehicleManager import VehicleUpdateResult
 
 
 class DummyApi(ApiImpl):
@@ -25,21 +32,173 @@ class DummyApi(ApiImpl):
         return vehicles
 
 
-def test_check_and_refresh_token_handles_min_datetime(monkeypatch):
+def test_check_and_refresh_token_handles_min_datetime(make_manager):
     dummy_api = DummyApi()
-    monkeypatch.setattr(
-        VehicleManager,
-        "get_implementation_by_region_brand",
-        lambda *args, **kwargs: dummy_api,
+    manager = make_manager(dummy_api, region=3, geocode_api_enable=False)
+    manager.token = Token(valid_until=dt.datetime.min)
+    assert manager.check_and_refresh_token() is True
+    assert dummy_api.login_calls == 1
+
+
+class FleetApi(DummyApi):
+    def __init__(self, failing=()):
+        super().__init__()
+        self.failing = set(failing)
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.tokens = []
+
+    def update_vehicle_with_cached_state(self, token, vehicle):
+        with self.lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            self.tokens.append(token)
+        try:
+            time.sleep(0.05)
+            if vehicle.id in self.failing:
+                raise APIError(f"boom {vehicle.id}")
+        finally:
+            with self.lock:
+                self.in_flight -= 1
+
+
+def _fleet_manager(make_manager, api, vehicle_count, **kwargs):
+    return make_manager(
+        api,
+        vehicles=[Vehicle(id=f"v{index}") for index in range(vehicle_count)],
+        token=Token(valid_until=dt.datetime.now(dt.UTC) + dt.timedelta(hours=1)),
+        **kwargs,
     )
-    manager = VehicleManager(
-        region=3,
-        brand=1,
-        username="user",
-        password="pass",
-        pin="1234",
-        geocode_api_enable=False,
+
+
+def test_parallel_update_is_bounded_and_collects_errors(make_manager):
+    api = FleetApi(failing={"v1", "v4"})
+    manager = _fleet_manager(make_manager, api, 6, max_concurrent_updates=3)
+
+    result = manager.update_all_vehicles_with_cached_state()
+
+    assert isinstance(result, VehicleUpdateResult)
+    assert sorted(result.updated) == ["v0", "v2", "v3", "v5"]
+    assert sorted(result.errors) == ["v1", "v4"]
+    assert isinstance(result.errors["v1"], APIError)
+    assert not result.ok
+    assert 1 < api.max_in_flight <= 3
+    assert all(token is manager.token for token in api.tokens)
+    with pytest.raises(APIError):
+        result.raise_for_errors()
+
+
+def test_sequential_update_stops_on_first_error(make_manager):
+    api = FleetApi(failing={"v1"})
+    manager = _fleet_manager(make_manager, api, 3)
+
+    with pytest.raises(APIError):
+        manager.update_all_vehicles_with_cached_state()
+    assert api.max_in_flight == 1
+    assert len(api.tokens) == 2
+
+
+def test_parallel_check_and_force_update_uses_per_vehicle_path(make_manager):
+    api = FleetApi()
+    api.force_refresh_vehicle_state = MagicMock()
+    manager = _fleet_manager(make_manager, api, 4, max_concurrent_updates=4)
+    stale = dt.datetime.now(dt.UTC) - dt.timedelta(hours=2)
+    manager.vehicles["v0"].last_updated_at = stale
+    manager.vehicles["v2"].last_updated_at = stale
+
+    result = manager.check_and_force_update_vehicles(force_refresh_interval=3600)
+
+    assert result.ok
+    assert sorted(result.updated) == ["v0", "v1", "v2", "v3"]
+    forced = sorted(
+        c.args[1].id for c in api.force_refresh_vehicle_state.call_args_list
     )
+    assert forced == ["v0", "v2"]
+    assert len(api.tokens) == 2
+
+
+class SlowRefreshApi(DummyApi):
+    def __init__(self, error=None):
+        super().__init__()
+        self.release = threading.Event()
+        self.refresh_calls = 0
+        self.error = error
+
+    def refresh_access_token(self, token, **kwargs):
+        self.refresh_calls += 1
+        self.release.wait(5)
+        if self.error is not None:
+            raise self.error
+        return Token(
+            pin="1234",
+            valid_until=dt.datetime.now(dt.UTC) + dt.timedelta(hours=1),
+        )
+
+
+def _refresh_concurrently(manager, api, callers):
+    outcomes = []
+
+    def call():
+        try:
+            outcomes.append(manager.check_and_refresh_token())
+        except Exception as err:
+            outcomes.append(err)
+
+    threads = [threading.Thread(target=call) for _ in range(callers)]
+    for thread in threads:
+        thread.start()
+    deadline = time.monotonic() + 5
+    while manager.token_refresh_coalesced < callers - 1:
+        assert time.monotonic() < deadline
+        time.sleep(0.001)
+    api.release.set()
+    for thread in threads:
+        thread.join()
+    return outcomes
+
+
+def test_concurrent_token_refresh_is_single_flight(make_manager):
+    api = SlowRefreshApi()
+    manager = _fleet_manager(make_manager, api, 1)
     manager.token = Token(valid_until=dt.datetime.min)
+
+    outcomes = _refresh_concurrently(manager, api, 5)
+
+    assert outcomes == [True] * 5
+    assert api.refresh_calls == 1
+    assert manager.token_refresh_count == 1
+    assert manager.token_refresh_coalesced == 4
+    assert manager.token.valid_until > dt.datetime.now(dt.UTC)
+    # The next expiry starts a new refresh.
+    manager.token.valid_until = dt.datetime.min
+    api.release.set()
     assert manager.check_and_refresh_token() is True
-    assert dummy_api.login_calls == 1
+    assert api.refresh_calls == 2
+
+
+def test_concurrent_token_refresh_shares_failure(make_manager):
+    api = SlowRefreshApi(error=APIError("refresh failed"))
+    manager = _fleet_manager(make_manager, api, 1)
+    manager.token = Token(valid_until=dt.datetime.min)
+
+    outcomes = _refresh_concurrently(manager, api, 3)
+
+    assert api.refresh_calls == 1
+    assert all(isinstance(outcome, APIError) for outcome in outcomes)
+
+
+def test_close_stops_background_work(make_manager):
+    manager = make_manager(MagicMock())
+    renewer = manager.token_renewer = MagicMock()
+    scheduler = manager.force_refresh_scheduler = MagicMock()
+    tracker = manager.action_tracker = MagicMock()
+
+    with manager:
+        pass
+
+    renewer.stop.assert_called_once()
+    scheduler.shutdown.assert_called_once()
+    tracker.shutdown.assert_called_once()
+    manager.api.close.assert_called_once()
+    assert manager.force_refresh_scheduler is None
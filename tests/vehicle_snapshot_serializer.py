@@ -8,6 +8,10 @@ is deterministic and human-readable.
 import dataclasses
 import datetime
 
+# The raw data blob is the fixture input, not parsed output; how it is kept is
+# configuration.
+NOT_PARSED = {"data", "raw_data_retention"}
+
 
 def vehicle_to_dict(vehicle) -> dict:
     """Return a sorted dict of all public Vehicle fields suitable for snapshotting.
@@ -35,8 +39,7 @@ def vehicle_to_dict(vehicle) -> dict:
             backed_private.add(backing)
 
     for name in field_names:
-        # Skip the raw data blob — it's the fixture input, not parsed output
-        if name == "data":
+        if name in NOT_PARSED:
             continue
         # Skip private backing fields that have a property
         if name in backed_private:
@@ -48,7 +51,7 @@ def vehicle_to_dict(vehicle) -> dict:
         result[name] = _serialize_value(getattr(vehicle, name))
 
     # Add property values
-    for prop in sorted(property_names):
+    for prop in sorted(property_names - NOT_PARSED):
         result[prop] = _serialize_value(getattr(vehicle, prop))
 
     return dict(sorted(result.items()))